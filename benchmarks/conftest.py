@@ -0,0 +1,26 @@
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from benchmarks.models import Base
+from polyfactory.factories.base import BaseFactory
+
+
+@pytest.fixture(autouse=True)
+def _seed() -> None:
+    """Seed the shared random instances so that every run generates the same data."""
+    BaseFactory.seed_random(0)
+
+
+@pytest.fixture()
+def session() -> Iterator[Session]:
+    """Create a session bound to an in-memory SQLite database."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    try:
+        with Session(engine) as session:
+            yield session
+    finally:
+        engine.dispose()
@@ -0,0 +1,276 @@
+"""Models of every supported library, in the shapes used by the benchmarks.
+
+Shapes:
+
+- flat: a handful of primitive fields.
+- wide: 50 fields of mixed types.
+- nested: three levels of nested models, with collections of models.
+- recursive: a self referencing model.
+- constrained: constrained numbers, strings and collections.
+- mixed: fields which a columnar batch draws in bulk alongside fields it generates one value at a time.
+"""
+
+import sys
+from dataclasses import dataclass, make_dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import cycle, islice
+from typing import Annotated, Any, Callable, Literal, Optional
+from uuid import UUID
+
+import attrs
+import msgspec
+from annotated_types import Ge, Gt, Le, Lt, MaxLen, MinLen, MultipleOf
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, Numeric, String, orm
+from sqlalchemy.orm.decl_api import DeclarativeMeta, registry
+from typing_extensions import TypedDict
+
+import pydantic
+
+WIDE_FIELD_COUNT = 50
+
+FLAT_FIELDS: dict[str, Any] = {
+    "id": int,
+    "name": str,
+    "score": float,
+    "active": bool,
+    "created_at": datetime,
+    "uuid": UUID,
+}
+
+WIDE_FIELDS: dict[str, Any] = {
+    f"field_{index}": annotation
+    for index, annotation in enumerate(
+        islice(
+            cycle((int, str, float, bool, datetime, UUID, Decimal, date, list[int], Optional[str])),
+            WIDE_FIELD_COUNT,
+        )
+    )
+}
+
+CONSTRAINED_FIELDS: dict[str, Any] = {
+    "quantity": Annotated[int, Ge(0), Le(1000), MultipleOf(7)],
+    "ratio": Annotated[float, Gt(0), Lt(1)],
+    "price": Annotated[Decimal, Ge(0), Le(10_000)],
+    "code": Annotated[str, MinLen(5), MaxLen(20)],
+    "tags": Annotated[list[str], MinLen(1), MaxLen(5)],
+}
+
+MIXED_FIELDS: dict[str, Any] = {
+    "active": bool,
+    "status": Literal["draft", "published", "archived"],
+    "quantity": Annotated[int, Ge(0), Le(1000)],
+    "ratio": Annotated[float, Ge(0), Le(1)],
+    "name": str,
+    "uuid": UUID,
+    "created_at": datetime,
+    "note": Optional[str],
+}
+
+PATTERN = r"^[A-Z]{3}-\d{4}$"
+
+ModelBuilder = Callable[[str, "dict[str, Any]"], Any]
+
+
+def make_dataclass_model(name: str, fields: dict[str, Any]) -> Any:
+    model = make_dataclass(name, list(fields.items()))
+    # the type hints of the model are resolved in the namespace of its module
+    model.__module__ = __name__
+    return model
+
+
+def make_typed_dict(name: str, fields: dict[str, Any]) -> Any:
+    return TypedDict(name, fields)  # type: ignore[operator]
+
+
+def make_pydantic_model(name: str, fields: dict[str, Any]) -> Any:
+    return pydantic.create_model(name, **{field_name: (annotation, ...) for field_name, annotation in fields.items()})
+
+
+def make_msgspec_struct(name: str, fields: dict[str, Any]) -> Any:
+    return msgspec.defstruct(name, list(fields.items()))
+
+
+def make_attrs_class(name: str, fields: dict[str, Any]) -> Any:
+    return attrs.make_class(
+        name, {field_name: attrs.field(type=annotation) for field_name, annotation in fields.items()}
+    )
+
+
+def make_models(make_model: ModelBuilder, constrained_fields: dict[str, Any] = CONSTRAINED_FIELDS) -> dict[str, Any]:
+    """Create the flat, wide, nested and constrained models with the given model builder.
+
+    :param make_model: A callable creating a model from a name and a mapping of field names to annotations.
+    :param constrained_fields: The fields of the constrained model.
+
+    :returns: A mapping of shapes to models.
+    """
+    leaf = make_model("Leaf", FLAT_FIELDS)
+    branch = make_model("Branch", {"name": str, "leaf": leaf, "leaves": list[leaf]})
+    trunk = make_model("Trunk", {"name": str, "branch": branch, "branches": list[branch]})
+
+    return {
+        "flat": make_model("Flat", FLAT_FIELDS),
+        "wide": make_model("Wide", WIDE_FIELDS),
+        "nested": make_model("Root", {"id": int, "trunk": trunk, "trunks": list[trunk]}),
+        "constrained": make_model("Constrained", constrained_fields),
+    }
+
+
+# recursive models are declared explicitly, since their forward references are resolved in the module namespace
+
+
+@dataclass
+class DataclassNode:
+    value: int
+    children: list["DataclassNode"]
+    parent: Optional["DataclassNode"] = None
+
+
+class TypedDictNode(TypedDict):
+    value: int
+    children: list["TypedDictNode"]
+    parent: Optional["TypedDictNode"]
+
+
+class PydanticNode(pydantic.BaseModel):
+    value: int
+    children: list["PydanticNode"]
+    parent: Optional["PydanticNode"] = None
+
+
+class MsgspecNode(msgspec.Struct):
+    value: int
+    children: list["MsgspecNode"]
+    parent: Optional["MsgspecNode"] = None
+
+
+@attrs.define
+class AttrsNode:
+    value: int
+    children: list["AttrsNode"]
+    parent: Optional["AttrsNode"] = None
+
+
+# SQLAlchemy
+
+_registry = registry()
+
+
+class Base(metaclass=DeclarativeMeta):
+    __abstract__ = True
+    __allow_unmapped__ = True
+
+    registry = _registry
+    metadata = _registry.metadata
+
+
+class FlatRecord(Base):
+    __tablename__ = "flat_records"
+
+    id: Any = Column(Integer(), primary_key=True)
+    name: Any = Column(String(), nullable=False)
+    score: Any = Column(Float(), nullable=False)
+    active: Any = Column(Boolean(), nullable=False)
+    created_at: Any = Column(DateTime(), nullable=False)
+
+
+WideRecord: Any = type(
+    "WideRecord",
+    (Base,),
+    {
+        "__tablename__": "wide_records",
+        "id": Column(Integer(), primary_key=True),
+        **{
+            f"field_{index}": Column(column_type(), nullable=False)
+            for index, column_type in enumerate(
+                islice(cycle((Integer, String, Float, Boolean, DateTime)), WIDE_FIELD_COUNT)
+            )
+        },
+    },
+)
+
+
+class ParentRecord(Base):
+    __tablename__ = "parent_records"
+
+    id: Any = Column(Integer(), primary_key=True)
+    name: Any = Column(String(), nullable=False)
+    children: Any = orm.relationship("ChildRecord", collection_class=list, uselist=True)
+
+
+class ChildRecord(Base):
+    __tablename__ = "child_records"
+
+    id: Any = Column(Integer(), primary_key=True)
+    name: Any = Column(String(), nullable=False)
+    parent_id: Any = Column(Integer(), ForeignKey(ParentRecord.id), nullable=False)
+
+
+class ConstrainedRecord(Base):
+    __tablename__ = "constrained_records"
+
+    id: Any = Column(Integer(), primary_key=True)
+    code: Any = Column(String(20), nullable=False)
+    price: Any = Column(Numeric(10, 2), nullable=False)
+
+
+DATACLASS_MODELS = {**make_models(make_dataclass_model), "recursive": DataclassNode}
+TYPED_DICT_MODELS = {**make_models(make_typed_dict), "recursive": TypedDictNode}
+PYDANTIC_MODELS = {
+    **make_models(
+        make_pydantic_model,
+        {**CONSTRAINED_FIELDS, "reference": Annotated[str, pydantic.Field(pattern=PATTERN)]},
+    ),
+    "recursive": PydanticNode,
+}
+MSGSPEC_MODELS = {
+    **make_models(
+        make_msgspec_struct,
+        {**CONSTRAINED_FIELDS, "reference": Annotated[str, msgspec.Meta(pattern=PATTERN)]},
+    ),
+    "recursive": MsgspecNode,
+}
+ATTRS_MODELS = {**make_models(make_attrs_class), "recursive": AttrsNode}
+COLUMNAR_MODELS = {
+    "flat": DATACLASS_MODELS["flat"],
+    "wide": DATACLASS_MODELS["wide"],
+    "constrained": DATACLASS_MODELS["constrained"],
+    "mixed": make_dataclass_model("Mixed", MIXED_FIELDS),
+}
+"""Dataclass models of the columnar batch benchmarks, from fully eligible for bulk generation to mostly ineligible."""
+SQLALCHEMY_MODELS = {
+    "flat": FlatRecord,
+    "wide": WideRecord,
+    "nested": ParentRecord,
+    "constrained": ConstrainedRecord,
+}
+
+PYDANTIC_V1_MODELS: dict[str, Any] = {}
+if sys.version_info < (3, 14):
+    # pydantic v1 does not support Python 3.14
+    from pydantic import v1 as pydantic_v1
+
+    class PydanticV1Node(pydantic_v1.BaseModel):
+        value: int
+        children: "list[PydanticV1Node]"
+        parent: "Optional[PydanticV1Node]" = None
+
+    PydanticV1Node.update_forward_refs()
+
+    PYDANTIC_V1_MODELS = {
+        **make_models(
+            lambda name, fields: pydantic_v1.create_model(
+                name, **{field_name: (annotation, ...) for field_name, annotation in fields.items()}
+            ),
+            {
+                "quantity": pydantic_v1.conint(ge=0, le=1000, multiple_of=7),
+                "ratio": pydantic_v1.confloat(gt=0, lt=1),
+                "price": pydantic_v1.condecimal(ge=0, le=10_000),
+                "code": pydantic_v1.constr(min_length=5, max_length=20),
+                "tags": pydantic_v1.conlist(str, min_items=1, max_items=5),
+                "reference": pydantic_v1.constr(regex=PATTERN),
+            },
+        ),
+        "recursive": PydanticV1Node,
+    }
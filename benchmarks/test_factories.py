@@ -0,0 +1,94 @@
+"""Benchmarks of the generation modes of every backend factory.
+
+Run with ``make benchmark`` to save the results as a JSON baseline, and with ``make benchmark-compare`` to compare a
+change against the latest baseline.
+"""
+
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.models import (
+    ATTRS_MODELS,
+    COLUMNAR_MODELS,
+    DATACLASS_MODELS,
+    MSGSPEC_MODELS,
+    PYDANTIC_MODELS,
+    PYDANTIC_V1_MODELS,
+    SQLALCHEMY_MODELS,
+    TYPED_DICT_MODELS,
+)
+from polyfactory.factories import DataclassFactory, TypedDictFactory
+from polyfactory.factories.attrs_factory import AttrsFactory
+from polyfactory.factories.base import BaseFactory
+from polyfactory.factories.msgspec_factory import MsgspecFactory
+from polyfactory.factories.pydantic_factory import ModelFactory
+from polyfactory.factories.sqlalchemy_factory import SQLAlchemyFactory
+
+BATCH_SIZE = 100
+COLUMNAR_BATCH_SIZE = 10_000
+"""The size of the batches comparing columnar and row by row generation, which only differ on large batches."""
+
+BACKENDS: dict[str, tuple[type[BaseFactory[Any]], dict[str, Any]]] = {
+    "dataclass": (DataclassFactory, DATACLASS_MODELS),
+    "typed_dict": (TypedDictFactory, TYPED_DICT_MODELS),
+    "pydantic": (ModelFactory, PYDANTIC_MODELS),
+    "pydantic_v1": (ModelFactory, PYDANTIC_V1_MODELS),
+    "msgspec": (MsgspecFactory, MSGSPEC_MODELS),
+    "attrs": (AttrsFactory, ATTRS_MODELS),
+    "sqlalchemy": (SQLAlchemyFactory, SQLALCHEMY_MODELS),
+}
+
+CASES = [
+    pytest.param((base_factory, model), id=f"{backend}-{shape}")
+    for backend, (base_factory, models) in BACKENDS.items()
+    for shape, model in models.items()
+]
+
+# coverage does not support recursive models
+COVERAGE_CASES = [case for case in CASES if not str(case.id).endswith("-recursive")]
+
+
+@pytest.fixture()
+def factory(request: pytest.FixtureRequest) -> type[BaseFactory[Any]]:
+    base_factory, model = request.param
+    factory = base_factory.create_factory(model)
+    # build once, so that the benchmarks measure the steady state rather than the compilation of the build plan
+    factory.build()
+    return factory
+
+
+@pytest.mark.parametrize("factory", CASES, indirect=True)
+def test_build(benchmark: BenchmarkFixture, factory: type[BaseFactory[Any]]) -> None:
+    benchmark(factory.build)
+
+
+@pytest.mark.parametrize("factory", CASES, indirect=True)
+def test_batch(benchmark: BenchmarkFixture, factory: type[BaseFactory[Any]]) -> None:
+    benchmark(factory.batch, BATCH_SIZE)
+
+
+@pytest.mark.parametrize("factory", CASES, indirect=True)
+def test_prototype_batch(benchmark: BenchmarkFixture, factory: type[BaseFactory[Any]]) -> None:
+    prototype = factory.prototype(vary=[factory.get_model_fields()[0].name])
+    benchmark(prototype.batch, BATCH_SIZE)
+
+
+@pytest.mark.parametrize("factory", COVERAGE_CASES, indirect=True)
+def test_coverage(benchmark: BenchmarkFixture, factory: type[BaseFactory[Any]]) -> None:
+    benchmark(lambda: list(factory.coverage()))
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_create_factory(benchmark: BenchmarkFixture, case: tuple[type[BaseFactory[Any]], Any]) -> None:
+    base_factory, model = case
+    benchmark(base_factory.create_factory, model)
+
+
+@pytest.mark.parametrize("mode", ("rows", "columnar"))
+@pytest.mark.parametrize("shape", list(COLUMNAR_MODELS))
+def test_columnar_batch(benchmark: BenchmarkFixture, shape: str, mode: str) -> None:
+    factory = DataclassFactory.create_factory(COLUMNAR_MODELS[shape], __columnar_batch__=mode == "columnar")
+    factory.build()
+    benchmark.pedantic(factory.batch, args=(COLUMNAR_BATCH_SIZE,), rounds=3, warmup_rounds=1)
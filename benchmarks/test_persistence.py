@@ -0,0 +1,33 @@
+"""Benchmarks of the persistence of the generated instances."""
+
+from typing import Any
+
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy.orm import Session
+
+from benchmarks.models import FlatRecord, ParentRecord
+from polyfactory.factories.sqlalchemy_factory import SQLAlchemyFactory
+
+BATCH_SIZE = 100
+
+
+class FlatRecordFactory(SQLAlchemyFactory[FlatRecord]):
+    __set_primary_key__ = False
+
+
+class ParentRecordFactory(SQLAlchemyFactory[ParentRecord]):
+    __set_primary_key__ = False
+    __set_relationships__ = True
+    __set_foreign_keys__ = False
+
+
+def test_create_batch_sync(benchmark: BenchmarkFixture, session: Session) -> None:
+    factory: Any = FlatRecordFactory.create_factory(__session__=session)
+
+    benchmark(factory.create_batch_sync, BATCH_SIZE)
+
+
+def test_create_batch_sync_with_relationships(benchmark: BenchmarkFixture, session: Session) -> None:
+    factory: Any = ParentRecordFactory.create_factory(__session__=session)
+
+    benchmark(factory.create_batch_sync, BATCH_SIZE)
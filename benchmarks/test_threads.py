@@ -0,0 +1,45 @@
+"""Benchmarks of 'batch' scaling with the number of threads.
+
+Every thread builds the same number of instances, so on a free-threaded interpreter (e.g. python3.13t) the time of a
+round should stay close to constant as threads are added, up to the number of available cores. With the GIL enabled
+it grows linearly. The throughput and whether the GIL is enabled are stored in the 'extra_info' of the results.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.models import DATACLASS_MODELS
+from polyfactory.factories import DataclassFactory
+from polyfactory.factories.base import BaseFactory
+
+BATCH_SIZE = 1000
+"""The number of instances built by each thread in a round."""
+
+
+@pytest.fixture(scope="module")
+def factory() -> type[BaseFactory[Any]]:
+    factory = DataclassFactory.create_factory(DATACLASS_MODELS["flat"], __thread_local_random__=True, __random_seed__=1)
+    factory.build()
+    return factory
+
+
+@pytest.mark.parametrize("threads", (1, 2, 4, 8))
+def test_batch_threads(benchmark: BenchmarkFixture, factory: type[BaseFactory[Any]], threads: int) -> None:
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        # start the threads before measuring
+        list(executor.map(factory.batch, [1] * threads))
+
+        def run() -> None:
+            for future in [executor.submit(factory.batch, BATCH_SIZE) for _ in range(threads)]:
+                future.result()
+
+        benchmark.pedantic(run, rounds=5, warmup_rounds=1)
+
+    benchmark.extra_info["gil_enabled"] = getattr(sys, "_is_gil_enabled", lambda: True)()
+    # the stats are not collected with --benchmark-disable
+    if benchmark.stats is not None:
+        benchmark.extra_info["instances_per_second"] = BATCH_SIZE * threads / benchmark.stats.stats.median
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Literal
+
+from polyfactory.factories import DataclassFactory
+
+
+class Species(str, Enum):
+    CAT = "Cat"
+    DOG = "Dog"
+
+
+@dataclass
+class Pet:
+    name: str
+    species: Species
+    size: Literal["small", "medium", "large"]
+    vaccinated: bool
+
+
+class PetFactory(DataclassFactory[Pet]):
+    __columnar_batch__ = True
+
+
+def test_columnar_batch() -> None:
+    pets = PetFactory.batch(1000)
+
+    assert len(pets) == 1000
+    assert {pet.species for pet in pets} == {Species.CAT, Species.DOG}
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Annotated
+
+from annotated_types import Ge, Le, MultipleOf
+
+from polyfactory.factories import DataclassFactory
+
+
+@dataclass
+class Reading:
+    sensor_id: int
+    value: Annotated[int, Ge(0), Le(1000), MultipleOf(10)]
+    healthy: bool
+
+
+class ReadingFactory(DataclassFactory[Reading]):
+    __random_backend__ = "numpy"
+
+
+def test_numpy_random_backend() -> None:
+    readings = ReadingFactory.batch(10_000)
+
+    assert all(0 <= reading.value <= 1000 and reading.value % 10 == 0 for reading in readings)
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from polyfactory.factories import DataclassFactory
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+
+
+class PersonFactory(DataclassFactory[Person]):
+    __random_seed__ = 1
+
+
+def test_random_access() -> None:
+    # the instance at index 1000 is built without building the instances before it
+    person = PersonFactory.build_at(1000)
+    assert PersonFactory.build_at(1000) == person
+
+    # instances of a lazy batch are only built when accessed
+    people = PersonFactory.lazy_batch(1_000_000)
+    assert len(people) == 1_000_000
+    assert people[1000] == person
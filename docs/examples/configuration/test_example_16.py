@@ -0,0 +1,30 @@
+import asyncio
+from dataclasses import dataclass
+
+from polyfactory.factories import DataclassFactory
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+
+
+class PersonFactory(DataclassFactory[Person]): ...
+
+
+async def create_people(seed: int) -> list[Person]:
+    with PersonFactory.random_scope(seed):
+        people = []
+        for _ in range(3):
+            people.append(PersonFactory.build())
+            await asyncio.sleep(0)
+        return people
+
+
+async def test_random_scope() -> None:
+    # each task draws values from its own stream, regardless of how the tasks interleave
+    first, second = await asyncio.gather(create_people(1), create_people(2))
+
+    assert await create_people(1) == first
+    assert await create_people(2) == second
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from polyfactory.factories import DataclassFactory, validate_all_factories
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+
+
+@dataclass
+class Pet:
+    name: str
+
+
+class PersonFactory(DataclassFactory[Person]):
+    __lazy_init__ = True
+
+
+class PetFactory(DataclassFactory[Pet]):
+    __lazy_init__ = True
+
+
+def test_lazy_init() -> None:
+    # the factory is initialized, and its configuration checked, on its first use
+    assert isinstance(PersonFactory.build(), Person)
+
+    # or up front, along with all the other factories which were not used yet
+    validate_all_factories()
@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from polyfactory import SyncPersistenceProtocol
+from polyfactory.factories import DataclassFactory
+
+
+@dataclass
+class Person:
+    id: UUID
+    name: str
+
+
+class SyncPersistenceHandler(SyncPersistenceProtocol[Person]):
+    def __init__(self) -> None:
+        self.transactions: list[list[Person]] = []
+
+    def save(self, data: Person) -> Person:
+        self.transactions.append([data])
+        return data
+
+    def save_many(self, data: list[Person]) -> list[Person]:
+        # with a chunk size, this is called once per chunk: commit each call in its own transaction
+        self.transactions.append(data)
+        return data
+
+
+class PersonFactory(DataclassFactory[Person]):
+    __sync_persistence__ = SyncPersistenceHandler()
+
+
+def test_chunked_persistence() -> None:
+    progress: list[str] = []
+
+    people = PersonFactory.create_batch_sync(
+        1000,
+        chunk_size=100,
+        on_progress=lambda persisted, total: progress.append(f"{persisted}/{total}"),
+    )
+
+    assert len(people) == 1000
+    assert len(PersonFactory.__sync_persistence__.transactions) == 10
+    assert progress[0] == "100/1000"
+    assert progress[-1] == "1000/1000"
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import UUID
+
+from polyfactory.factories import DataclassFactory
+from polyfactory.snapshot_cache import SnapshotCache
+
+
+@dataclass
+class Person:
+    id: UUID
+    name: str
+    email: str
+
+
+class PersonFactory(DataclassFactory[Person]):
+    __random_seed__ = 1
+
+
+def test_cached_batch(tmp_path: Path) -> None:
+    # by default, the cache is stored in '.polyfactory_cache', or in the directory set by POLYFACTORY_CACHE_DIR
+    cache = SnapshotCache(tmp_path, max_size=64 * 1024 * 1024)
+
+    # the first call generates the values and stores them in the cache
+    people = PersonFactory.cached_batch(1000, cache=cache)
+
+    # later calls, including in later runs, load the values instead of generating them again
+    assert PersonFactory.cached_batch(1000, cache=cache) == people
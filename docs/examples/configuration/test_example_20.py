@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Annotated
+
+import pytest
+from annotated_types import Ge, Le
+
+from polyfactory.exceptions import UniqueValuesExhaustedException
+from polyfactory.factories import DataclassFactory
+
+
+class Plan(Enum):
+    FREE = "free"
+    PRO = "pro"
+
+
+@dataclass
+class Account:
+    email: str
+    tenant_id: int
+    slug: Annotated[int, Ge(1), Le(100)]
+    plan: Plan
+
+
+class AccountFactory(DataclassFactory[Account]):
+    __unique__ = ["email", ("tenant_id", "slug")]
+
+
+def test_unique_fields() -> None:
+    accounts = AccountFactory.batch(100, tenant_id=1)
+
+    assert len({account.email for account in accounts}) == 100
+    # the slugs are drawn without replacement, since they have a small finite domain
+    assert sorted(account.slug for account in accounts) == list(range(1, 101))
+
+    # there are only 100 slugs for a given tenant
+    with pytest.raises(UniqueValuesExhaustedException):
+        AccountFactory.batch(101, tenant_id=1)
+
+
+def test_unique_scope() -> None:
+    class PlanFactory(DataclassFactory[Account]):
+        __unique__ = ["plan"]
+
+    # the values are unique across all the builds within the scope
+    with PlanFactory.unique_scope():
+        plans = {PlanFactory.build().plan, PlanFactory.build().plan}
+
+    assert plans == set(Plan)
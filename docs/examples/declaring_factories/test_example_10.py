@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from polyfactory.factories import DataclassFactory
+
+
+@dataclass
+class Person:
+    id: UUID
+    name: str
+
+
+class PersonFactory(DataclassFactory[Person]): ...
+
+
+def test_parallel_batch() -> None:
+    people = PersonFactory.batch_parallel(size=5000, workers=4, seed=42)
+    assert len(people) == 5000
+
+    # the result depends on the seed and the shard size, but not on the number of workers
+    assert PersonFactory.batch_parallel(size=5000, workers=2, seed=42) == people
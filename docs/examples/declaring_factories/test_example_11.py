@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from polyfactory.factories import DataclassFactory
+
+
+@dataclass
+class Pet:
+    name: str
+    species: str
+
+
+@dataclass
+class Person:
+    id: UUID
+    name: str
+    pets: list[Pet]
+
+
+class PersonFactory(DataclassFactory[Person]): ...
+
+
+def test_building_dicts() -> None:
+    # build_dict returns the values the model would be created with, nested models included
+    person = PersonFactory.build_dict(name="Jane")
+    assert person["name"] == "Jane"
+    assert all(isinstance(pet, dict) for pet in person["pets"])
+
+    rows = PersonFactory.batch_dicts(size=100)
+    assert len(rows) == 100
+
+    for row in PersonFactory.stream_dicts(10):
+        assert isinstance(row["id"], UUID)
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from polyfactory.factories import DataclassFactory
+
+
+@dataclass
+class Person:
+    id: UUID
+    email: str
+    name: str
+    country: str
+
+
+class PersonFactory(DataclassFactory[Person]): ...
+
+
+def test_prototype() -> None:
+    # the prototype is built once, only the id and email fields are generated for each clone
+    prototype = PersonFactory.prototype(vary=["id", "email"], country="FR")
+    people = prototype.batch(1000)
+
+    assert len({person.id for person in people}) == 1000
+    assert {person.name for person in people} == {prototype.instance.name}
+    assert {person.country for person in people} == {"FR"}
+
+    assert prototype.build(name="Jane").name == "Jane"
@@ -0,0 +1,29 @@
+import json
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+
+from polyfactory.factories import DataclassFactory
+
+
+@dataclass
+class Person:
+    id: UUID
+    name: str
+    birthday: date
+
+
+class PersonFactory(DataclassFactory[Person]): ...
+
+
+def test_build_json() -> None:
+    payload = PersonFactory.build_json(name="Jane")
+
+    assert isinstance(payload, bytes)
+    assert json.loads(payload)["name"] == "Jane"
+
+
+def test_stream_ndjson() -> None:
+    body = b"".join(PersonFactory.stream_ndjson(10))
+
+    assert len(body.splitlines()) == 10
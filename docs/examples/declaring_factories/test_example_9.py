@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from itertools import islice
+from uuid import UUID
+
+from polyfactory.factories import DataclassFactory
+
+
+@dataclass
+class Person:
+    id: UUID
+    name: str
+
+
+class PersonFactory(DataclassFactory[Person]): ...
+
+
+def test_streaming_instances() -> None:
+    # stream builds instances one at a time. Without a size, the iterator is infinite.
+    people = list(islice(PersonFactory.stream(), 10))
+    assert len(people) == 10
+
+    # iter_batches builds the instances in lists of at most chunk_size, so only one list is held in memory at a time.
+    saved: list[Person] = []
+    for chunk in PersonFactory.iter_batches(total=1000, chunk_size=100):
+        assert len(chunk) == 100
+        saved.extend(chunk)  # e.g. pass the chunk on to a persistence handler's save_many
+
+    assert len(saved) == 1000
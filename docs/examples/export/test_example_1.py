@@ -0,0 +1,36 @@
+import csv
+from dataclasses import dataclass
+from pathlib import Path
+
+from polyfactory.export import export
+from polyfactory.factories import DataclassFactory
+
+
+@dataclass
+class Address:
+    street: str
+    city: str
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+    address: Address
+
+
+class PersonFactory(DataclassFactory[Person]): ...
+
+
+def test_export_csv(tmp_path: Path) -> None:
+    path = tmp_path / "people.csv"
+
+    # the rows are generated and written 1000 at a time
+    assert export(PersonFactory, 10_000, path, seed=1) == 10_000
+
+    with path.open() as file:
+        rows = list(csv.DictReader(file))
+
+    assert len(rows) == 10_000
+    # the fields of nested models are flattened into columns
+    assert list(rows[0]) == ["name", "age", "address.street", "address.city"]
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+from polyfactory import Use
+from polyfactory.factories import DataclassFactory
+from polyfactory.profiling import profile
+
+
+@dataclass
+class Address:
+    street: str
+    city: str
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+    email: str
+    address: Address
+
+
+class PersonFactory(DataclassFactory[Person]):
+    email = Use(DataclassFactory.__faker__.email)
+
+
+def test_profile() -> None:
+    with profile() as profiler:
+        PersonFactory.batch(100)
+
+    report = profiler.report()
+
+    # the fields of Person, sorted by the time spent generating them
+    slowest_field = report.sorted("self_time", kind="field", factory="PersonFactory")[0]
+    assert slowest_field.calls == 100
+
+    # a table of the 10 entries with the highest self time
+    table = report.format(limit=10)
+    assert len(table.splitlines()) == 11
@@ -37,3 +37,8 @@ DEFAULT_RANDOM = Random()
 RANDOMIZE_COLLECTION_LENGTH = False
 MIN_COLLECTION_LENGTH = 0
 MAX_COLLECTION_LENGTH = 5
+DYNAMIC_FACTORY_CACHE_SIZE = 1024
+BASE_FACTORY_INDEX_SIZE = 4096
+PARALLEL_SHARD_SIZE = 1000
+BEANIE_MAX_CONCURRENT_INSERTS = 10
+UNIQUE_RETRIES = 100
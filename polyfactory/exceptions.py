@@ -16,3 +16,7 @@ class MissingBuildKwargException(FactoryException):
 
 class MissingDependencyException(FactoryException, ImportError):
     """Missing dependency exception - used when a dependency is not installed"""
+
+
+class UniqueValuesExhaustedException(FactoryException):
+    """Unique Values Exhausted exception - used when no unused value of a unique key can be generated"""
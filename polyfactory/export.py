@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+from collections import deque
+from contextlib import ExitStack, nullcontext
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Literal, cast
+
+from polyfactory.exceptions import MissingDependencyException, ParameterException
+from polyfactory.factories.base import BaseFactory
+from polyfactory.serialization import get_json_encoder, to_json_compatible
+from polyfactory.utils.helpers import unwrap_annotation
+from polyfactory.utils.predicates import is_safe_subclass
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+ExportFormat = Literal["jsonl", "csv", "arrow"]
+"""The formats supported by 'export'."""
+
+DEFAULT_CHUNK_SIZE = 1000
+"""The default number of rows generated and written at a time."""
+
+_SUFFIX_FORMATS: dict[str, ExportFormat] = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+}
+
+_ARROW_NATIVE_TYPES = (str, bool, int, float, Decimal, datetime, date, time, timedelta, bytes)
+
+
+def _to_arrow_compatible(value: Any) -> Any:
+    """Convert a generated value to a value pyarrow can infer a type for.
+
+    :param value: A generated value.
+
+    :returns: A value supported by pyarrow.
+    """
+    if value is None or isinstance(value, _ARROW_NATIVE_TYPES):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _to_arrow_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset, deque)):
+        return [_to_arrow_compatible(item) for item in value]
+    return _to_arrow_compatible(to_json_compatible(value))
+
+
+def _get_csv_columns(
+    factory: type[BaseFactory[Any]], prefix: tuple[str, ...] = (), seen: frozenset[type[Any]] = frozenset()
+) -> list[tuple[str, ...]]:
+    """Return the paths of the CSV columns of the rows generated by the factory.
+
+    Fields built by a factory, i.e. nested models, are flattened into a column per field of the nested model. Other
+    fields, including collections of models, are written as a single column.
+
+    :param factory: A factory.
+    :param prefix: The path of the nested model.
+    :param seen: The models already flattened, to stop at recursive models.
+
+    :returns: A list of paths.
+    """
+    seen |= {factory.__model__}
+    overrides = factory._get_build_plan().overrides
+    columns: list[tuple[str, ...]] = []
+    for field_meta in factory.get_model_fields():
+        override = overrides.get(field_meta.name)
+        if override is not None and override.kind == "ignore":
+            continue
+
+        path = (*prefix, field_meta.name)
+        nested: type[BaseFactory[Any]] | None = None
+        if override is not None:
+            if is_safe_subclass(override.value, BaseFactory):
+                nested = override.value
+        else:
+            annotation = unwrap_annotation(field_meta.annotation)
+            if isinstance(annotation, type) and BaseFactory.is_factory_type(annotation):
+                nested = factory._get_or_create_factory(annotation)
+
+        if nested is not None and nested.__model__ not in seen:
+            columns.extend(_get_csv_columns(nested, path, seen))
+        else:
+            columns.append(path)
+
+    return columns
+
+
+def _get_csv_cell(row: dict[str, Any], path: tuple[str, ...]) -> Any:
+    """Return the value of a CSV column of a row.
+
+    :param row: A generated row.
+    :param path: The path of the column.
+
+    :returns: The value of the cell.
+    """
+    value: Any = row
+    for key in path:
+        if value is None:
+            return None
+        # nested models passed as kwargs or returned by providers are not converted to dicts
+        value = value.get(key) if isinstance(value, dict) else getattr(value, key, None)
+
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, (dict, list, tuple, set, frozenset)) or hasattr(value, "__dict__"):
+        return json.dumps(value, default=to_json_compatible)
+    return to_json_compatible(value)
+
+
+def _write_jsonl(chunks: Iterable[list[dict[str, Any]]], file: IO[str]) -> None:
+    encode = get_json_encoder()
+    for chunk in chunks:
+        file.write("".join(f"{encode(row).decode()}\n" for row in chunk))
+
+
+def _write_csv(factory: type[BaseFactory[Any]], chunks: Iterable[list[dict[str, Any]]], file: IO[str]) -> None:
+    columns = _get_csv_columns(factory)
+    writer = csv.writer(file)
+    header_written = False
+    for chunk in chunks:
+        if not header_written:
+            # values passed as kwargs which are not fields of the model are written as well
+            names = {path[0] for path in columns}
+            columns.extend((key,) for key in (chunk[0] if chunk else {}) if key not in names)
+            writer.writerow([".".join(path) for path in columns])
+            header_written = True
+
+        writer.writerows([_get_csv_cell(row, path) for path in columns] for row in chunk)
+
+
+def _write_arrow(chunks: Iterable[list[dict[str, Any]]], sink: Any) -> None:
+    try:
+        import pyarrow as pa  # noqa: PLC0415
+        import pyarrow.ipc  # noqa: PLC0415
+    except ImportError as e:
+        msg = "pyarrow is not installed"
+        raise MissingDependencyException(msg) from e
+
+    writer: Any = None
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+
+            names = list(chunk[0])
+            columns = [[_to_arrow_compatible(row.get(name)) for row in chunk] for name in names]
+            if writer is None:
+                # the schema is inferred from the first chunk
+                record_batch = pa.RecordBatch.from_arrays([pa.array(column) for column in columns], names=names)
+                writer = pa.ipc.new_file(sink, record_batch.schema)
+            else:
+                schema = writer.schema
+                record_batch = pa.RecordBatch.from_arrays(
+                    [pa.array(column, type=schema.field(name).type) for name, column in zip(names, columns)],
+                    schema=schema,
+                )
+            writer.write_batch(record_batch)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _infer_format(destination: str | os.PathLike[str] | IO[Any]) -> ExportFormat:
+    name = destination if isinstance(destination, (str, os.PathLike)) else getattr(destination, "name", None)
+    # file objects without a name, e.g. io.StringIO, or with a file descriptor as name
+    file_format = _SUFFIX_FORMATS.get(Path(name).suffix.lower()) if isinstance(name, (str, os.PathLike)) else None
+    if file_format is None:
+        msg = f"Cannot infer the export format of {destination!r}, expected one of {list(_SUFFIX_FORMATS)}"
+        raise ParameterException(msg)
+    return file_format
+
+
+def _iter_chunks(
+    factory: type[BaseFactory[Any]], size: int, chunk_size: int, kwargs: dict[str, Any]
+) -> Iterator[list[dict[str, Any]]]:
+    # the chunks share a build context, so the '__unique__' declarations are enforced across the whole export
+    kwargs["_build_context"] = factory._get_dict_build_context(kwargs)
+    return cast("Iterator[list[dict[str, Any]]]", factory.iter_batches(size, chunk_size, **kwargs))
+
+
+def export(
+    factory: type[BaseFactory[Any]],
+    size: int,
+    destination: str | os.PathLike[str] | IO[Any],
+    file_format: ExportFormat | None = None,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int | None = None,
+    **kwargs: Any,
+) -> int:
+    """Generate rows with the given factory and write them to a file, chunk by chunk.
+
+    Example:
+
+        .. code-block:: python
+
+            export(PersonFactory, 1_000_000, "people.csv", seed=1)
+
+    The rows are generated as with 'batch_dicts', so the models are not created and nested models are dicts. Only one
+    chunk of rows is held in memory at a time, and the '__unique__' declarations are enforced across all the chunks.
+
+    - ``jsonl``: a JSON object per line.
+    - ``csv``: a header row followed by a row per instance. The fields of nested models are flattened into columns
+      named after their path, e.g. ``address.city``. Collections are written as JSON.
+    - ``arrow``: an Arrow IPC file with a record batch per chunk. Requires pyarrow. The schema is inferred from the
+      first chunk.
+
+    :param factory: The factory generating the rows.
+    :param size: The number of rows.
+    :param destination: A path, or a file object opened in text mode for jsonl and csv, or in binary mode for arrow.
+    :param file_format: The format of the file. Defaults to the format matching the suffix of the destination.
+    :param chunk_size: The number of rows generated and written at a time.
+    :param seed: If set, the rows are generated in a 'random_scope' with this seed, so the output is reproducible.
+    :param kwargs: Any kwargs. If field names are set in kwargs, their values will be used.
+
+    :raises ParameterException: If the size or chunk size is invalid, or if the format cannot be inferred.
+    :raises MissingDependencyException: If the format is arrow and pyarrow is not installed.
+
+    :returns: The number of rows written.
+    """
+    if size < 0:
+        msg = "size must be greater than or equal to 0"
+        raise ParameterException(msg)
+
+    if chunk_size < 1:
+        msg = "chunk_size must be greater than 0"
+        raise ParameterException(msg)
+
+    if file_format is None:
+        file_format = _infer_format(destination)
+    elif file_format not in ("jsonl", "csv", "arrow"):
+        msg = f"Unsupported export format {file_format!r}"
+        raise ParameterException(msg)
+
+    chunks = _iter_chunks(factory, size, chunk_size, kwargs)
+    with ExitStack() as stack:
+        stack.enter_context(factory.random_scope(seed) if seed is not None else nullcontext())
+        if file_format == "arrow":
+            _write_arrow(chunks, os.fspath(destination) if isinstance(destination, os.PathLike) else destination)
+            return size
+
+        file: IO[str]
+        if isinstance(destination, (str, os.PathLike)):
+            file = stack.enter_context(Path(destination).open("w", encoding="utf-8", newline=""))
+        else:
+            file = cast("IO[str]", destination)
+
+        if file_format == "jsonl":
+            _write_jsonl(chunks, file)
+        else:
+            _write_csv(factory, chunks, file)
+
+    return size
@@ -1,5 +1,5 @@
-from polyfactory.factories.base import BaseFactory
+from polyfactory.factories.base import BaseFactory, validate_all_factories
 from polyfactory.factories.dataclass_factory import DataclassFactory
 from polyfactory.factories.typed_dict_factory import TypedDictFactory
 
-__all__ = ("BaseFactory", "DataclassFactory", "TypedDictFactory")
+__all__ = ("BaseFactory", "DataclassFactory", "TypedDictFactory", "validate_all_factories")
@@ -10,6 +10,8 @@ from polyfactory.field_meta import FieldMeta, Null
 if TYPE_CHECKING:
     from typing import Any, TypeGuard
 
+    from polyfactory.factories.base import BuildContext, Prototype
+
 
 try:
     import attrs
@@ -36,6 +38,10 @@ class AttrsFactory(BaseFactory[T], Generic[T]):
 
     @classmethod
     def get_model_fields(cls) -> list[FieldMeta]:
+        return cls._get_cached_model_fields(cls._create_model_fields)
+
+    @classmethod
+    def _create_model_fields(cls) -> list[FieldMeta]:
         field_metas: list[FieldMeta] = []
         none_type = type(None)
 
@@ -70,6 +76,10 @@ class AttrsFactory(BaseFactory[T], Generic[T]):
 
         return field_metas
 
+    @classmethod
+    def _copy_model(cls, _build_context: BuildContext, prototype: Prototype[T], changes: dict[str, Any]) -> T:
+        return attrs.evolve(prototype.instance, **changes)  # type: ignore[misc]
+
     @classmethod
     def resolve_types(cls, model: type[T], **kwargs: Any) -> None:
         """Resolve any strings and forward annotations in type annotations.
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import copy
+import hashlib
 import inspect
-from abc import ABC, abstractmethod
-from collections import Counter, abc, deque
+import os
+import pickle
+import warnings
+from abc import ABCMeta, abstractmethod
+from collections import Counter, OrderedDict, abc, deque
 from collections.abc import Collection, Hashable, Iterable, Mapping, Sequence
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import EnumMeta
@@ -22,35 +27,51 @@ from ipaddress import (
     ip_interface,
     ip_network,
 )
+from itertools import repeat
 from os.path import realpath
 from pathlib import Path
 from random import Random
+from threading import RLock
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
     Generic,
+    Literal,
+    NamedTuple,
     TypedDict,
     TypeVar,
     cast,
     overload,
 )
 from uuid import UUID
+from weakref import WeakSet
 from zoneinfo import ZoneInfo
 
 from faker import Faker
-from typing_extensions import Self, get_args, get_origin, get_original_bases
+from typing_extensions import NotRequired, Self, get_args, get_origin, get_original_bases
 
 from polyfactory.constants import (
+    BASE_FACTORY_INDEX_SIZE,
     DEFAULT_RANDOM,
+    DYNAMIC_FACTORY_CACHE_SIZE,
     MAX_COLLECTION_LENGTH,
     MIN_COLLECTION_LENGTH,
+    PARALLEL_SHARD_SIZE,
     RANDOMIZE_COLLECTION_LENGTH,
+    UNIQUE_RETRIES,
+)
+from polyfactory.exceptions import (
+    ConfigurationException,
+    MissingBuildKwargException,
+    ParameterException,
+    UniqueValuesExhaustedException,
 )
-from polyfactory.exceptions import ConfigurationException, MissingBuildKwargException, ParameterException
 from polyfactory.field_meta import Null
 from polyfactory.fields import Ignore, PostGenerated, Require, Use
+from polyfactory.serialization import get_json_encoder, get_msgpack_encoder
+from polyfactory.utils._internal import is_attribute_overridden
 from polyfactory.utils.helpers import (
     flatten_annotation,
     get_collection_type,
@@ -68,7 +89,22 @@ from polyfactory.utils.predicates import (
     is_type_var,
     is_union,
 )
+from polyfactory.utils.seeding import (
+    ContextRandom,
+    RandomScope,
+    ThreadLocalRandom,
+    active_random_scope,
+    derive_seed,
+)
 from polyfactory.utils.types import NoneType
+from polyfactory.utils.uniqueness import (
+    MISSING,
+    UniqueIndex,
+    UniqueKey,
+    UniqueScope,
+    active_unique_scope,
+    get_finite_domain,
+)
 from polyfactory.value_generators.complex_types import handle_collection_type, handle_collection_type_coverage
 from polyfactory.value_generators.constrained_collections import (
     handle_constrained_collection,
@@ -76,6 +112,7 @@ from polyfactory.value_generators.constrained_collections import (
 )
 from polyfactory.value_generators.constrained_dates import handle_constrained_date
 from polyfactory.value_generators.constrained_numbers import (
+    get_value_or_none,
     handle_constrained_decimal,
     handle_constrained_float,
     handle_constrained_int,
@@ -90,7 +127,9 @@ if TYPE_CHECKING:
     from typing_extensions import TypeGuard
 
     from polyfactory.field_meta import Constraints, FieldMeta
-    from polyfactory.persistence import AsyncPersistenceProtocol, SyncPersistenceProtocol
+    from polyfactory.persistence import AsyncPersistenceProtocol, ProgressCallback, SyncPersistenceProtocol
+    from polyfactory.profiling import Profiler
+    from polyfactory.snapshot_cache import SnapshotCache
 
 
 T = TypeVar("T")
@@ -100,9 +139,292 @@ F = TypeVar("F", bound="BaseFactory[Any]")
 
 class BuildContext(TypedDict):
     seen_models: set[type]
+    as_dict: NotRequired[bool]
+    """Whether the values of the models are returned as dicts instead of model instances, see 'build_dict'."""
+    unique_scope: NotRequired[UniqueScope]
+    """The scope in which the '__unique__' declarations of the factories are enforced, see 'unique_scope'."""
+
+
+FieldValueGenerator = Callable[[Any, BuildContext], Any]
+"""A compiled field value generator. It is called with the field build parameters and the build context."""
+
+ColumnGenerator = Callable[[int], "list[Any]"]
+"""A compiled generator of a column of field values. It is called with the number of values to generate."""
+
+
+class FieldOverride(NamedTuple):
+    """A value declared on a factory for a field of its model, classified once when the build plan is compiled."""
+
+    kind: Literal["ignore", "require", "post_generated", "value"]
+    """How the declared value is handled: the field is skipped, required as a kwarg, post generated or generated."""
+    value: Any
+    """The declared value."""
+    generate: FieldValueGenerator | None = None
+    """The generator of the field value, for the 'value' and 'require' kinds."""
+
+
+class BuildPlan:
+    """The compiled field value generators of a factory, along with the state they were compiled against."""
+
+    __slots__ = ("columns", "declared_version", "faker", "field_cache_key", "fields", "overrides", "random", "version")
+
+    def __init__(
+        self,
+        *,
+        version: int,
+        declared_version: int,
+        random: Random,
+        faker: Faker,
+        field_cache_key: Hashable,
+        fields: list[tuple[FieldMeta, FieldValueGenerator]],
+        overrides: dict[str, FieldOverride],
+    ) -> None:
+        self.version = version
+        self.declared_version = declared_version
+        self.random = random
+        self.faker = faker
+        self.field_cache_key = field_cache_key
+        self.fields = fields
+        self.overrides = overrides
+        """The values declared on the factory for the fields, by field name"""
+        self.columns: list[ColumnGenerator | None] | None = None
+        """The bulk generators of the fields, compiled on first use by a columnar batch"""
+
+    def is_stale(self, factory: type[BaseFactory[Any]]) -> bool:
+        """Determine whether the plan has to be recompiled for the given factory.
+
+        :param factory: The factory owning the plan.
+
+        :returns: A boolean dictating whether the plan is stale.
+        """
+        return (
+            self.version != BaseFactory._cache_version
+            or self.declared_version != BaseFactory._declared_version
+            or self.random is not factory.__random__
+            or self.faker is not factory.__faker__
+            or self.field_cache_key != factory._get_field_cache_key()
+        )
+
+
+class ProviderMapCacheInfo(NamedTuple):
+    """Statistics of a factory's provider map cache."""
+
+    hits: int
+    misses: int
+    version: int
+
+
+class ProviderMapCache:
+    """The cached provider map of a factory, along with the state it was created against."""
+
+    __slots__ = ("extra_providers", "faker", "hits", "misses", "provider_map", "random", "version")
+
+    def __init__(self) -> None:
+        self.provider_map: dict[Any, Callable[[], Any]] | None = None
+        self.version = -1
+        self.random: Random | None = None
+        self.faker: Faker | None = None
+        self.extra_providers: dict[Any, Callable[[], Any]] | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def is_stale(self, factory: type[BaseFactory[Any]]) -> bool:
+        """Determine whether the provider map has to be recreated for the given factory.
+
+        :param factory: The factory owning the cache.
+
+        :returns: A boolean dictating whether the cached provider map is stale.
+        """
+        return (
+            self.provider_map is None
+            or self.version != BaseFactory._cache_version
+            or self.random is not factory.__random__
+            or self.faker is not factory.__faker__
+            or self.extra_providers is not factory._extra_providers
+        )
+
+
+class RandomScopeState:
+    """The random instances a factory draws values from while it is part of random scopes, see 'random_scope'."""
+
+    __slots__ = ("caches", "context_random", "depth", "faker", "faker_key", "own", "random")
+
+    def __init__(self, factory: type[BaseFactory[Any]]) -> None:
+        key = f"{factory.__module__}.{factory.__qualname__}"
+        self.random = factory.__random__
+        self.faker = factory.__faker__
+        self.own = "__random__" in factory.__dict__
+        """Whether the original Random instance was set on the factory itself, rather than inherited"""
+        self.context_random = ContextRandom(self.random, key)
+        owner = next(base for base in factory.__mro__ if "__faker__" in base.__dict__)
+        self.faker_key = f"{owner.__module__}.{owner.__qualname__}:faker"
+        """The key of the streams of the Faker, shared by the factories sharing the Faker instance"""
+        self.depth = 0
+        """The number of scopes the factory is part of"""
+        self.caches: dict[str, Any] = {}
+        """The compiled caches of the factory for the instances which are not in use"""
+
+    def is_stale(self, factory: type[BaseFactory[Any]]) -> bool:
+        """Determine whether the state has to be created again for the given factory.
+
+        :param factory: The factory owning the state, which is not part of any scope.
+
+        :returns: A boolean dictating whether the state is stale.
+        """
+        return self.random is not factory.__random__ or self.faker is not factory.__faker__
+
+
+class FakerScopeState:
+    """The random instances of a Faker instance drawn from by factories which are part of random scopes.
+
+    The random instances of the Faker's generators are replaced in place with instances resolving to the random
+    instances of the current scope, rather than copying the Faker, and restored when no factory drawing from it is part
+    of a scope anymore.
+    """
+
+    __slots__ = ("contexts", "depth", "originals")
+
+    def __init__(self, faker: Faker, key: str) -> None:
+        self.originals: list[Random] = [generator.random for generator in faker.factories]
+        self.contexts = [ContextRandom(random, f"{key}:{index}") for index, random in enumerate(self.originals)]
+        self.depth = 0
+        """The number of factories drawing from the Faker which are part of scopes"""
+
+    def wrap(self, faker: Faker) -> None:
+        """Make the Faker draw values from the current scope.
+
+        :param faker: The Faker instance the state was created for.
+
+        :returns: None
+        """
+        for generator, context in zip(faker.factories, self.contexts):
+            generator.random = context
+
+    def restore(self, faker: Faker) -> None:
+        """Restore the original random instances of the Faker.
+
+        :param faker: The Faker instance the state was created for.
+
+        :returns: None
+        """
+        for generator, original, context in zip(faker.factories, self.originals, self.contexts):
+            # the instance may have been replaced while the Faker was part of the scope
+            if generator.random is context:
+                generator.random = original
+
+
+class LazyBatch(Sequence[T]):
+    """A batch of model instances which are built on access.
+
+    Each instance is built by 'build_at' from its index, so indexing the batch in any order gives the same instances.
+    """
+
+    __slots__ = ("factory", "kwargs", "seed", "size")
+
+    def __init__(self, factory: type[BaseFactory[T]], size: int, seed: int, kwargs: dict[str, Any]) -> None:
+        self.factory = factory
+        self.size = size
+        self.seed = seed
+        self.kwargs = kwargs
+
+    def __len__(self) -> int:
+        return self.size
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self.size))]
+
+        position = index + self.size if index < 0 else index
+        if not 0 <= position < self.size:
+            msg = "batch index out of range"
+            raise IndexError(msg)
+
+        return self.factory.build_at(position, seed=self.seed, **self.kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyBatch(factory={self.factory.__name__}, size={self.size}, seed={self.seed})"
+
+
+class Prototype(Generic[T]):
+    """A model instance built once and cloned, with new values generated only for the fields that vary.
+
+    The values of the other fields are shared between the prototype and its clones.
+    """
+
+    __slots__ = ("_generators", "factory", "instance", "values", "vary")
+
+    def __init__(
+        self, factory: type[BaseFactory[T]], instance: T, values: dict[str, Any], vary: tuple[str, ...]
+    ) -> None:
+        self.factory = factory
+        self.instance = instance
+        """The prototype instance."""
+        self.values = values
+        """The values the prototype instance was created with."""
+        self.vary = vary
+        """The names of the fields generated for each clone."""
+        self._generators: tuple[BuildPlan, list[tuple[str, FieldValueGenerator | PostGenerated]]] | None = None
+
+    def build(self, **kwargs: Any) -> T:
+        """Clone the prototype, generating new values for the varying fields.
+
+        :param kwargs: Values to set on the clone. They take precedence over the generated values.
 
+        :returns: An instance of type T.
+        """
+        return self.factory._clone_prototype(self, kwargs)
+
+    def batch(self, size: int, **kwargs: Any) -> list[T]:
+        """Clone the prototype n times, generating new values for the varying fields of each clone.
+
+        :param size: The number of clones.
+        :param kwargs: Values to set on the clones. They take precedence over the generated values.
+
+        :returns: A list of instances of type T.
+        """
+        return [self.factory._clone_prototype(self, kwargs) for _ in range(size)]
+
+    def __repr__(self) -> str:
+        return f"Prototype(factory={self.factory.__name__}, vary={list(self.vary)})"
+
+
+def _is_declared_value_name(name: str) -> bool:
+    """Determine whether an attribute set on a factory may declare the value of a field of its model.
+
+    :param name: The name of the attribute.
+
+    :returns: A boolean dictating whether the attribute may be a declared value, rather than a configuration attribute
+        or a cache.
+    """
+    return not (
+        name.startswith("__")
+        or name == "_abc_impl"
+        or name in BaseFactory.__dict__
+        or name in BaseFactory.__annotations__
+    )
+
+
+class BaseFactoryMeta(ABCMeta):
+    """Metaclass of the factories, tracking the values declared on them which are replaced at runtime."""
 
-class BaseFactory(ABC, Generic[T]):
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if _is_declared_value_name(name):
+            BaseFactory._declared_version += 1
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if _is_declared_value_name(name):
+            BaseFactory._declared_version += 1
+
+
+class BaseFactory(Generic[T], metaclass=BaseFactoryMeta):
     """Base Factory class - this class holds the main logic of the library"""
 
     # configuration attributes
@@ -116,6 +438,12 @@ class BaseFactory(ABC, Generic[T]):
     Flag dictating whether to check if fields defined on the factory exists on the model or not.
     If 'True', checks will be done against Use, PostGenerated, Ignore, Require constructs fields only.
     """
+    __lazy_init__: ClassVar[bool] = False
+    """
+    Flag dictating whether to defer the initialization of the factory until it is first used.
+    If 'True', the model is not initialized and checked when the factory class is defined, but on its first build or
+    on a call to 'validate_all_factories', which speeds up importing many factories.
+    """
     __allow_none_optionals__: ClassVar[bool] = True
     """
     Flag dictating whether to allow 'None' for optional values.
@@ -154,6 +482,11 @@ class BaseFactory(ABC, Generic[T]):
     An integer to seed the factory's Faker and Random instances with.
     This attribute can be used to control random generation.
     """
+    __thread_local_random__: ClassVar[bool] = False
+    """
+    Flag dictating whether seeding the factory gives each thread its own Random and Faker streams.
+    If 'True', the streams of each thread are derived from the seed and the thread name.
+    """
     __randomize_collection_length__: ClassVar[bool] = RANDOMIZE_COLLECTION_LENGTH
     """
     Flag dictating whether to randomize collections lengths.
@@ -171,6 +504,32 @@ class BaseFactory(ABC, Generic[T]):
     Flag indicating whether to use the default value on a specific field, if provided.
     """
     __forward_references__: ClassVar[dict[str, Any]] = {}
+    __columnar_batch__: ClassVar[bool] = False
+    """
+    Flag dictating whether 'batch' generates the values of a batch column by column.
+    If 'True', the values of enum, literal, boolean and numeric fields are drawn in bulk for the whole batch. This is
+    faster for large batches, but the generated values differ from row by row generation with the same seed.
+    """
+
+    __random_backend__: ClassVar[Literal["random", "numpy"]] = "random"
+    """
+    The backend used to draw values in bulk. Can be either 'random' or 'numpy'.
+    If 'numpy', batches are generated column by column and the values of enum, literal, boolean, integer, bytes and
+    bounded numeric fields are drawn with a numpy random generator seeded from '__random__'. Requires numpy.
+    """
+
+    __unique__: ClassVar[Sequence[str | Sequence[str]]] = ()
+    """
+    The fields, and tuples of fields forming composite keys, whose values must be unique.
+    The values are unique across a batch, a stream, or all the builds within a 'unique_scope' block. Values colliding
+    with values already used are drawn again, without replacement when the domain of the key is finite and small, e.g.
+    literals, enums or bounded integers. Keys with a missing or None value are not checked.
+    """
+    __unique_retries__: ClassVar[int] = UNIQUE_RETRIES
+    """
+    The maximum number of times the values of a model are drawn again because of collisions, before raising a
+    'UniqueValuesExhaustedException'.
+    """
 
     __config_keys__: tuple[str, ...] = (
         "__check_model__",
@@ -183,51 +542,134 @@ class BaseFactory(ABC, Generic[T]):
         "__max_collection_length__",
         "__use_defaults__",
         "__forward_references__",
+        "__columnar_batch__",
+        "__random_backend__",
     )
     """Keys to be considered as config values to pass on to dynamically created factories."""
 
     # cached attributes
-    _fields_metadata: list[FieldMeta]
+    _fields_metadata: tuple[Hashable, list[FieldMeta]]
+    _build_plan: BuildPlan
+    _provider_map_cache: ProviderMapCache
+    _numpy_random: tuple[Random, Any]
+    _snapshot_fingerprint: tuple[BuildPlan, str]
+    _unique_keys: tuple[BuildPlan, tuple[UniqueKey, ...]]
+    _random_scope_state: RandomScopeState
+    _creation_spec: tuple[type[BaseFactory[Any]], tuple[type[Any], ...], Any, dict[str, Any]]
+    """The arguments a factory was created with by 'create_factory', used to recreate it in other processes"""
     # BaseFactory only attributes
     _factory_type_mapping: ClassVar[dict[Any, type[BaseFactory[Any]]]]
     _base_factories: ClassVar[list[type[BaseFactory[Any]]]]
+    _cache_version: ClassVar[int] = 0
+    """Counter incremented whenever a global registry that compiled caches depend on changes"""
+    _declared_version: ClassVar[int] = 0
+    """Counter incremented whenever an attribute which may declare the value of a field is set on a factory"""
+    _dynamic_factories: ClassVar[OrderedDict[Hashable, type[BaseFactory[Any]]]] = OrderedDict()
+    """LRU cache of the factories generated by '_get_or_create_factory'"""
+    _base_factory_index: ClassVar[OrderedDict[Hashable, tuple[type[BaseFactory[Any]] | None, bool]]] = OrderedDict()
+    """LRU cache mapping annotations to the base factory supporting them, or None when no base factory does, and to
+    whether they are factory types"""
 
     _providers: ClassVar[dict[Any, Callable[[], Any]]]
     """Mapping of type providers that apply to all factories"""
+    _registry_lock: ClassVar[RLock] = RLock()
+    """Lock serialising writes to the global registries. The registries are replaced rather than mutated on write,
+    so they can be read without holding the lock."""
+    _lazy_base_factories: ClassVar[tuple[tuple[str, Callable[[Any], bool]], ...]] = ()
+    """Modules defining base factories which are imported on first use, along with predicates determining whether an
+    annotation may be supported by them"""
+    _faker_scope_states: ClassVar[dict[int, FakerScopeState]] = {}
+    """The states of the Faker instances drawn from by factories which are part of random scopes, by id"""
+    _profiler: ClassVar[Profiler | None] = None
+    """The active profiler, set by 'polyfactory.profiling.profile'"""
+    _uninitialized_factories: ClassVar[WeakSet[type[BaseFactory[Any]]]] = WeakSet()
+    """The factories whose initialization was deferred by '__lazy_init__' and has not happened yet"""
 
     # Non-public attributes
+    _pending_init: bool = False
+    """Flag set on the factories whose initialization was deferred by '__lazy_init__'"""
     _extra_providers: dict[Any, Callable[[], Any]] | None = None
     """Used to copy providers from once base factory to another dynamically generated factory for a class"""
 
-    def __init_subclass__(cls, *args: Any, **kwargs: Any) -> None:
+    def __init_subclass__(cls, *args: Any, **kwargs: Any) -> None:  # noqa: C901, PLR0912
         super().__init_subclass__(*args, **kwargs)
 
-        if not hasattr(BaseFactory, "_base_factories"):
-            BaseFactory._base_factories = []
+        with BaseFactory._registry_lock:
+            if not hasattr(BaseFactory, "_base_factories"):
+                BaseFactory._base_factories = []
 
-        if not hasattr(BaseFactory, "_factory_type_mapping"):
-            BaseFactory._factory_type_mapping = {}
+            if not hasattr(BaseFactory, "_factory_type_mapping"):
+                BaseFactory._factory_type_mapping = {}
 
-        if not hasattr(BaseFactory, "_providers"):
-            BaseFactory._providers = {}
+            if not hasattr(BaseFactory, "_providers"):
+                BaseFactory._providers = {}
 
         if cls.__min_collection_length__ > cls.__max_collection_length__:
             msg = "Minimum collection length shouldn't be greater than maximum collection length"
             raise ConfigurationException(msg)
 
+        if cls.__random_backend__ not in ("random", "numpy"):
+            msg = f"Random backend {cls.__random_backend__!r} is not supported, use either 'random' or 'numpy'"
+            raise ConfigurationException(msg)
+
+        if cls.__random_backend__ == "numpy":
+            import_module("polyfactory.value_generators.numpy_arrays")
+
+        cls._pending_init = False
         if "__is_base_factory__" not in cls.__dict__ or not cls.__is_base_factory__:
-            cls._init_model()
-            if cls.__check_model__:
-                cls._check_declared_fields_exist_in_model()
+            if cls.__lazy_init__:
+                # only the model is resolved, so that the factory can be registered for its type
+                if model := getattr(cls, "__model__", None) or cls._infer_model_type():
+                    cls.__model__ = model
+                cls._pending_init = True
+                with BaseFactory._registry_lock:
+                    BaseFactory._uninitialized_factories.add(cls)
+            else:
+                cls._initialize()
         else:
-            BaseFactory._base_factories.append(cls)
+            with BaseFactory._registry_lock:
+                BaseFactory._base_factories = [*BaseFactory._base_factories, cls]
+                BaseFactory._invalidate_caches()
 
         random_seed = getattr(cls, "__random_seed__", None)
         if random_seed is not None:
             cls.seed_random(random_seed)
 
         if cls.__set_as_default_factory_for_type__ and hasattr(cls, "__model__"):
-            BaseFactory._factory_type_mapping[cls.__model__] = cls
+            with BaseFactory._registry_lock:
+                BaseFactory._factory_type_mapping = {**BaseFactory._factory_type_mapping, cls.__model__: cls}
+                BaseFactory._invalidate_caches()
+
+    @classmethod
+    def _initialize(cls) -> None:
+        """Initialize the model of the factory and check the fields declared on the factory.
+
+        :raises ConfigurationException: If the factory is misconfigured.
+
+        :returns: None
+        """
+        cls._init_model()
+        if cls.__check_model__:
+            cls._check_declared_fields_exist_in_model()
+        if cls.__unique__:
+            cls._get_unique_declarations()
+
+    @classmethod
+    def _initialize_pending(cls) -> None:
+        """Run the initialization deferred by '__lazy_init__'.
+
+        :notes:
+            - The initialization is idempotent, so concurrent first uses may both run it.
+
+        :raises ConfigurationException: If the factory is misconfigured. The initialization is attempted again on the
+            next use.
+
+        :returns: None
+        """
+        cls._initialize()
+        cls._pending_init = False
+        with BaseFactory._registry_lock:
+            BaseFactory._uninitialized_factories.discard(cls)
 
     @classmethod
     def _init_model(cls) -> None:
@@ -239,6 +681,7 @@ class BaseFactory(ABC, Generic[T]):
             )
         cls.__model__ = model
         if not cls.is_supported_type(model):
+            BaseFactory._load_lazy_base_factories(model)
             for factory in BaseFactory._base_factories:
                 if factory.is_supported_type(model):
                     msg = f"{cls.__name__} does not support {model.__name__}, but this type is supported by the {factory.__name__} base factory class. To resolve this error, subclass the factory from {factory.__name__} instead of {cls.__name__}"
@@ -346,6 +789,54 @@ class BaseFactory(ABC, Generic[T]):
 
         return field_value if isinstance(field_value, Hashable) else copy.deepcopy(field_value)
 
+    @classmethod
+    def _compile_factory_field(cls, field_value: Any) -> FieldValueGenerator:
+        """Resolve the dispatch done by '_handle_factory_field' once for the given value.
+
+        :param field_value: A value defined as an attribute on the factory class.
+
+        :returns: A field value generator.
+        """
+        if is_attribute_overridden(BaseFactory, cls, "_handle_factory_field"):
+
+            def handle_factory_field(field_build_parameters: Any, build_context: BuildContext) -> Any:
+                return cls._handle_factory_field(
+                    field_value=field_value,
+                    field_build_parameters=field_build_parameters,
+                    build_context=build_context,
+                )
+
+            return handle_factory_field
+
+        if is_safe_subclass(field_value, BaseFactory):
+            factory = field_value
+
+            def build_sub_factory(field_build_parameters: Any, build_context: BuildContext) -> Any:
+                if isinstance(field_build_parameters, Mapping):
+                    return factory.build(_build_context=build_context, **field_build_parameters)
+
+                if isinstance(field_build_parameters, Sequence):
+                    return [
+                        factory.build(_build_context=build_context, **parameter) for parameter in field_build_parameters
+                    ]
+
+                return factory.build(_build_context=build_context)
+
+            return build_sub_factory
+
+        if isinstance(field_value, Use):
+            use = field_value
+            return lambda _, __: use.to_value()
+
+        if callable(field_value):
+            function = field_value
+            return lambda _, __: function()
+
+        if isinstance(field_value, Hashable):
+            return lambda _, __: field_value
+
+        return lambda _, __: copy.deepcopy(field_value)
+
     @classmethod
     def _handle_factory_field_coverage(
         cls,
@@ -381,7 +872,7 @@ class BaseFactory(ABC, Generic[T]):
     def _get_config(cls) -> dict[str, Any]:
         return {
             **{key: getattr(cls, key) for key in cls.__config_keys__},
-            "_extra_providers": cls.get_provider_map(),
+            "_extra_providers": cls._get_cached_provider_map(),
         }
 
     @classmethod
@@ -395,791 +886,2569 @@ class BaseFactory(ABC, Generic[T]):
         if factory := BaseFactory._factory_type_mapping.get(model):
             return factory
 
-        config = cls._get_config()
+        # the provider map passed on to the factory derives from the factory and its extra providers
+        fingerprint = _fingerprint_config(
+            {
+                **{key: getattr(cls, key) for key in cls.__config_keys__},
+                "_extra_providers": cls._extra_providers,
+            }
+        )
+        if fingerprint is None:
+            return cls._create_factory_for_model(model, cls._get_config())
+
+        cache_key = (model, cls, fingerprint)
+        with BaseFactory._registry_lock:
+            # the cache is replaced when the caches are invalidated, so a factory created meanwhile is not kept
+            cache = BaseFactory._dynamic_factories
+            if factory := cache.get(cache_key):
+                cache.move_to_end(cache_key)
+                return factory
+
+        factory = cls._create_factory_for_model(model, cls._get_config())
+        with BaseFactory._registry_lock:
+            # another thread may have created a factory for the same key in the meantime
+            factory = cache.setdefault(cache_key, factory)
+            if len(cache) > DYNAMIC_FACTORY_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        return factory
+
+    @classmethod
+    def _create_factory_for_model(cls, model: type[U], config: dict[str, Any]) -> type[BaseFactory[U]]:
+        """Generate a factory for the given model using the base factory supporting it.
+
+        :param model: A model type.
+        :param config: The configuration to pass to the generated factory.
 
+        :returns: A Factory sub-class.
+        """
         if cls.__base_factory_overrides__:
             for model_ancestor in model.mro():
                 if factory := cls.__base_factory_overrides__.get(model_ancestor):
                     return factory.create_factory(model, **config)
 
-        for factory in reversed(BaseFactory._base_factories):
-            if factory.is_supported_type(model):
-                return factory.create_factory(model, **config)
+        if factory := BaseFactory._resolve_base_factory(model):
+            return factory.create_factory(model, **config)
 
         msg = f"unsupported model type {model.__name__}"
         raise ParameterException(msg)  # pragma: no cover
 
     @classmethod
-    def _get_initial_variables(cls, kwargs: Any) -> tuple[dict[str, Any], dict[str, PostGenerated], BuildContext]:
-        """Prepare the given kwargs and generate initial variables for further usage.
+    def _resolve_base_factory(cls, annotation: Any) -> type[BaseFactory[Any]] | None:
+        """Return the registered base factory supporting the given annotation.
 
-        :param kwargs: Any build kwargs.
+        When several base factories support the annotation, the most recently registered one is returned.
 
-        :returns: A tuple of build results.
+        :param annotation: A type annotation.
 
+        :returns: A base factory or None.
         """
-        _build_context = cls._get_build_context(kwargs.pop("_build_context", None))
-        _build_context["seen_models"].add(cls.__model__)
+        return BaseFactory._get_base_factory_index_entry(annotation)[0]
 
-        result: dict[str, Any] = {**kwargs}
-        generate_post: dict[str, PostGenerated] = {}
+    @classmethod
+    def _get_base_factory_index_entry(cls, annotation: Any) -> tuple[type[BaseFactory[Any]] | None, bool]:
+        """Return the base factory supporting the given annotation, and whether the annotation is a factory type.
 
-        return result, generate_post, _build_context
+        Results, including negative ones, are cached in a bounded LRU index that is cleared when a base factory is
+        registered.
 
-    # Public Methods
+        :param annotation: A type annotation.
 
-    @classmethod
-    def add_provider(cls, provider_type: Any, provider_function: Callable[[], Any]) -> None:
-        """Add a provider for a custom type to be available to all factories"""
-        cls._providers[provider_type] = provider_function
+        :returns: A tuple of a base factory or None, and a boolean.
+        """
+        index = BaseFactory._base_factory_index
+        try:
+            with BaseFactory._registry_lock:
+                if (entry := index.get(annotation)) is not None:
+                    index.move_to_end(annotation)
+                    return entry
+        except TypeError:
+            # unhashable annotations are not indexed
+            return BaseFactory._find_base_factory(annotation)
+
+        entry = BaseFactory._find_base_factory(annotation)
+        with BaseFactory._registry_lock:
+            # the index is replaced rather than cleared on invalidation, so an outdated entry is dropped with it
+            index[annotation] = entry
+            if len(index) > BASE_FACTORY_INDEX_SIZE:
+                index.popitem(last=False)
+
+        return entry
 
     @classmethod
-    def is_factory_type(cls, annotation: Any) -> bool:
-        """Determine whether a given field is annotated with a type that is supported by a base factory.
+    def _find_base_factory(cls, annotation: Any) -> tuple[type[BaseFactory[Any]] | None, bool]:
+        """Find the base factory supporting the given annotation, and determine whether the annotation is a factory type.
 
         :param annotation: A type annotation.
-        :returns: Boolean dictating whether the annotation is a factory type
+
+        :returns: A tuple of a base factory or None, and a boolean.
         """
-        return not inspect.isabstract(annotation) and any(
-            factory.is_supported_type(annotation) for factory in BaseFactory._base_factories
-        )
+        if BaseFactory._lazy_base_factories:
+            BaseFactory._load_lazy_base_factories(annotation)
+        factory = next((f for f in reversed(BaseFactory._base_factories) if f.is_supported_type(annotation)), None)
+        return factory, factory is not None and not inspect.isabstract(annotation)
 
     @classmethod
-    def is_batch_factory_type(cls, annotation: Any) -> bool:
-        """Determine whether a given field is annotated with a sequence of supported factory types.
+    def _load_lazy_base_factories(cls, annotation: Any) -> None:
+        """Import the modules of the lazily registered base factories that may support the given annotation.
 
         :param annotation: A type annotation.
-        :returns: Boolean dictating whether the annotation is a batch factory type
+
+        :notes:
+            - The base factories imported lazily keep the precedence they would have had if they were imported eagerly,
+              i.e. they take precedence over the builtin base factories registered before them, but not over the other
+              base factories.
+
+        :returns: None
         """
-        origin = get_type_origin(annotation) or annotation
-        if is_safe_subclass(origin, Sequence) and (args := unwrap_args(annotation)):
-            return len(args) == 1 and BaseFactory.is_factory_type(annotation=args[0])
-        return False
+        modules = [module for module, predicate in BaseFactory._lazy_base_factories if predicate(annotation)]
+        if not modules:
+            return
+
+        for module in modules:
+            # the import is done without holding the registry lock, since the registration of the base factories
+            # defined by the module acquires it. Concurrent imports of the same module are serialised by Python.
+            with suppress(ImportError):
+                import_module(module)
+
+        with BaseFactory._registry_lock:
+            BaseFactory._lazy_base_factories = tuple(
+                entry for entry in BaseFactory._lazy_base_factories if entry[0] not in modules
+            )
+            BaseFactory._base_factories = sorted(
+                BaseFactory._base_factories,
+                key=lambda factory: (
+                    _BUILTIN_FACTORY_MODULES.index(factory.__module__)
+                    if factory.__module__ in _BUILTIN_FACTORY_MODULES
+                    else len(_BUILTIN_FACTORY_MODULES)
+                ),
+            )
+            BaseFactory._invalidate_caches()
 
     @classmethod
-    def extract_field_build_parameters(cls, field_meta: FieldMeta, build_args: dict[str, Any]) -> Any:
-        """Extract from the build kwargs any build parameters passed for a given field meta - if it is a factory type.
+    def _get_initial_variables(cls, kwargs: Any) -> tuple[dict[str, Any], dict[str, PostGenerated], BuildContext]:
+        """Prepare the given kwargs and generate initial variables for further usage.
+
+        :param kwargs: Any build kwargs.
+
+        :returns: A tuple of build results.
 
-        :param field_meta: A field meta instance.
-        :param build_args: Any kwargs passed to the factory.
-        :returns: Any values
         """
-        if build_arg := build_args.get(field_meta.name):
-            annotation = unwrap_optional(field_meta.annotation)
-            if (
-                BaseFactory.is_factory_type(annotation=annotation)
-                and isinstance(build_arg, Mapping)
-                and not BaseFactory.is_factory_type(annotation=type(build_arg))
-            ):
-                return build_args.pop(field_meta.name)
+        if cls._pending_init:
+            cls._initialize_pending()
 
-            if (
-                BaseFactory.is_batch_factory_type(annotation=annotation)
-                and isinstance(build_arg, Sequence)
-                and not any(BaseFactory.is_factory_type(annotation=type(value)) for value in build_arg)
-            ):
-                return build_args.pop(field_meta.name)
-        return None
+        _build_context = cls._get_build_context(kwargs.pop("_build_context", None))
+        _build_context["seen_models"].add(cls.__model__)
+
+        result: dict[str, Any] = {**kwargs}
+        generate_post: dict[str, PostGenerated] = {}
+
+        return result, generate_post, _build_context
 
     @classmethod
-    @abstractmethod
-    def is_supported_type(cls, value: Any) -> "TypeGuard[type[T]]":  # pragma: no cover
-        """Determine whether the given value is supported by the factory.
+    def _invalidate_caches(cls) -> None:
+        """Invalidate the compiled caches of all factories.
 
-        :param value: An arbitrary value.
-        :returns: A typeguard
+        :returns: None
         """
-        raise NotImplementedError
+        with BaseFactory._registry_lock:
+            BaseFactory._cache_version += 1
+            BaseFactory._base_factory_index = OrderedDict()
+            BaseFactory._dynamic_factories = OrderedDict()
 
     @classmethod
-    def seed_random(cls, seed: int) -> None:
-        """Seed faker and random with the given integer.
-
-        :param seed: An integer to set as seed.
-        :returns: 'None'
+    def _get_build_plan(cls) -> BuildPlan:
+        """Return the compiled build plan of the factory, compiling it on first use or when it became stale.
 
+        :returns: A BuildPlan instance.
         """
-        cls.__random__ = Random(seed)
-        cls.__faker__.seed_instance(seed)
+        if cls._pending_init:
+            cls._initialize_pending()
+
+        if (random_scope := active_random_scope.get()) is not None and cls not in random_scope.factories:
+            cls._join_random_scope(random_scope)
+
+        build_plan: BuildPlan | None = cls.__dict__.get("_build_plan")
+        if build_plan is None or build_plan.is_stale(cls):
+            version = BaseFactory._cache_version
+            fields = cls.get_model_fields()
+            build_plan = BuildPlan(
+                version=version,
+                declared_version=BaseFactory._declared_version,
+                random=cls.__random__,
+                faker=cls.__faker__,
+                field_cache_key=cls._get_field_cache_key(),
+                fields=[(field_meta, cls._get_field_value_generator(field_meta)) for field_meta in fields],
+                overrides=cls._get_field_overrides(fields),
+            )
+            cls._build_plan = build_plan
+        return build_plan
 
     @classmethod
-    def is_ignored_type(cls, value: Any) -> bool:
-        """Check whether a given value is an ignored type.
+    def _get_field_overrides(cls, fields: list[FieldMeta]) -> dict[str, FieldOverride]:
+        """Classify the values declared on the factory for the given fields.
 
-        :param value: An arbitrary value.
+        :param fields: The fields of the model.
 
         :notes:
-            - This method is meant to be overwritten by extension factories and other subclasses
-
-        :returns: A boolean determining whether the value should be ignored.
+            - The declared values are read when the build plan is compiled, which is compiled again when a value is
+              set or deleted on a factory at runtime.
 
+        :returns: A dictionary mapping field names to FieldOverride instances.
         """
-        return value is None
+        overrides: dict[str, FieldOverride] = {}
+        for field_meta in fields:
+            if not hasattr(cls, field_meta.name) or hasattr(BaseFactory, field_meta.name):
+                continue
 
-    @classmethod
-    def get_provider_map(cls) -> dict[Any, Callable[[], Any]]:
-        """Map types to callables which accept no arguments and return a random value of the given type.
+            field_value = getattr(cls, field_meta.name)
+            if isinstance(field_value, Ignore):
+                overrides[field_meta.name] = FieldOverride("ignore", field_value)
+            elif isinstance(field_value, PostGenerated):
+                overrides[field_meta.name] = FieldOverride("post_generated", field_value)
+            else:
+                generate = cls._compile_factory_field(field_value)
+                if (profiler := BaseFactory._profiler) is not None:
+                    generate = profiler.wrap("factory_field", cls.__name__, field_meta.name, generate)
+                overrides[field_meta.name] = FieldOverride(
+                    "require" if isinstance(field_value, Require) else "value", field_value, generate
+                )
 
-        :notes:
-            - This method is distinct to allow overriding.
+        return overrides
+
+    @classmethod
+    def _get_field_value_generator(cls, field_meta: FieldMeta) -> FieldValueGenerator:
+        """Return a generator for the values of the given field.
 
+        The generator is specialised for the field type when possible, otherwise it calls 'get_field_value'.
 
-        :returns: a dictionary mapping types to callables.
+        :param field_meta: FieldMeta instance.
 
+        :returns: A field value generator.
         """
+        compiler = next(base for base in cls.__mro__ if "_compile_field_value" in base.__dict__)
+        generate: FieldValueGenerator | None = None
+        if not is_attribute_overridden(compiler, cls, "get_field_value"):
+            generate = cls._compile_field_value(field_meta)
 
-        def _create_generic_fn() -> Callable:
-            """Return a generic lambda"""
-            return lambda *args: None
+        if generate is None:
 
-        return {
-            Any: lambda: create_random_string(cls.__random__, min_length=1, max_length=10),
-            # primitives
-            object: object,
-            float: cls.__faker__.pyfloat,
-            int: cls.__faker__.pyint,
-            bool: cls.__faker__.pybool,
-            str: cls.__faker__.pystr,
-            bytes: partial(create_random_bytes, cls.__random__),
-            # built-in objects
-            dict: cls.__faker__.pydict,
-            tuple: cls.__faker__.pytuple,
-            list: cls.__faker__.pylist,
-            set: cls.__faker__.pyset,
-            frozenset: lambda: frozenset(cls.__faker__.pylist()),
-            deque: lambda: deque(cls.__faker__.pylist()),
-            # standard library objects
-            Path: lambda: Path(realpath(__file__)),
-            Decimal: cls.__faker__.pydecimal,
-            UUID: lambda: UUID(str(cls.__faker__.uuid4())),
-            # datetime
-            datetime: cls.__faker__.date_time_between,
-            date: cls.__faker__.date_this_decade,
-            time: cls.__faker__.time_object,
-            timedelta: cls.__faker__.time_delta,
-            ZoneInfo: cls.__faker__.pytimezone,
-            # ip addresses
-            IPv4Address: lambda: ip_address(cls.__faker__.ipv4()),
-            IPv4Interface: lambda: ip_interface(cls.__faker__.ipv4()),
-            IPv4Network: lambda: ip_network(cls.__faker__.ipv4(network=True)),
-            IPv6Address: lambda: ip_address(cls.__faker__.ipv6()),
-            IPv6Interface: lambda: ip_interface(cls.__faker__.ipv6()),
-            IPv6Network: lambda: ip_network(cls.__faker__.ipv6(network=True)),
-            # types
-            Callable: _create_generic_fn,
-            abc.Callable: _create_generic_fn,
-            Counter: lambda: Counter(cls.__faker__.pystr()),
-            **(cls._providers or {}),
-            **(cls._extra_providers or {}),
-        }
+            def generate_field_value(field_build_parameters: Any, build_context: BuildContext) -> Any:
+                return cls.get_field_value(
+                    field_meta,
+                    field_build_parameters=field_build_parameters,
+                    build_context=build_context,
+                )
 
-    @overload
-    @classmethod
-    def create_factory(
-        cls,
-        model: None = None,
-        bases: tuple[type[BaseFactory[Any]], ...] | None = None,
-        **kwargs: Any,
-    ) -> type[Self]: ...
+            generate = generate_field_value
 
-    @overload
-    @classmethod
-    def create_factory(
-        cls,
-        model: type[U],
-        bases: tuple[type[BaseFactory[Any]], ...] | None = None,
-        **kwargs: Any,
-    ) -> type[BaseFactory[U]]: ...
+        if (profiler := BaseFactory._profiler) is not None:
+            return profiler.wrap("field", cls.__name__, field_meta.name, generate)
+
+        return generate
 
     @classmethod
-    def create_factory(
-        cls,
-        model: type[U] | None = None,
-        bases: tuple[type[BaseFactory[Any]], ...] | None = None,
-        **kwargs: Any,
-    ) -> type[Self | BaseFactory[U]]:
-        """Generate a factory for the given type dynamically.
+    def _compile_field_value(cls, field_meta: FieldMeta) -> FieldValueGenerator | None:  # noqa: C901, PLR0911
+        """Resolve the type dispatch done by 'get_field_value' once for the given field.
 
-        :param model: A type to model. Defaults to current factory __model__ if any.
-            Otherwise, raise an error
-        :param bases: Base classes to use when generating the new class.
-        :param kwargs: Any kwargs.
+        :param field_meta: FieldMeta instance.
 
-        :returns: A 'ModelFactory' subclass.
+        :notes:
+            - Subclasses overriding 'get_field_value' should override this method as well, otherwise the generic
+              'get_field_value' is used for their fields.
 
+        :returns: A field value generator, or None if the field cannot be specialised.
         """
-        if model is None:
-            try:
-                model = cls.__model__  # type: ignore[assignment]  # pyright: ignore[reportAssignmentType]
-            except AttributeError as ex:
-                msg = "A 'model' argument is required when creating a new factory from a base one"
-                raise TypeError(msg) from ex
+        if cls.is_ignored_type(field_meta.annotation):
+            return _generate_none
 
-        return cast(
-            "type[Self]",
-            type(
-                f"{model.__name__}Factory",  # type: ignore[union-attr]  # pyright: ignore[reportOptionalMemberAccess]
-                (*(bases or ()), cls),
-                {"__model__": model, **kwargs},
-            ),
-        )
+        unwrapped_annotation = unwrap_annotation(field_meta.annotation)
+        unwrapped_annotation = cls._resolve_forward_references(unwrapped_annotation)
 
-    @classmethod
-    def get_constrained_field_value(  # noqa: C901, PLR0911
-        cls,
-        annotation: Any,
-        field_meta: FieldMeta,
-        field_build_parameters: Any | None = None,
-        build_context: BuildContext | None = None,
-    ) -> Any:
-        try:
-            constraints = cast("Constraints", field_meta.constraints)
-            if is_safe_subclass(annotation, float):
-                return handle_constrained_float(
-                    random=cls.__random__,
-                    multiple_of=cast("Any", constraints.get("multiple_of")),
-                    gt=cast("Any", constraints.get("gt")),
-                    ge=cast("Any", constraints.get("ge")),
-                    lt=cast("Any", constraints.get("lt")),
-                    le=cast("Any", constraints.get("le")),
-                )
+        if is_literal(annotation=unwrapped_annotation) and (literal_args := get_args(unwrapped_annotation)):
 
-            if is_safe_subclass(annotation, int):
-                return handle_constrained_int(
-                    random=cls.__random__,
-                    multiple_of=cast("Any", constraints.get("multiple_of")),
-                    gt=cast("Any", constraints.get("gt")),
-                    ge=cast("Any", constraints.get("ge")),
-                    lt=cast("Any", constraints.get("lt")),
-                    le=cast("Any", constraints.get("le")),
-                )
+            def choose_literal(_: Any, __: BuildContext) -> Any:
+                return cls.__random__.choice(literal_args)
 
-            if is_safe_subclass(annotation, Decimal):
-                return handle_constrained_decimal(
-                    random=cls.__random__,
-                    decimal_places=cast("Any", constraints.get("decimal_places")),
-                    max_digits=cast("Any", constraints.get("max_digits")),
-                    multiple_of=cast("Any", constraints.get("multiple_of")),
-                    gt=cast("Any", constraints.get("gt")),
-                    ge=cast("Any", constraints.get("ge")),
-                    lt=cast("Any", constraints.get("lt")),
-                    le=cast("Any", constraints.get("le")),
-                )
+            return cls._compile_none_handling(field_meta, choose_literal)
 
-            if url_constraints := constraints.get("url"):
-                return handle_constrained_url(constraints=url_constraints)
+        if isinstance(unwrapped_annotation, EnumMeta):
+            members: list[Any] = list(unwrapped_annotation)
 
-            if is_safe_subclass(annotation, str) or is_safe_subclass(annotation, bytes):
-                return handle_constrained_string_or_bytes(
-                    random=cls.__random__,
-                    t_type=str if is_safe_subclass(annotation, str) else bytes,
-                    lower_case=constraints.get("lower_case") or False,
-                    upper_case=constraints.get("upper_case") or False,
-                    min_length=constraints.get("min_length"),
-                    max_length=constraints.get("max_length"),
-                    pattern=constraints.get("pattern"),
-                )
+            def choose_member(_: Any, __: BuildContext) -> Any:
+                return cls.__random__.choice(members)
 
-            try:
-                collection_type = get_collection_type(annotation)
-            except ValueError:
-                collection_type = None
-            if collection_type is not None:
-                if collection_type is dict:
-                    return handle_constrained_mapping(
-                        factory=cls,
-                        field_meta=field_meta,
-                        min_items=constraints.get("min_length"),
-                        max_items=constraints.get("max_length"),
-                        field_build_parameters=field_build_parameters,
-                        build_context=build_context,
-                    )
-                return handle_constrained_collection(
-                    collection_type=collection_type,  # type: ignore[type-var]
-                    factory=cls,
-                    field_meta=field_meta.children[0] if field_meta.children else field_meta,
-                    item_type=constraints.get("item_type"),
-                    max_items=constraints.get("max_length"),
-                    min_items=constraints.get("min_length"),
-                    unique_items=constraints.get("unique_items", False),
+            return cls._compile_none_handling(field_meta, choose_member)
+
+        if field_meta.constraints:
+
+            def generate_constrained(field_build_parameters: Any, build_context: BuildContext) -> Any:
+                return cls.get_constrained_field_value(
+                    annotation=unwrapped_annotation,
+                    field_meta=field_meta,
                     field_build_parameters=field_build_parameters,
                     build_context=build_context,
                 )
 
-            if is_safe_subclass(annotation, date):
-                return handle_constrained_date(
-                    faker=cls.__faker__,
-                    ge=cast("Any", constraints.get("ge")),
-                    gt=cast("Any", constraints.get("gt")),
-                    le=cast("Any", constraints.get("le")),
-                    lt=cast("Any", constraints.get("lt")),
-                    tz=cast("Any", constraints.get("tz")),
-                )
+            return cls._compile_none_handling(field_meta, generate_constrained)
 
-            if is_safe_subclass(annotation, UUID) and (uuid_version := constraints.get("uuid_version")):
-                return handle_constrained_uuid(
-                    uuid_version=uuid_version,
-                    faker=cls.__faker__,
+        if (is_union(unwrapped_annotation) or is_union(field_meta.annotation)) and field_meta.children:
+            return None
+
+        provider_map = cls._get_cached_provider_map()
+        try:
+            provider = provider_map.get(field_meta.annotation) or provider_map.get(unwrapped_annotation)
+        except TypeError:
+            # unhashable annotations are left to 'get_field_value'
+            return None
+
+        if provider:
+            if (profiler := BaseFactory._profiler) is not None:
+                provider = profiler.wrap("provider", cls.__name__, _get_type_name(unwrapped_annotation), provider)
+
+            def call_provider(_: Any, __: BuildContext) -> Any:
+                return provider()
+
+            return cls._compile_none_handling(field_meta, call_provider)
+
+        if BaseFactory.is_factory_type(annotation=unwrapped_annotation):
+            optional = is_optional(field_meta.annotation)
+
+            def build_model(field_build_parameters: Any, build_context: BuildContext) -> Any:
+                if not field_build_parameters and unwrapped_annotation in build_context["seen_models"]:
+                    return None if optional else Null
+
+                return cls._get_or_create_factory(model=unwrapped_annotation).build(
+                    _build_context=build_context,
+                    **(field_build_parameters if isinstance(field_build_parameters, Mapping) else {}),
                 )
 
-            if is_safe_subclass(annotation, Path) and (path_constraint := constraints.get("path_type")):
-                return handle_constrained_path(constraint=path_constraint, faker=cls.__faker__)
-        except TypeError as e:
-            raise ParameterException from e
+            return cls._compile_none_handling(field_meta, build_model)
 
-        msg = f"received constraints for unsupported type {annotation}"
-        raise ParameterException(msg)
+        return None
 
     @classmethod
-    def get_field_value(  # noqa: C901, PLR0911, PLR0912
-        cls,
-        field_meta: FieldMeta,
-        field_build_parameters: Any | None = None,
-        build_context: BuildContext | None = None,
-    ) -> Any:
-        """Return a field value on the subclass if existing, otherwise returns a mock value.
+    def _compile_none_handling(cls, field_meta: FieldMeta, generate_value: FieldValueGenerator) -> FieldValueGenerator:
+        """Wrap a field value generator with the 'None' and missing value handling of 'get_field_value'.
 
         :param field_meta: FieldMeta instance.
-        :param field_build_parameters: Any build parameters passed to the factory as kwarg values.
-        :param build_context: BuildContext data for current build.
+        :param generate_value: A field value generator.
 
-        :returns: An arbitrary value.
+        :returns: A field value generator.
+        """
+        optional = is_optional(field_meta.annotation)
+        required = field_meta.required
+        custom_none_check = is_attribute_overridden(BaseFactory, cls, "should_set_none_value")
+
+        def generate(field_build_parameters: Any, build_context: BuildContext) -> Any:
+            if field_build_parameters is None and (
+                cls.should_set_none_value(field_meta=field_meta)
+                if custom_none_check
+                else optional and cls.__allow_none_optionals__ and create_random_boolean(cls.__random__)
+            ):
+                return None
+
+            if not required and create_random_boolean(cls.__random__):
+                return Null
+
+            return generate_value(field_build_parameters, build_context)
+
+        return generate
+
+    @classmethod
+    def _get_column_generators(cls, build_plan: BuildPlan) -> list[ColumnGenerator | None]:
+        """Return the bulk generators of the fields of the given build plan, compiling them on first use.
+
+        :param build_plan: The build plan of the factory.
 
+        :returns: A list of column generators, aligned with the fields of the build plan.
         """
-        build_context = cls._get_build_context(build_context)
-        if cls.is_ignored_type(field_meta.annotation):
-            return None
+        if build_plan.columns is None:
+            columns = [cls._compile_column_generator(field_meta) for field_meta, _ in build_plan.fields]
+            if (profiler := BaseFactory._profiler) is not None:
+                columns = [
+                    profiler.wrap("field", cls.__name__, field_meta.name, generate_column) if generate_column else None
+                    for (field_meta, _), generate_column in zip(build_plan.fields, columns)
+                ]
+            build_plan.columns = columns
+        return build_plan.columns
 
-        if field_build_parameters is None and cls.should_set_none_value(field_meta=field_meta):
+    @classmethod
+    def _compile_column_generator(cls, field_meta: FieldMeta) -> ColumnGenerator | None:  # noqa: PLR0911
+        """Compile a generator drawing the values of the given field for a whole batch at once.
+
+        :param field_meta: FieldMeta instance.
+
+        :notes:
+            - Only required, non optional fields are drawn in bulk, since the 'None' and missing value handling is
+              decided per value.
+
+        :returns: A column generator, or None if the values of the field have to be generated one by one.
+        """
+        compiler = next(base for base in cls.__mro__ if "_compile_field_value" in base.__dict__)
+        if (
+            is_attribute_overridden(compiler, cls, "get_field_value")
+            or is_attribute_overridden(BaseFactory, cls, "should_set_none_value")
+            or not field_meta.required
+            or is_optional(field_meta.annotation)
+            or cls.is_ignored_type(field_meta.annotation)
+        ):
             return None
 
-        if not field_meta.required and create_random_boolean(cls.__random__):
-            return Null
+        unwrapped_annotation = cls._resolve_forward_references(unwrap_annotation(field_meta.annotation))
 
-        unwrapped_annotation = unwrap_annotation(field_meta.annotation)
-        unwrapped_annotation = cls._resolve_forward_references(unwrapped_annotation)
+        if cls.__random_backend__ == "numpy" and (
+            generate_column := cls._compile_numpy_column_generator(field_meta, unwrapped_annotation)
+        ):
+            return generate_column
 
         if is_literal(annotation=unwrapped_annotation) and (literal_args := get_args(unwrapped_annotation)):
-            return cls.__random__.choice(literal_args)
+            return cls._compile_choices_column_generator(literal_args)
 
         if isinstance(unwrapped_annotation, EnumMeta):
-            return cls.__random__.choice(list(unwrapped_annotation))
+            return cls._compile_choices_column_generator(list(unwrapped_annotation))
 
         if field_meta.constraints:
-            return cls.get_constrained_field_value(
-                annotation=unwrapped_annotation,
-                field_meta=field_meta,
-                field_build_parameters=field_build_parameters,
-                build_context=build_context,
-            )
+            return cls._compile_constrained_column_generator(unwrapped_annotation, field_meta.constraints)
+
+        try:
+            provider = cls._get_cached_provider_map().get(unwrapped_annotation)
+        except TypeError:
+            return None
+
+        if unwrapped_annotation is bool and provider == cls.__faker__.pybool:
+
+            def draw_booleans(size: int) -> list[Any]:
+                bits = cls.__random__.getrandbits(size) if size else 0
+                return [bool(bits >> index & 1) for index in range(size)]
+
+            return draw_booleans
+
+        if unwrapped_annotation is int and provider == cls.__faker__.pyint:
+            return cls._compile_choices_column_generator(range(10000))
+
+        return None
+
+    @classmethod
+    def _compile_choices_column_generator(cls, population: Sequence[Any]) -> ColumnGenerator:
+        """Compile a bulk generator choosing the values of a field from the given population.
+
+        :param population: The values to choose from.
+
+        :returns: A column generator.
+        """
+
+        def draw_choices(size: int) -> list[Any]:
+            return cls.__random__.choices(population, k=size)
+
+        return draw_choices
+
+    @classmethod
+    def _compile_constrained_column_generator(cls, annotation: Any, constraints: Constraints) -> ColumnGenerator | None:
+        """Compile a bulk generator for a number bounded on both ends.
+
+        :param annotation: The unwrapped field annotation.
+        :param constraints: The field constraints.
+
+        :returns: A column generator, or None if the constraints are not supported.
+        """
+        constraint_names = {name for name, value in constraints.items() if value is not None}
+        if annotation not in (int, float) or not constraint_names <= {"ge", "gt", "le", "lt"}:
+            return None
+
+        minimum, maximum = get_value_or_none(
+            t_type=annotation,
+            lt=constraints.get("lt"),
+            le=constraints.get("le"),
+            gt=constraints.get("gt"),
+            ge=constraints.get("ge"),
+        )
+        if minimum is None or maximum is None or minimum > maximum:
+            return None
+
+        if annotation is int:
+            return cls._compile_choices_column_generator(range(int(minimum), int(maximum) + 1))
+
+        def draw_floats(size: int) -> list[Any]:
+            uniform = cls.__random__.uniform
+            return [uniform(minimum, maximum) for _ in range(size)]
+
+        return draw_floats
+
+    @classmethod
+    def _compile_numpy_column_generator(  # noqa: C901, PLR0911
+        cls, field_meta: FieldMeta, annotation: Any
+    ) -> ColumnGenerator | None:
+        """Compile a bulk generator drawing the values of the given field with numpy.
+
+        :param field_meta: FieldMeta instance.
+        :param annotation: The unwrapped field annotation.
+
+        :returns: A column generator, or None if the field is not supported by the numpy backend.
+        """
+        from polyfactory.value_generators import numpy_arrays  # noqa: PLC0415
+
+        def compile_draw(method: Callable[..., list[Any]], *args: Any) -> ColumnGenerator:
+            def draw(size: int) -> list[Any]:
+                return method(cls._get_numpy_random(), size, *args)
+
+            return draw
+
+        if is_literal(annotation=annotation) and (literal_args := get_args(annotation)):
+            return compile_draw(numpy_arrays.create_random_choice_array, literal_args)
+
+        if isinstance(annotation, EnumMeta):
+            return compile_draw(numpy_arrays.create_random_choice_array, list(annotation))
+
+        if constraints := field_meta.constraints:
+            constraint_names = {name for name, value in constraints.items() if value is not None}
+            if annotation not in (int, float) or not constraint_names <= {"ge", "gt", "le", "lt", "multiple_of"}:
+                return None
+
+            minimum, maximum = get_value_or_none(
+                t_type=annotation,
+                lt=constraints.get("lt"),
+                le=constraints.get("le"),
+                gt=constraints.get("gt"),
+                ge=constraints.get("ge"),
+            )
+            if minimum is None or maximum is None or minimum > maximum:
+                return None
+
+            if annotation is float:
+                return compile_draw(
+                    numpy_arrays.create_random_float_array, minimum, maximum, constraints.get("multiple_of")
+                )
+
+            if minimum < numpy_arrays.INT64_MIN or maximum > numpy_arrays.INT64_MAX:
+                return None
+
+            return compile_draw(
+                numpy_arrays.create_random_integer_array, minimum, maximum, constraints.get("multiple_of")
+            )
+
+        try:
+            provider = cls._get_cached_provider_map().get(annotation)
+        except TypeError:
+            return None
+
+        if annotation is bool and provider == cls.__faker__.pybool:
+            return compile_draw(numpy_arrays.create_random_boolean_array)
+
+        if annotation is int and provider == cls.__faker__.pyint:
+            return compile_draw(numpy_arrays.create_random_integer_array, 0, 9999)
+
+        if (
+            annotation is bytes
+            and isinstance(provider, partial)
+            and provider.func is create_random_bytes
+            and not provider.keywords
+        ):
+            return compile_draw(numpy_arrays.create_random_bytes_array)
+
+        return None
+
+    @classmethod
+    def _get_numpy_random(cls) -> Any:
+        """Return the numpy random generator of the factory, seeded from '__random__'.
+
+        :returns: A numpy random generator.
+        """
+        random = cls.__random__
+        if isinstance(random, ContextRandom):
+            # each random scope gets its own generator
+            random = random.get_current()
+
+        numpy_random: tuple[Random, Any] | None = cls.__dict__.get("_numpy_random")
+        if numpy_random is None or numpy_random[0] is not random:
+            from polyfactory.value_generators.numpy_arrays import create_numpy_generator  # noqa: PLC0415
+
+            numpy_random = (random, create_numpy_generator(random))
+            cls._numpy_random = numpy_random
+        return numpy_random[1]
+
+    @classmethod
+    def _supports_batch_engine(cls) -> bool:
+        """Determine whether 'batch' can generate the values of the batch without calling 'build' for each instance.
+
+        :returns: A boolean dictating whether the batch engine can be used.
+        """
+        creator = next(base for base in cls.__mro__ if "_create_model" in base.__dict__)
+        return not is_attribute_overridden(creator, cls, "build") and not is_attribute_overridden(
+            BaseFactory, cls, "process_kwargs"
+        )
+
+    @classmethod
+    def _process_kwargs_batch(cls, size: int, **kwargs: Any) -> list[dict[str, Any]]:  # noqa: C901, PLR0912
+        """Process the given kwargs and generate the values of a batch of models.
+
+        The kwargs are processed once for the whole batch. Unless '__columnar_batch__' is set, the values are
+        generated in the same order as by 'process_kwargs', so that the output for a given seed is the same.
+
+        :param size: Size of the batch.
+        :param kwargs: Any build kwargs.
+
+        :returns: A list of dictionaries of build results.
+        """
+        result, generate_post, _build_context = cls._get_initial_variables(kwargs)
+        build_plan = cls._get_build_plan()
+        overrides = build_plan.overrides
+        profiler = BaseFactory._profiler
+        columnar = cls.__columnar_batch__ or cls.__random_backend__ == "numpy"
+        column_generators = cls._get_column_generators(build_plan) if columnar else [None] * len(build_plan.fields)
+
+        fields: list[tuple[str, Callable[[], Any], ColumnGenerator | None]] = []
+        for (field_meta, generate_field_value), generate_column in zip(build_plan.fields, column_generators):
+            field_build_parameters = cls.extract_field_build_parameters(field_meta=field_meta, build_args=kwargs)
+            if not cls.should_set_field_value(
+                field_meta, _build_context=_build_context, **kwargs
+            ) or cls.should_use_default_value(field_meta):
+                continue
+
+            if (override := overrides.get(field_meta.name)) is not None:
+                if override.kind == "ignore":
+                    continue
+
+                if override.kind == "require" and field_meta.name not in kwargs:
+                    msg = f"Require kwarg {field_meta.name} is missing"
+                    raise MissingBuildKwargException(msg)
+
+                if override.kind == "post_generated":
+                    generate_post[field_meta.name] = override.value
+                    continue
+
+                fields.append(
+                    (
+                        field_meta.name,
+                        partial(cast("FieldValueGenerator", override.generate), field_build_parameters, _build_context),
+                        None,
+                    )
+                )
+                continue
+
+            fields.append(
+                (
+                    field_meta.name,
+                    partial(generate_field_value, field_build_parameters, _build_context),
+                    generate_column if field_build_parameters is None else None,
+                )
+            )
+
+        rows = [dict(result) for _ in range(size)]
+
+        if columnar:
+            for field_name, generate_value, generate_column in fields:
+                values = generate_column(size) if generate_column else [generate_value() for _ in range(size)]
+                for row, value in zip(rows, values):
+                    if value is not Null:
+                        row[field_name] = value
+
+        for row in rows:
+            if not columnar:
+                for field_name, generate_value, _ in fields:
+                    value = generate_value()
+                    if value is not Null:
+                        row[field_name] = value
+
+            for field_name, post_generator in generate_post.items():
+                if profiler is not None:
+                    with profiler.measure("post_generated", cls.__name__, field_name):
+                        row[field_name] = post_generator.to_value(field_name, row)
+                    continue
+                row[field_name] = post_generator.to_value(field_name, row)
+
+            if cls.__unique__:
+                cls._ensure_unique(row, kwargs, _build_context, generate_post)
+
+        return rows
+
+    @classmethod
+    def _get_unique_declarations(cls) -> list[tuple[str, ...]]:
+        """Return the keys declared in '__unique__', as tuples of field names.
+
+        :raises ConfigurationException: If a declared field is not part of the model.
+
+        :returns: A list of tuples of field names.
+        """
+        declarations = [cls.__unique__] if isinstance(cls.__unique__, str) else cls.__unique__
+        field_names = {field_meta.name for field_meta in cls.get_model_fields()}
+        keys: list[tuple[str, ...]] = []
+        for declaration in declarations:
+            names = (declaration,) if isinstance(declaration, str) else tuple(declaration)
+            for name in names:
+                if name not in field_names:
+                    msg = (
+                        f"{name} is declared as unique on the factory {cls.__name__}"
+                        f" but it is not part of the model {cls.__model__.__name__}"
+                    )
+                    raise ConfigurationException(msg)
+            keys.append(names)
+
+        return keys
+
+    @classmethod
+    def _get_unique_keys(cls) -> tuple[UniqueKey, ...]:
+        """Return the compiled keys declared in '__unique__', compiling them again when the build plan is recompiled.
+
+        :returns: A tuple of UniqueKey instances.
+        """
+        build_plan = cls._get_build_plan()
+        cached: tuple[BuildPlan, tuple[UniqueKey, ...]] | None = cls.__dict__.get("_unique_keys")
+        if cached is not None and cached[0] is build_plan:
+            return cached[1]
+
+        overrides = build_plan.overrides
+        fields = {field_meta.name: field_meta for field_meta, _ in build_plan.fields}
+        generated = tuple(
+            name for name in fields if (override := overrides.get(name)) is None or override.kind == "value"
+        )
+
+        keys: list[UniqueKey] = []
+        for names in cls._get_unique_declarations():
+            # only the values generated from the annotation of the fields are drawn from pools
+            domains = [
+                None
+                if name in overrides
+                else get_finite_domain(
+                    fields[name], cls._resolve_forward_references(unwrap_annotation(fields[name].annotation))
+                )
+                for name in names
+            ]
+            derived = any((override := overrides.get(name)) is not None and override.kind != "value" for name in names)
+            keys.append(
+                UniqueKey(
+                    names=names,
+                    domains=tuple(domains),
+                    # the inputs of post generated fields are unknown, so all the generated fields are regenerated
+                    regenerate=generated if derived else tuple(name for name in names if name in generated),
+                )
+            )
+
+        unique_keys = tuple(keys)
+        cls._unique_keys = (build_plan, unique_keys)
+        return unique_keys
+
+    @classmethod
+    def _get_unique_build_context(cls, build_context: BuildContext | None) -> BuildContext:
+        """Return a copy of the given build context, within a unique scope.
+
+        The scope of the build context or the scope of the active 'unique_scope' block is used if any, otherwise a new
+        scope is created, so that the '__unique__' declarations are enforced across a batch or a stream.
+
+        :param build_context: A BuildContext instance, or None.
+
+        :returns: BuildContext
+        """
+        build_context = cls._get_build_context(build_context)
+        if "unique_scope" not in build_context:
+            build_context["unique_scope"] = active_unique_scope.get() or UniqueScope()
+        return build_context
+
+    @classmethod
+    def _ensure_unique(
+        cls,
+        values: dict[str, Any],
+        kwargs: dict[str, Any],
+        build_context: BuildContext,
+        generate_post: dict[str, PostGenerated],
+    ) -> None:
+        """Draw again the values of the unique keys which were already used within the unique scope, then record them.
+
+        :param values: The generated values of a model.
+        :param kwargs: The build kwargs.
+        :param build_context: The build context of the values.
+        :param generate_post: The post generated fields of the model.
+
+        :raises UniqueValuesExhaustedException: If no unused value can be generated.
+
+        :returns: None
+        """
+        unique_scope = build_context.get("unique_scope") or active_unique_scope.get()
+        if unique_scope is None:
+            return
+
+        keys = cls._get_unique_keys()
+        index = unique_scope.get_index(cls, keys)
+        for attempt in range(cls.__unique_retries__ + 1):
+            key_values = [key.get_value(values) for key in keys]
+            collision = next(
+                (
+                    key
+                    for key, value in zip(keys, key_values)
+                    if value is not MISSING and value in index.seen[key.names]
+                ),
+                None,
+            )
+            if collision is None:
+                for key, value in zip(keys, key_values):
+                    if value is not MISSING:
+                        index.seen[key.names].add(value)
+                return
+
+            if attempt == cls.__unique_retries__:
+                msg = (
+                    f"Could not generate unused values of {', '.join(collision.names)} for {cls.__name__}"
+                    f" after {attempt} attempts, {len(index.seen[collision.names])} values were used"
+                )
+                raise UniqueValuesExhaustedException(msg)
+
+            cls._resolve_unique_collision(collision, index, values, kwargs, build_context)
+            for field_name, post_generator in generate_post.items():
+                values[field_name] = post_generator.to_value(field_name, values)
+
+    @classmethod
+    def _resolve_unique_collision(
+        cls,
+        key: UniqueKey,
+        index: UniqueIndex,
+        values: dict[str, Any],
+        kwargs: dict[str, Any],
+        build_context: BuildContext,
+    ) -> None:
+        """Draw again the values of a unique key whose value was already used.
+
+        :param key: The colliding UniqueKey instance.
+        :param index: The UniqueIndex instance of the factory.
+        :param values: The generated values of a model.
+        :param kwargs: The build kwargs.
+        :param build_context: The build context of the values.
+
+        :raises UniqueValuesExhaustedException: If all the values of the key were used, or if they are set by kwargs.
+
+        :returns: None
+        """
+        seen = index.seen[key.names]
+        if not any(name not in kwargs for name in key.regenerate):
+            msg = f"The values of {', '.join(key.names)} set by kwargs were already used for {cls.__name__}"
+            raise UniqueValuesExhaustedException(msg)
+
+        fixed = {name: values.get(name) for name in key.names if name in kwargs}
+        pool = index.get_pool(key, fixed)
+        if pool is None:
+            if not fixed and key.domain_size is not None and len(seen) >= key.domain_size:
+                msg = f"All the {key.domain_size} values of {', '.join(key.names)} were used for {cls.__name__}"
+                raise UniqueValuesExhaustedException(msg)
+
+            cls._regenerate_fields(
+                [name for name in key.regenerate if name not in kwargs], values, kwargs, build_context
+            )
+            return
+
+        free = [name for name in key.names if name not in fixed]
+        drawn = pool.draw(
+            cls.__random__, lambda candidate: key.get_value({**values, **dict(zip(free, candidate))}) in seen
+        )
+        if drawn is None:
+            msg = f"All the {pool.size} values of {', '.join(free)} were used for {cls.__name__}"
+            if fixed:
+                msg += f" with {', '.join(f'{name}={value!r}' for name, value in fixed.items())}"
+            raise UniqueValuesExhaustedException(msg)
+
+        values.update(zip(free, drawn))
+
+    @classmethod
+    def _regenerate_fields(
+        cls, names: Collection[str], values: dict[str, Any], kwargs: dict[str, Any], build_context: BuildContext
+    ) -> None:
+        """Generate the values of the given fields again.
+
+        :param names: The names of the fields.
+        :param values: The generated values of a model, updated in place.
+        :param kwargs: The build kwargs.
+        :param build_context: The build context of the values.
+
+        :returns: None
+        """
+        build_plan = cls._get_build_plan()
+        for field_meta, generate_field_value in build_plan.fields:
+            if field_meta.name not in names or cls.should_use_default_value(field_meta):
+                continue
+
+            override = build_plan.overrides.get(field_meta.name)
+            generate = cast("FieldValueGenerator", override.generate) if override is not None else generate_field_value
+            field_build_parameters = cls.extract_field_build_parameters(field_meta=field_meta, build_args=kwargs)
+            value = generate(field_build_parameters, build_context)
+            if value is Null:
+                values.pop(field_meta.name, None)
+            else:
+                values[field_meta.name] = value
+
+    @classmethod
+    def _get_factory_reference(cls) -> Any:
+        """Return a picklable reference to the factory, which can be resolved with '_resolve_factory_reference'.
+
+        Factories created with 'create_factory' cannot be pickled by reference, so they are referenced by the
+        arguments they were created with instead.
+
+        :returns: The factory itself, or a tuple of the arguments it was created with.
+        """
+        if "_creation_spec" not in cls.__dict__:
+            return cls
+
+        factory, bases, model, kwargs = cls._creation_spec
+        return (
+            factory._get_factory_reference(),
+            tuple(base._get_factory_reference() if is_safe_subclass(base, BaseFactory) else base for base in bases),
+            model,
+            kwargs,
+        )
+
+    @classmethod
+    def _iter_parallel_shards(
+        cls,
+        size: int,
+        workers: int | None,
+        seed: int | None,
+        shard_size: int,
+        kwargs: dict[str, Any],
+    ) -> abc.Iterator[list[T]]:
+        """Build a batch in shards of a fixed size, distributed across worker processes.
+
+        Each shard is built in a random scope seeded with a seed derived from the given seed and the shard index, so
+        the result does not depend on the number of workers.
+
+        :param size: Size of the batch.
+        :param workers: The maximum number of worker processes. Defaults to the number of CPUs.
+        :param seed: The seed to derive the seeds of the shards from.
+        :param shard_size: The number of instances built by each worker task.
+        :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
+
+        :returns: An iterator of the shards, in order.
+        """
+        if size < 0:
+            msg = "size must be greater than or equal to 0"
+            raise ParameterException(msg)
+
+        if shard_size < 1 or (workers is not None and workers < 1):
+            msg = "shard_size and workers must be greater than 0"
+            raise ParameterException(msg)
+
+        if seed is None:
+            seed = getattr(cls, "__random_seed__", None)
+            if seed is None:
+                seed = cls.__random__.getrandbits(64)
+
+        try:
+            payload = pickle.dumps((cls._get_factory_reference(), kwargs))
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            msg = f"{cls.__name__} cannot be sent to worker processes, the factory, its model and the kwargs must be picklable: {e}"
+            raise ConfigurationException(msg) from e
+
+        shard_sizes = [min(shard_size, size - offset) for offset in range(0, size, shard_size)]
+        if not shard_sizes:
+            return
+
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(shard_sizes))) as executor:
+            yield from executor.map(
+                _build_shard,
+                repeat(payload),
+                [derive_seed(seed, index) for index in range(len(shard_sizes))],
+                shard_sizes,
+            )
+
+    @classmethod
+    def _resolve_seed(cls, seed: int | None) -> int:
+        """Return the given seed, defaulting to '__random_seed__'.
+
+        :param seed: A seed, or None.
+
+        :returns: A seed.
+        """
+        if seed is None:
+            seed = getattr(cls, "__random_seed__", None)
+            if seed is None:
+                msg = f"a seed is required, either pass one or set '__random_seed__' on {cls.__name__}"
+                raise ParameterException(msg)
+        return seed
+
+    @classmethod
+    def _join_random_scope(cls, scope: RandomScope) -> None:
+        """Make the factory draw values from the given random scope, until the scope exits.
+
+        The factory's Random instance, and the random instances of its Faker, are replaced with instances resolving to
+        the random instances of the current scope, and restored when the last scope the factory is part of exits, so
+        that factories not part of any scope do not pay for the context variable lookup of every draw. The Faker is
+        not copied, the factories sharing it draw from the same streams of the scope.
+
+        :param scope: The active random scope.
+
+        :returns: None
+        """
+        with BaseFactory._registry_lock:
+            if scope.closed or cls in scope.factories:
+                return
+
+            state: RandomScopeState | None = cls.__dict__.get("_random_scope_state")
+            if state is None or (not state.depth and state.is_stale(cls)):
+                state = cls._random_scope_state = RandomScopeState(cls)
+
+            if not state.depth:
+                cls.__random__ = state.context_random
+                faker_state = BaseFactory._faker_scope_states.get(id(state.faker))
+                if faker_state is None:
+                    faker_state = FakerScopeState(state.faker, state.faker_key)
+                    BaseFactory._faker_scope_states[id(state.faker)] = faker_state
+                    faker_state.wrap(state.faker)
+                faker_state.depth += 1
+                cls._swap_random_scope_caches(state)
+
+            state.depth += 1
+            scope.factories.add(cls)
+
+    @classmethod
+    def _exit_random_scope(cls) -> None:
+        """Restore the factory's Random instance and the random instances of its Faker, if it is not part of any other
+        random scope.
+
+        :returns: None
+        """
+        with BaseFactory._registry_lock:
+            state: RandomScopeState = cls.__dict__["_random_scope_state"]
+            state.depth -= 1
+            if state.depth:
+                return
+
+            # the instance may have been replaced while the factory was part of the scope, e.g. by 'seed_random'
+            if cls.__dict__.get("__random__") is state.context_random:
+                if state.own:
+                    cls.__random__ = state.random
+                else:
+                    del cls.__random__
+
+            faker_state = BaseFactory._faker_scope_states[id(state.faker)]
+            faker_state.depth -= 1
+            if not faker_state.depth:
+                del BaseFactory._faker_scope_states[id(state.faker)]
+                faker_state.restore(state.faker)
+
+            cls._swap_random_scope_caches(state)
+
+    @classmethod
+    def _swap_random_scope_caches(cls, state: RandomScopeState) -> None:
+        """Swap the compiled caches of the factory with the ones stored in the given state.
+
+        The caches depend on the factory's Random and Faker instances, keeping the caches of both the original and the
+        scoped instances avoids compiling them again whenever the factory joins or exits a scope.
+
+        :param state: The random scope state of the factory.
+
+        :returns: None
+        """
+        for name in ("_build_plan", "_provider_map_cache", "_snapshot_fingerprint", "_unique_keys"):
+            current = cls.__dict__.get(name)
+            stored = state.caches.pop(name, None)
+            if current is not None:
+                state.caches[name] = current
+                delattr(cls, name)
+            if stored is not None:
+                setattr(cls, name, stored)
+
+    @classmethod
+    def _create_model(cls, _build_context: BuildContext, **kwargs: Any) -> T:
+        """Create an instance of the factory's __model__
+
+        :param _build_context: BuildContext instance.
+        :param kwargs: Model kwargs.
+
+        :returns: An instance of type T.
+
+        """
+        return cls.__model__(**kwargs)
+
+    @classmethod
+    def _create_result(cls, _build_context: BuildContext, values: dict[str, Any]) -> T:
+        """Create an instance of the factory's __model__ from the generated values, unless building dicts.
+
+        :param _build_context: BuildContext instance.
+        :param values: The generated values.
+
+        :returns: An instance of type T, or the values themselves if 'as_dict' is set in the build context.
+        """
+        if _build_context.get("as_dict"):
+            return cast("T", values)
+
+        return cls._create_model(_build_context, **values)
+
+    @classmethod
+    def _copy_model(cls, _build_context: BuildContext, prototype: Prototype[T], changes: dict[str, Any]) -> T:
+        """Create a copy of an instance of the factory's __model__ with some of its values changed.
+
+        The default implementation creates a new instance from the values of the prototype instance, factories for models
+        supporting shallow copies override it.
+
+        :param _build_context: BuildContext instance.
+        :param prototype: The prototype whose instance is copied.
+        :param changes: The values to change, by field name.
+
+        :returns: An instance of type T.
+        """
+        return cls._create_model(_build_context, **{**prototype.values, **changes})
+
+    @classmethod
+    def _get_prototype_generators(
+        cls, prototype: Prototype[T]
+    ) -> list[tuple[str, FieldValueGenerator | PostGenerated]]:
+        """Return the generators of the varying fields of a prototype, recompiled along with the build plan.
+
+        :param prototype: The prototype.
+
+        :returns: A list of field names and their generators, the PostGenerated fields last.
+        """
+        build_plan = cls._get_build_plan()
+        if prototype._generators is not None and prototype._generators[0] is build_plan:
+            return prototype._generators[1]
+
+        field_generators = {field_meta.name: generate for field_meta, generate in build_plan.fields}
+        generators: list[tuple[str, FieldValueGenerator | PostGenerated]] = []
+        post_generators: list[tuple[str, FieldValueGenerator | PostGenerated]] = []
+        for name in prototype.vary:
+            override = build_plan.overrides.get(name)
+            if override is None:
+                generators.append((name, field_generators[name]))
+            elif override.kind == "post_generated":
+                post_generators.append((name, override.value))
+            else:
+                generators.append((name, cast("FieldValueGenerator", override.generate)))
+
+        prototype._generators = (build_plan, [*generators, *post_generators])
+        return prototype._generators[1]
+
+    @classmethod
+    def _clone_prototype(cls, prototype: Prototype[T], kwargs: dict[str, Any]) -> T:
+        """Clone a prototype, generating new values for its varying fields.
+
+        :param prototype: The prototype.
+        :param kwargs: Values to set on the clone.
+
+        :returns: An instance of type T.
+        """
+        build_context = cls._get_build_context(None)
+        build_context["seen_models"].add(cls.__model__)
+
+        changes: dict[str, Any] = {}
+        for name, generator in cls._get_prototype_generators(prototype):
+            if name in kwargs:
+                continue
+            if isinstance(generator, PostGenerated):
+                changes[name] = generator.to_value(name, {**prototype.values, **changes, **kwargs})
+            else:
+                changes[name] = generator(None, build_context)
+
+        changes.update(kwargs)
+        return cls._copy_model(build_context, prototype, changes)
+
+    @classmethod
+    def _build_profiled(cls, profiler: Profiler, **kwargs: Any) -> T:
+        """Build an instance of the factory's __model__, profiling the generation of the values and the model creation.
+
+        :param profiler: The active profiler.
+        :param kwargs: Any build kwargs, including the build context.
+
+        :returns: An instance of type T.
+        """
+        with profiler.measure("process_kwargs", cls.__name__):
+            values = cls.process_kwargs(**kwargs)
+
+        with profiler.measure("model", cls.__name__):
+            return cls._create_result(kwargs["_build_context"], values)
+
+    @classmethod
+    def _batch_profiled(cls, profiler: Profiler, size: int, **kwargs: Any) -> list[T]:
+        """Build a batch with the batch engine, profiling the generation of the values and the model creations.
+
+        :param profiler: The active profiler.
+        :param size: Size of the batch.
+        :param kwargs: Any build kwargs, including the build context.
+
+        :returns: A list of instances of type T.
+        """
+        with profiler.measure("process_kwargs", cls.__name__):
+            batch_values = cls._process_kwargs_batch(size, **kwargs)
+
+        create_result = profiler.wrap("model", cls.__name__, None, cls._create_result)
+        return [create_result(kwargs["_build_context"], values) for values in batch_values]
+
+    # Public Methods
+
+    @classmethod
+    def add_provider(cls, provider_type: Any, provider_function: Callable[[], Any]) -> None:
+        """Add a provider for a custom type to be available to all factories"""
+        with BaseFactory._registry_lock:
+            BaseFactory._providers = {**BaseFactory._providers, provider_type: provider_function}
+            BaseFactory._invalidate_caches()
+
+    @classmethod
+    def is_factory_type(cls, annotation: Any) -> bool:
+        """Determine whether a given field is annotated with a type that is supported by a base factory.
+
+        :param annotation: A type annotation.
+        :returns: Boolean dictating whether the annotation is a factory type
+        """
+        return BaseFactory._get_base_factory_index_entry(annotation)[1]
+
+    @classmethod
+    def is_batch_factory_type(cls, annotation: Any) -> bool:
+        """Determine whether a given field is annotated with a sequence of supported factory types.
+
+        :param annotation: A type annotation.
+        :returns: Boolean dictating whether the annotation is a batch factory type
+        """
+        origin = get_type_origin(annotation) or annotation
+        if is_safe_subclass(origin, Sequence) and (args := unwrap_args(annotation)):
+            return len(args) == 1 and BaseFactory.is_factory_type(annotation=args[0])
+        return False
+
+    @classmethod
+    def extract_field_build_parameters(cls, field_meta: FieldMeta, build_args: dict[str, Any]) -> Any:
+        """Extract from the build kwargs any build parameters passed for a given field meta - if it is a factory type.
+
+        :param field_meta: A field meta instance.
+        :param build_args: Any kwargs passed to the factory.
+        :returns: Any values
+        """
+        if build_arg := build_args.get(field_meta.name):
+            annotation = unwrap_optional(field_meta.annotation)
+            if (
+                BaseFactory.is_factory_type(annotation=annotation)
+                and isinstance(build_arg, Mapping)
+                and not BaseFactory.is_factory_type(annotation=type(build_arg))
+            ):
+                return build_args.pop(field_meta.name)
+
+            if (
+                BaseFactory.is_batch_factory_type(annotation=annotation)
+                and isinstance(build_arg, Sequence)
+                and not any(BaseFactory.is_factory_type(annotation=type(value)) for value in build_arg)
+            ):
+                return build_args.pop(field_meta.name)
+        return None
+
+    @classmethod
+    @abstractmethod
+    def is_supported_type(cls, value: Any) -> "TypeGuard[type[T]]":  # pragma: no cover
+        """Determine whether the given value is supported by the factory.
+
+        :param value: An arbitrary value.
+        :returns: A typeguard
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def seed_random(cls, seed: int) -> None:
+        """Seed faker and random with the given integer.
+
+        :param seed: An integer to set as seed.
+        :returns: 'None'
+
+        :notes:
+            - If '__thread_local_random__' is set, each thread gets its own streams derived from the seed. The factory
+              gets its own copy of its Faker instance, so that the factories sharing it are not affected.
+
+        """
+        if cls.__thread_local_random__:
+            faker = copy.deepcopy(cls.__faker__)
+            for generator in faker.factories:
+                generator.random = ThreadLocalRandom(seed)
+            cls.__random__ = ThreadLocalRandom(seed)
+            cls.__faker__ = faker
+            return
+
+        cls.__random__ = Random(seed)
+        cls.__faker__.seed_instance(seed)
+
+    @classmethod
+    def is_ignored_type(cls, value: Any) -> bool:
+        """Check whether a given value is an ignored type.
+
+        :param value: An arbitrary value.
+
+        :notes:
+            - This method is meant to be overwritten by extension factories and other subclasses
+
+        :returns: A boolean determining whether the value should be ignored.
+
+        """
+        return value is None
+
+    @classmethod
+    def get_provider_map(cls) -> dict[Any, Callable[[], Any]]:
+        """Map types to callables which accept no arguments and return a random value of the given type.
+
+        :notes:
+            - This method is distinct to allow overriding.
+            - The result is cached per factory by the build machinery, so it should not depend on state other than
+              the factory configuration and the registered providers.
+
+
+        :returns: a dictionary mapping types to callables.
+
+        """
+
+        def _create_generic_fn() -> Callable:
+            """Return a generic lambda"""
+            return lambda *args: None
+
+        return {
+            Any: lambda: create_random_string(cls.__random__, min_length=1, max_length=10),
+            # primitives
+            object: object,
+            float: cls.__faker__.pyfloat,
+            int: cls.__faker__.pyint,
+            bool: cls.__faker__.pybool,
+            str: cls.__faker__.pystr,
+            bytes: partial(create_random_bytes, cls.__random__),
+            # built-in objects
+            dict: cls.__faker__.pydict,
+            tuple: cls.__faker__.pytuple,
+            list: cls.__faker__.pylist,
+            set: cls.__faker__.pyset,
+            frozenset: lambda: frozenset(cls.__faker__.pylist()),
+            deque: lambda: deque(cls.__faker__.pylist()),
+            # standard library objects
+            Path: lambda: Path(realpath(__file__)),
+            Decimal: cls.__faker__.pydecimal,
+            UUID: lambda: UUID(str(cls.__faker__.uuid4())),
+            # datetime
+            datetime: cls.__faker__.date_time_between,
+            date: cls.__faker__.date_this_decade,
+            time: cls.__faker__.time_object,
+            timedelta: cls.__faker__.time_delta,
+            ZoneInfo: cls.__faker__.pytimezone,
+            # ip addresses
+            IPv4Address: lambda: ip_address(cls.__faker__.ipv4()),
+            IPv4Interface: lambda: ip_interface(cls.__faker__.ipv4()),
+            IPv4Network: lambda: ip_network(cls.__faker__.ipv4(network=True)),
+            IPv6Address: lambda: ip_address(cls.__faker__.ipv6()),
+            IPv6Interface: lambda: ip_interface(cls.__faker__.ipv6()),
+            IPv6Network: lambda: ip_network(cls.__faker__.ipv6(network=True)),
+            # types
+            Callable: _create_generic_fn,
+            abc.Callable: _create_generic_fn,
+            Counter: lambda: Counter(cls.__faker__.pystr()),
+            **(cls._providers or {}),
+            **(cls._extra_providers or {}),
+        }
+
+    @classmethod
+    def _get_cached_provider_map(cls) -> dict[Any, Callable[[], Any]]:
+        """Return the result of 'get_provider_map', cached per factory.
+
+        The cache is invalidated when a provider is added, when the factory's Random, Faker or extra providers are
+        replaced and when a base factory is registered.
+
+        :notes:
+            - The returned mapping is shared and must not be mutated.
+
+        :returns: a dictionary mapping types to callables.
+        """
+        cache: ProviderMapCache | None = cls.__dict__.get("_provider_map_cache")
+        if cache is None:
+            cache = cls._provider_map_cache = ProviderMapCache()
+
+        if not cache.is_stale(cls):
+            cache.hits += 1
+            return cast("dict[Any, Callable[[], Any]]", cache.provider_map)
+
+        cache.misses += 1
+        cache.version = BaseFactory._cache_version
+        cache.random = cls.__random__
+        cache.faker = cls.__faker__
+        cache.extra_providers = cls._extra_providers
+        cache.provider_map = cls.get_provider_map()
+        return cache.provider_map
+
+    @classmethod
+    def provider_map_cache_info(cls) -> ProviderMapCacheInfo:
+        """Return the hit and miss counters of the factory's provider map cache.
+
+        :returns: A ProviderMapCacheInfo instance.
+        """
+        cache: ProviderMapCache | None = cls.__dict__.get("_provider_map_cache")
+        if cache is None:
+            return ProviderMapCacheInfo(hits=0, misses=0, version=BaseFactory._cache_version)
+        return ProviderMapCacheInfo(hits=cache.hits, misses=cache.misses, version=cache.version)
+
+    @overload
+    @classmethod
+    def create_factory(
+        cls,
+        model: None = None,
+        bases: tuple[type[BaseFactory[Any]], ...] | None = None,
+        **kwargs: Any,
+    ) -> type[Self]: ...
+
+    @overload
+    @classmethod
+    def create_factory(
+        cls,
+        model: type[U],
+        bases: tuple[type[BaseFactory[Any]], ...] | None = None,
+        **kwargs: Any,
+    ) -> type[BaseFactory[U]]: ...
+
+    @classmethod
+    def create_factory(
+        cls,
+        model: type[U] | None = None,
+        bases: tuple[type[BaseFactory[Any]], ...] | None = None,
+        **kwargs: Any,
+    ) -> type[Self | BaseFactory[U]]:
+        """Generate a factory for the given type dynamically.
+
+        :param model: A type to model. Defaults to current factory __model__ if any.
+            Otherwise, raise an error
+        :param bases: Base classes to use when generating the new class.
+        :param kwargs: Any kwargs.
+
+        :returns: A 'ModelFactory' subclass.
+
+        """
+        if model is None:
+            try:
+                model = cls.__model__  # type: ignore[assignment]  # pyright: ignore[reportAssignmentType]
+            except AttributeError as ex:
+                msg = "A 'model' argument is required when creating a new factory from a base one"
+                raise TypeError(msg) from ex
+
+        factory: type[BaseFactory[Any]] = type(
+            f"{model.__name__}Factory",  # type: ignore[union-attr]  # pyright: ignore[reportOptionalMemberAccess]
+            (*(bases or ()), cls),
+            {"__model__": model, **kwargs},
+        )
+        factory._creation_spec = (cls, bases or (), model, kwargs)
+        return cast("type[Self]", factory)
+
+    @classmethod
+    def get_constrained_field_value(  # noqa: C901, PLR0911
+        cls,
+        annotation: Any,
+        field_meta: FieldMeta,
+        field_build_parameters: Any | None = None,
+        build_context: BuildContext | None = None,
+    ) -> Any:
+        try:
+            constraints = cast("Constraints", field_meta.constraints)
+            if is_safe_subclass(annotation, float):
+                return handle_constrained_float(
+                    random=cls.__random__,
+                    multiple_of=cast("Any", constraints.get("multiple_of")),
+                    gt=cast("Any", constraints.get("gt")),
+                    ge=cast("Any", constraints.get("ge")),
+                    lt=cast("Any", constraints.get("lt")),
+                    le=cast("Any", constraints.get("le")),
+                )
+
+            if is_safe_subclass(annotation, int):
+                return handle_constrained_int(
+                    random=cls.__random__,
+                    multiple_of=cast("Any", constraints.get("multiple_of")),
+                    gt=cast("Any", constraints.get("gt")),
+                    ge=cast("Any", constraints.get("ge")),
+                    lt=cast("Any", constraints.get("lt")),
+                    le=cast("Any", constraints.get("le")),
+                )
+
+            if is_safe_subclass(annotation, Decimal):
+                return handle_constrained_decimal(
+                    random=cls.__random__,
+                    decimal_places=cast("Any", constraints.get("decimal_places")),
+                    max_digits=cast("Any", constraints.get("max_digits")),
+                    multiple_of=cast("Any", constraints.get("multiple_of")),
+                    gt=cast("Any", constraints.get("gt")),
+                    ge=cast("Any", constraints.get("ge")),
+                    lt=cast("Any", constraints.get("lt")),
+                    le=cast("Any", constraints.get("le")),
+                )
+
+            if url_constraints := constraints.get("url"):
+                return handle_constrained_url(constraints=url_constraints)
+
+            if is_safe_subclass(annotation, str) or is_safe_subclass(annotation, bytes):
+                return handle_constrained_string_or_bytes(
+                    random=cls.__random__,
+                    t_type=str if is_safe_subclass(annotation, str) else bytes,
+                    lower_case=constraints.get("lower_case") or False,
+                    upper_case=constraints.get("upper_case") or False,
+                    min_length=constraints.get("min_length"),
+                    max_length=constraints.get("max_length"),
+                    pattern=constraints.get("pattern"),
+                )
+
+            try:
+                collection_type = get_collection_type(annotation)
+            except ValueError:
+                collection_type = None
+            if collection_type is not None:
+                if collection_type is dict:
+                    return handle_constrained_mapping(
+                        factory=cls,
+                        field_meta=field_meta,
+                        min_items=constraints.get("min_length"),
+                        max_items=constraints.get("max_length"),
+                        field_build_parameters=field_build_parameters,
+                        build_context=build_context,
+                    )
+                return handle_constrained_collection(
+                    collection_type=collection_type,  # type: ignore[type-var]
+                    factory=cls,
+                    field_meta=field_meta.children[0] if field_meta.children else field_meta,
+                    item_type=constraints.get("item_type"),
+                    max_items=constraints.get("max_length"),
+                    min_items=constraints.get("min_length"),
+                    unique_items=constraints.get("unique_items", False),
+                    field_build_parameters=field_build_parameters,
+                    build_context=build_context,
+                )
+
+            if is_safe_subclass(annotation, date):
+                return handle_constrained_date(
+                    faker=cls.__faker__,
+                    ge=cast("Any", constraints.get("ge")),
+                    gt=cast("Any", constraints.get("gt")),
+                    le=cast("Any", constraints.get("le")),
+                    lt=cast("Any", constraints.get("lt")),
+                    tz=cast("Any", constraints.get("tz")),
+                )
+
+            if is_safe_subclass(annotation, UUID) and (uuid_version := constraints.get("uuid_version")):
+                return handle_constrained_uuid(
+                    uuid_version=uuid_version,
+                    faker=cls.__faker__,
+                )
+
+            if is_safe_subclass(annotation, Path) and (path_constraint := constraints.get("path_type")):
+                return handle_constrained_path(constraint=path_constraint, faker=cls.__faker__)
+        except TypeError as e:
+            raise ParameterException from e
+
+        msg = f"received constraints for unsupported type {annotation}"
+        raise ParameterException(msg)
+
+    @classmethod
+    def get_field_value(  # noqa: C901, PLR0911, PLR0912
+        cls,
+        field_meta: FieldMeta,
+        field_build_parameters: Any | None = None,
+        build_context: BuildContext | None = None,
+    ) -> Any:
+        """Return a field value on the subclass if existing, otherwise returns a mock value.
+
+        :param field_meta: FieldMeta instance.
+        :param field_build_parameters: Any build parameters passed to the factory as kwarg values.
+        :param build_context: BuildContext data for current build.
+
+        :returns: An arbitrary value.
+
+        """
+        build_context = cls._get_build_context(build_context)
+        if cls.is_ignored_type(field_meta.annotation):
+            return None
+
+        if field_build_parameters is None and cls.should_set_none_value(field_meta=field_meta):
+            return None
+
+        if not field_meta.required and create_random_boolean(cls.__random__):
+            return Null
+
+        unwrapped_annotation = unwrap_annotation(field_meta.annotation)
+        unwrapped_annotation = cls._resolve_forward_references(unwrapped_annotation)
+
+        if is_literal(annotation=unwrapped_annotation) and (literal_args := get_args(unwrapped_annotation)):
+            return cls.__random__.choice(literal_args)
+
+        if isinstance(unwrapped_annotation, EnumMeta):
+            return cls.__random__.choice(list(unwrapped_annotation))
+
+        if field_meta.constraints:
+            return cls.get_constrained_field_value(
+                annotation=unwrapped_annotation,
+                field_meta=field_meta,
+                field_build_parameters=field_build_parameters,
+                build_context=build_context,
+            )
+
+        if (is_union(unwrapped_annotation) or is_union(field_meta.annotation)) and field_meta.children:
+            seen_models = build_context["seen_models"]
+            children = [child for child in field_meta.children if child.annotation not in seen_models]
+
+            # `None` is removed from the children when creating FieldMeta so when `children`
+            # is empty, it must mean that the field meta is an optional type.
+            if not children:
+                return None
+
+            return cls.get_field_value(cls.__random__.choice(children), field_build_parameters, build_context)
+
+        provider_map = cls._get_cached_provider_map()
+        if provider := (provider_map.get(field_meta.annotation) or provider_map.get(unwrapped_annotation)):
+            if (profiler := BaseFactory._profiler) is not None:
+                provider = profiler.wrap("provider", cls.__name__, _get_type_name(unwrapped_annotation), provider)
+            return provider()
+
+        if BaseFactory.is_factory_type(annotation=unwrapped_annotation):
+            if not field_build_parameters and unwrapped_annotation in build_context["seen_models"]:
+                return None if is_optional(field_meta.annotation) else Null
+
+            return cls._get_or_create_factory(model=unwrapped_annotation).build(
+                _build_context=build_context,
+                **(field_build_parameters if isinstance(field_build_parameters, Mapping) else {}),
+            )
+
+        if BaseFactory.is_batch_factory_type(annotation=unwrapped_annotation):
+            factory = cls._get_or_create_factory(model=field_meta.type_args[0])
+            if isinstance(field_build_parameters, Sequence):
+                return [
+                    factory.build(_build_context=build_context, **field_parameters)
+                    for field_parameters in field_build_parameters
+                ]
+
+            if field_meta.type_args[0] in build_context["seen_models"]:
+                return []
+
+            if not cls.__randomize_collection_length__:
+                return [factory.build(_build_context=build_context)]
+
+            batch_size = cls.__random__.randint(cls.__min_collection_length__, cls.__max_collection_length__)
+            return factory.batch(size=batch_size, _build_context=build_context)
+
+        if (origin := get_type_origin(unwrapped_annotation)) and is_safe_subclass(origin, Collection):
+            collection_type = get_collection_type(unwrapped_annotation)
+            is_fixed_length = collection_type is tuple and (
+                not field_meta.children or field_meta.children[-1].annotation != Ellipsis
+            )
+            if cls.__randomize_collection_length__ and not is_fixed_length:
+                if collection_type is not dict:
+                    return handle_constrained_collection(
+                        collection_type=collection_type,  # type: ignore[type-var]
+                        factory=cls,
+                        item_type=Any,
+                        field_meta=field_meta.children[0] if field_meta.children else field_meta,
+                        min_items=cls.__min_collection_length__,
+                        max_items=cls.__max_collection_length__,
+                        field_build_parameters=field_build_parameters,
+                        build_context=build_context,
+                    )
+                return handle_constrained_mapping(
+                    factory=cls,
+                    field_meta=field_meta,
+                    min_items=cls.__min_collection_length__,
+                    max_items=cls.__max_collection_length__,
+                    field_build_parameters=field_build_parameters,
+                    build_context=build_context,
+                )
+
+            return handle_collection_type(
+                field_meta,
+                origin,
+                cls,
+                field_build_parameters=field_build_parameters,
+                build_context=build_context,
+            )
+
+        if is_type_var(unwrapped_annotation):
+            return create_random_string(cls.__random__, min_length=1, max_length=10)
+
+        if callable(unwrapped_annotation):
+            # if value is a callable we can try to naively call it.
+            # this will work for callables that do not require any parameters passed
+            with suppress(Exception):
+                return unwrapped_annotation()
+
+        msg = (
+            f"Unsupported type: {unwrapped_annotation!r} on field '{field_meta.name}' from class {cls.__name__}."
+            "\n\nEither use 'add_provider', extend the providers map, or add a factory function for the field on the model."
+        )
+
+        raise ParameterException(
+            msg,
+        )
+
+    @classmethod
+    def get_field_value_coverage(  # noqa: C901,PLR0912
+        cls,
+        field_meta: FieldMeta,
+        field_build_parameters: Any | None = None,
+        build_context: BuildContext | None = None,
+    ) -> Iterable[Any]:
+        """Return a field value on the subclass if existing, otherwise returns a mock value.
+
+        :param field_meta: FieldMeta instance.
+        :param field_build_parameters: Any build parameters passed to the factory as kwarg values.
+        :param build_context: BuildContext data for current build.
+
+        :returns: An iterable of values.
+
+        """
+        if cls.is_ignored_type(field_meta.annotation):
+            return
+
+        if not field_meta.required:
+            yield Null
+
+        for unwrapped_annotation in flatten_annotation(field_meta.annotation):
+            unwrapped_annotation = cls._resolve_forward_references(unwrapped_annotation)  # noqa: PLW2901
+
+            unwrapped_annotation_meta = field_meta
+            if is_union(field_meta.annotation):
+                unwrapped_annotation_meta = next(
+                    (meta for meta in (field_meta.children or []) if meta.annotation == unwrapped_annotation),
+                    field_meta,
+                )
+            if unwrapped_annotation in (None, NoneType):
+                yield None
+
+            elif is_literal(annotation=unwrapped_annotation) and (literal_args := get_args(unwrapped_annotation)):
+                yield CoverageContainer(literal_args)
+
+            elif isinstance(unwrapped_annotation, EnumMeta):
+                yield CoverageContainer(list(unwrapped_annotation))
+
+            elif unwrapped_annotation_meta.constraints:
+                yield CoverageContainerCallable(
+                    cls.get_constrained_field_value,
+                    annotation=unwrapped_annotation,
+                    field_meta=unwrapped_annotation_meta,
+                )
+
+            elif provider := (
+                (provider_map := cls._get_cached_provider_map()).get(field_meta.annotation)
+                or provider_map.get(unwrapped_annotation)
+            ):
+                yield CoverageContainerCallable(provider)
+
+            elif BaseFactory.is_factory_type(annotation=unwrapped_annotation):
+                yield CoverageContainer(
+                    cls._get_or_create_factory(model=unwrapped_annotation).coverage(
+                        _build_context=build_context,
+                        **(field_build_parameters if isinstance(field_build_parameters, Mapping) else {}),
+                    ),
+                )
+
+            elif (origin := get_type_origin(unwrapped_annotation)) and issubclass(origin, Collection):
+                if not field_meta.children:
+                    msg = "A subclass of Collection should always have children in its field_meta"
+                    raise ParameterException(msg)
+
+                # We actually want to use the parent in cases where the collection is the parent
+                # such as tuple so default to the parent if this annotation is not present in the children
+                child_meta = next(
+                    (meta for meta in field_meta.children if meta.annotation == unwrapped_annotation),
+                    field_meta,
+                )
+
+                yield handle_collection_type_coverage(child_meta, origin, cls, build_context=build_context)
+
+            elif is_type_var(unwrapped_annotation):
+                yield create_random_string(cls.__random__, min_length=1, max_length=10)
+
+            elif callable(unwrapped_annotation):
+                # if value is a callable we can try to naively call it.
+                # this will work for callables that do not require any parameters passed
+                yield CoverageContainerCallable(unwrapped_annotation)
+            else:
+                msg = f"Unsupported type: {unwrapped_annotation!r}\n\nEither extend the providers map or add a factory function for this type."
+                raise ParameterException(
+                    msg,
+                )
+
+    @classmethod
+    def _resolve_forward_references(cls, annotation: Any) -> Any:
+        """Resolve forward references in the factory's model."""
+        if not cls.__forward_references__:
+            return annotation
+
+        if is_forward_ref(annotation):
+            return cls.__forward_references__.get(annotation.__forward_arg__, annotation)
+
+        # This is a workaround when forward references are resolved to strings
+        if isinstance(annotation, str):
+            return cls.__forward_references__.get(annotation, annotation)
+
+        return annotation
+
+    @classmethod
+    def should_set_none_value(cls, field_meta: FieldMeta) -> bool:
+        """Determine whether a given model field_meta should be set to None.
+
+        :param field_meta: Field metadata.
+
+        :notes:
+            - This method is distinct to allow overriding.
+
+        :returns: A boolean determining whether 'None' should be set for the given field_meta.
+
+        """
+        return (
+            cls.__allow_none_optionals__
+            and is_optional(field_meta.annotation)
+            and create_random_boolean(random=cls.__random__)
+        )
+
+    @classmethod
+    def should_use_default_value(cls, field_meta: FieldMeta) -> bool:
+        """Determine whether to use the default value for the given field.
+
+        :param field_meta: FieldMeta instance.
+
+        :notes:
+            - This method is distinct to allow overriding.
+
+        :returns: A boolean determining whether the default value should be used for the given field_meta.
+
+        """
+        return cls.__use_defaults__ and field_meta.default is not Null
+
+    @classmethod
+    def should_set_field_value(cls, field_meta: FieldMeta, **kwargs: Any) -> bool:
+        """Determine whether to set a value for a given field_name.
+
+        :param field_meta: FieldMeta instance.
+        :param kwargs: Any kwargs passed to the factory.
+
+        :notes:
+            - This method is distinct to allow overriding.
+
+        :returns: A boolean determining whether a value should be set for the given field_meta.
+
+        """
+        return not field_meta.name.startswith("_") and field_meta.name not in kwargs
+
+    @classmethod
+    @abstractmethod
+    def get_model_fields(cls) -> list[FieldMeta]:  # pragma: no cover
+        """Retrieve a list of fields from the factory's model.
+
+        :notes:
+            - Implementations are expected to cache the result with '_get_cached_model_fields', which is cleared by
+              'reset_field_cache'.
+
+        :returns: A list of field MetaData instances.
+
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def _get_cached_model_fields(cls, create_model_fields: Callable[[], list[FieldMeta]]) -> list[FieldMeta]:
+        """Return the cached model fields of the factory, creating them on first use or when they became stale.
+
+        :param create_model_fields: A callable introspecting the factory's model and returning its fields.
+
+        :notes:
+            - The fields are created again when the value returned by '_get_field_cache_key' changes.
+
+        :returns: A list of field MetaData instances.
+        """
+        key = cls._get_field_cache_key()
+        cached: tuple[Hashable, list[FieldMeta]] | None = cls.__dict__.get("_fields_metadata")
+        if cached is None or cached[0] != key:
+            cached = (key, create_model_fields())
+            cls._fields_metadata = cached
+        return cached[1]
+
+    @classmethod
+    def _get_field_cache_key(cls) -> Hashable:
+        """Return the configuration of the factory which its model fields depend on.
+
+        :notes:
+            - This method is meant to be overwritten by factories whose model fields depend on their configuration.
+
+        :returns: A hashable value.
+        """
+        return None
+
+    @classmethod
+    def reset_field_cache(cls) -> None:
+        """Clear the cached model fields of the factory and of its subclasses.
+
+        This should be called when the model of a factory is modified at runtime. Calling it on 'BaseFactory'
+        clears the caches of all factories, including dynamically created ones.
+
+        :returns: None
+        """
+        pending = [cls]
+        while pending:
+            factory = pending.pop()
+            for attribute in ("_fields_metadata", "_build_plan"):
+                if attribute in factory.__dict__:
+                    delattr(factory, attribute)
+            pending.extend(factory.__subclasses__())
+
+    @classmethod
+    def get_factory_fields(cls) -> list[tuple[str, Any]]:
+        """Retrieve a list of fields from the factory.
+
+        Trying to be smart about what should be considered a field on the model,
+        ignoring dunder methods and some parent class attributes.
+
+        :returns: A list of tuples made of field name and field definition
+        """
+        factory_fields = cls.__dict__.items()
+        return [
+            (field_name, field_value)
+            for field_name, field_value in factory_fields
+            if not (field_name.startswith("__") or field_name == "_abc_impl")
+        ]
+
+    @classmethod
+    def _check_declared_fields_exist_in_model(cls) -> None:
+        model_fields_names = {field_meta.name for field_meta in cls.get_model_fields()}
+        factory_fields = cls.get_factory_fields()
+
+        for field_name, field_value in factory_fields:
+            if field_name in model_fields_names:
+                continue
+
+            error_message = (
+                f"{field_name} is declared on the factory {cls.__name__}"
+                f" but it is not part of the model {cls.__model__.__name__}"
+            )
+            if isinstance(field_value, (Use, PostGenerated, Ignore, Require)):
+                raise ConfigurationException(error_message)
+
+    @classmethod
+    def process_kwargs(cls, **kwargs: Any) -> dict[str, Any]:  # noqa: C901
+        """Process the given kwargs and generate values for the factory's model.
+
+        :param kwargs: Any build kwargs.
+
+        :returns: A dictionary of build results.
+
+        """
+        result, generate_post, _build_context = cls._get_initial_variables(kwargs)
+        build_plan = cls._get_build_plan()
+        overrides = build_plan.overrides
+        profiler = BaseFactory._profiler
+
+        for field_meta, generate_field_value in build_plan.fields:
+            field_build_parameters = cls.extract_field_build_parameters(field_meta=field_meta, build_args=kwargs)
+            if cls.should_set_field_value(
+                field_meta, _build_context=_build_context, **kwargs
+            ) and not cls.should_use_default_value(field_meta):
+                if (override := overrides.get(field_meta.name)) is not None:
+                    if override.kind == "ignore":
+                        continue
+
+                    if override.kind == "require" and field_meta.name not in kwargs:
+                        msg = f"Require kwarg {field_meta.name} is missing"
+                        raise MissingBuildKwargException(msg)
+
+                    if override.kind == "post_generated":
+                        generate_post[field_meta.name] = override.value
+                        continue
+
+                    result[field_meta.name] = cast("FieldValueGenerator", override.generate)(
+                        field_build_parameters, _build_context
+                    )
+                    continue
+
+                field_result = generate_field_value(field_build_parameters, _build_context)
+                if field_result is Null:
+                    continue
+
+                result[field_meta.name] = field_result
+
+        for field_name, post_generator in generate_post.items():
+            if profiler is not None:
+                with profiler.measure("post_generated", cls.__name__, field_name):
+                    result[field_name] = post_generator.to_value(field_name, result)
+                continue
+            result[field_name] = post_generator.to_value(field_name, result)
+
+        if cls.__unique__:
+            cls._ensure_unique(result, kwargs, _build_context, generate_post)
+
+        return result
+
+    @classmethod
+    def process_kwargs_coverage(cls, **kwargs: Any) -> abc.Iterable[dict[str, Any]]:
+        """Process the given kwargs and generate values for the factory's model.
+
+        :param kwargs: Any build kwargs.
+        :param build_context: BuildContext data for current build.
+
+        :returns: A dictionary of build results.
+
+        """
+        result, generate_post, _build_context = cls._get_initial_variables(kwargs)
+        if (random_scope := active_random_scope.get()) is not None and cls not in random_scope.factories:
+            cls._join_random_scope(random_scope)
+
+        for field_meta in cls.get_model_fields():
+            field_build_parameters = cls.extract_field_build_parameters(field_meta=field_meta, build_args=kwargs)
+
+            if cls.should_set_field_value(field_meta, _build_context=_build_context, **kwargs):
+                if hasattr(cls, field_meta.name) and not hasattr(BaseFactory, field_meta.name):
+                    field_value = getattr(cls, field_meta.name)
+                    if isinstance(field_value, Ignore):
+                        continue
+
+                    if isinstance(field_value, Require) and field_meta.name not in kwargs:
+                        msg = f"Require kwarg {field_meta.name} is missing"
+                        raise MissingBuildKwargException(msg)
+
+                    if isinstance(field_value, PostGenerated):
+                        generate_post[field_meta.name] = field_value
+                        continue
+
+                    result[field_meta.name] = cls._handle_factory_field_coverage(
+                        field_value=field_value,
+                        field_build_parameters=field_build_parameters,
+                        build_context=_build_context,
+                    )
+                    continue
+
+                result[field_meta.name] = CoverageContainer(
+                    cls.get_field_value_coverage(
+                        field_meta,
+                        field_build_parameters=field_build_parameters,
+                        build_context=_build_context,
+                    ),
+                )
+
+        for resolved in resolve_kwargs_coverage(result):
+            for field_name, post_generator in generate_post.items():
+                resolved[field_name] = post_generator.to_value(field_name, resolved)
+            yield resolved
+
+    @classmethod
+    def build(cls, *_: Any, **kwargs: Any) -> T:
+        """Build an instance of the factory's __model__
+
+        :param kwargs: Any kwargs. If field names are set in kwargs, their values will be used.
+
+        :returns: An instance of type T.
+
+        """
+        if "_build_context" not in kwargs:
+            kwargs["_build_context"] = cls._get_build_context(None)
+
+        if BaseFactory._profiler is not None:
+            return cls._build_profiled(BaseFactory._profiler, **kwargs)
+
+        return cls._create_result(kwargs["_build_context"], cls.process_kwargs(**kwargs))
 
-        if (is_union(unwrapped_annotation) or is_union(field_meta.annotation)) and field_meta.children:
-            seen_models = build_context["seen_models"]
-            children = [child for child in field_meta.children if child.annotation not in seen_models]
+    @classmethod
+    def batch(cls, size: int, **kwargs: Any) -> list[T]:
+        """Build a batch of size n of the factory's Meta.model.
 
-            # `None` is removed from the children when creating FieldMeta so when `children`
-            # is empty, it must mean that the field meta is an optional type.
-            if not children:
-                return None
+        :param size: Size of the batch.
+        :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
 
-            return cls.get_field_value(cls.__random__.choice(children), field_build_parameters, build_context)
+        :notes:
+            - The kwargs are processed once for the whole batch. If '__columnar_batch__' is set, the values are
+              generated field by field for the whole batch.
 
-        provider_map = cls.get_provider_map()
-        if provider := (provider_map.get(field_meta.annotation) or provider_map.get(unwrapped_annotation)):
-            return provider()
+        :returns: A list of instances of type T.
 
-        if BaseFactory.is_factory_type(annotation=unwrapped_annotation):
-            if not field_build_parameters and unwrapped_annotation in build_context["seen_models"]:
-                return None if is_optional(field_meta.annotation) else Null
+        """
+        kwargs["_build_context"] = cls._get_unique_build_context(kwargs.get("_build_context"))
+        if not cls._supports_batch_engine():
+            return [cls.build(**kwargs) for _ in range(size)]
 
-            return cls._get_or_create_factory(model=unwrapped_annotation).build(
-                _build_context=build_context,
-                **(field_build_parameters if isinstance(field_build_parameters, Mapping) else {}),
-            )
+        if BaseFactory._profiler is not None:
+            return cls._batch_profiled(BaseFactory._profiler, size, **kwargs)
 
-        if BaseFactory.is_batch_factory_type(annotation=unwrapped_annotation):
-            factory = cls._get_or_create_factory(model=field_meta.type_args[0])
-            if isinstance(field_build_parameters, Sequence):
-                return [
-                    factory.build(_build_context=build_context, **field_parameters)
-                    for field_parameters in field_build_parameters
-                ]
+        build_context = kwargs["_build_context"]
+        return [cls._create_result(build_context, values) for values in cls._process_kwargs_batch(size, **kwargs)]
 
-            if field_meta.type_args[0] in build_context["seen_models"]:
-                return []
+    @classmethod
+    def batch_parallel(
+        cls,
+        size: int,
+        workers: int | None = None,
+        seed: int | None = None,
+        shard_size: int = PARALLEL_SHARD_SIZE,
+        **kwargs: Any,
+    ) -> list[T]:
+        """Build a batch of size n of the factory's Meta.model using multiple processes.
 
-            if not cls.__randomize_collection_length__:
-                return [factory.build(_build_context=build_context)]
+        :param size: Size of the batch.
+        :param workers: The maximum number of worker processes. Defaults to the number of CPUs.
+        :param seed: The seed of the batch. Defaults to '__random_seed__', or to a seed drawn from '__random__'.
+        :param shard_size: The number of instances built by each worker task.
+        :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
 
-            batch_size = cls.__random__.randint(cls.__min_collection_length__, cls.__max_collection_length__)
-            return factory.batch(size=batch_size, _build_context=build_context)
+        :notes:
+            - The batch is split into shards of 'shard_size' instances, each built with a seed derived from the given
+              seed and the shard index. For a given seed and shard size, the result is the same regardless of the
+              number of workers.
+            - The factory, its model, the kwargs and the built instances are pickled to be exchanged with the
+              workers. Factories created with 'create_factory' are recreated in the workers.
 
-        if (origin := get_type_origin(unwrapped_annotation)) and is_safe_subclass(origin, Collection):
-            collection_type = get_collection_type(unwrapped_annotation)
-            is_fixed_length = collection_type is tuple and (
-                not field_meta.children or field_meta.children[-1].annotation != Ellipsis
-            )
-            if cls.__randomize_collection_length__ and not is_fixed_length:
-                if collection_type is not dict:
-                    return handle_constrained_collection(
-                        collection_type=collection_type,  # type: ignore[type-var]
-                        factory=cls,
-                        item_type=Any,
-                        field_meta=field_meta.children[0] if field_meta.children else field_meta,
-                        min_items=cls.__min_collection_length__,
-                        max_items=cls.__max_collection_length__,
-                        field_build_parameters=field_build_parameters,
-                        build_context=build_context,
-                    )
-                return handle_constrained_mapping(
-                    factory=cls,
-                    field_meta=field_meta,
-                    min_items=cls.__min_collection_length__,
-                    max_items=cls.__max_collection_length__,
-                    field_build_parameters=field_build_parameters,
-                    build_context=build_context,
-                )
+        :returns: A list of instances of type T.
 
-            return handle_collection_type(
-                field_meta,
-                origin,
-                cls,
-                field_build_parameters=field_build_parameters,
-                build_context=build_context,
-            )
+        """
+        return [
+            instance
+            for shard in cls._iter_parallel_shards(size, workers, seed, shard_size, kwargs)
+            for instance in shard
+        ]
 
-        if is_type_var(unwrapped_annotation):
-            return create_random_string(cls.__random__, min_length=1, max_length=10)
+    @classmethod
+    @contextmanager
+    def random_scope(cls, seed: int | None = None) -> abc.Iterator[None]:
+        """Generate values from independent Random and Faker streams for the duration of the context.
 
-        if callable(unwrapped_annotation):
-            # if value is a callable we can try to naively call it.
-            # this will work for callables that do not require any parameters passed
-            with suppress(Exception):
-                return unwrapped_annotation()
+        The scope is tracked with a context variable, so concurrent threads and asyncio tasks can each use their own
+        scope, and seeded scopes are reproducible regardless of how they interleave.
 
-        msg = (
-            f"Unsupported type: {unwrapped_annotation!r} on field '{field_meta.name}' from class {cls.__name__}."
-            "\n\nEither use 'add_provider', extend the providers map, or add a factory function for the field on the model."
-        )
+        :param seed: The seed of the streams. If None, they are seeded from the operating system.
 
-        raise ParameterException(
-            msg,
-        )
+        :notes:
+            - Every factory building values within the context, including sub-factories, draws from its own stream,
+              seeded with a seed derived from the seed of the scope and the name of the factory. The factories sharing
+              a Faker instance draw from a stream shared by them, the Faker is not copied.
+            - While a factory is part of a scope, every value it draws, including outside of the scope, e.g. in other
+              asyncio tasks, pays for a context variable lookup. Its Random and Faker instances are restored when the
+              last scope it is part of exits.
+
+        :returns: A context manager.
+        """
+        scope = RandomScope(seed)
+        token = active_random_scope.set(scope)
+        try:
+            yield
+        finally:
+            active_random_scope.reset(token)
+            with BaseFactory._registry_lock:
+                scope.closed = True
+                factories = list(scope.factories)
+            for factory in factories:
+                factory._exit_random_scope()
 
     @classmethod
-    def get_field_value_coverage(  # noqa: C901,PLR0912
-        cls,
-        field_meta: FieldMeta,
-        field_build_parameters: Any | None = None,
-        build_context: BuildContext | None = None,
-    ) -> Iterable[Any]:
-        """Return a field value on the subclass if existing, otherwise returns a mock value.
+    @contextmanager
+    def unique_scope(cls) -> abc.Iterator[None]:
+        """Enforce the '__unique__' declarations of the factories across all the builds within the context.
 
-        :param field_meta: FieldMeta instance.
-        :param field_build_parameters: Any build parameters passed to the factory as kwarg values.
-        :param build_context: BuildContext data for current build.
+        Example:
 
-        :returns: An iterable of values.
+            .. code-block:: python
+
+                with UserFactory.unique_scope():
+                    admins = UserFactory.batch(10, role="admin")
+                    users = [UserFactory.build() for _ in range(100)]
+
+        :notes:
+            - Batches and streams are unique scopes of their own. Within a 'unique_scope' block, they share the scope
+              of the block instead.
+            - The scope is tracked with a context variable, so concurrent threads and asyncio tasks each use their own
+              scope. Nested blocks share the scope of the outermost block.
 
+        :returns: A context manager.
         """
-        if cls.is_ignored_type(field_meta.annotation):
+        if active_unique_scope.get() is not None:
+            yield
             return
 
-        if not field_meta.required:
-            yield Null
+        token = active_unique_scope.set(UniqueScope())
+        try:
+            yield
+        finally:
+            active_unique_scope.reset(token)
 
-        for unwrapped_annotation in flatten_annotation(field_meta.annotation):
-            unwrapped_annotation = cls._resolve_forward_references(unwrapped_annotation)  # noqa: PLW2901
+    @classmethod
+    def build_at(cls, index: int, seed: int | None = None, **kwargs: Any) -> T:
+        """Build the instance at the given index of the factory's seeded sequence of instances.
 
-            unwrapped_annotation_meta = field_meta
-            if is_union(field_meta.annotation):
-                unwrapped_annotation_meta = next(
-                    (meta for meta in (field_meta.children or []) if meta.annotation == unwrapped_annotation),
-                    field_meta,
-                )
-            if unwrapped_annotation in (None, NoneType):
-                yield None
+        The instance is built with a seed derived from the given seed, the factory and the index, so it can be built
+        without building the preceding instances.
 
-            elif is_literal(annotation=unwrapped_annotation) and (literal_args := get_args(unwrapped_annotation)):
-                yield CoverageContainer(literal_args)
+        :param index: The index of the instance.
+        :param seed: The seed of the sequence. Defaults to '__random_seed__'.
+        :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
 
-            elif isinstance(unwrapped_annotation, EnumMeta):
-                yield CoverageContainer(list(unwrapped_annotation))
+        :notes:
+            - The instance is built in a 'random_scope', so the state of the random instances of the factory and its
+              sub-factories is neither used nor affected.
 
-            elif unwrapped_annotation_meta.constraints:
-                yield CoverageContainerCallable(
-                    cls.get_constrained_field_value,
-                    annotation=unwrapped_annotation,
-                    field_meta=unwrapped_annotation_meta,
-                )
+        :returns: An instance of type T.
 
-            elif provider := (
-                (provider_map := cls.get_provider_map()).get(field_meta.annotation)
-                or provider_map.get(unwrapped_annotation)
-            ):
-                yield CoverageContainerCallable(provider)
+        """
+        if index < 0:
+            msg = "index must be greater than or equal to 0"
+            raise ParameterException(msg)
 
-            elif BaseFactory.is_factory_type(annotation=unwrapped_annotation):
-                yield CoverageContainer(
-                    cls._get_or_create_factory(model=unwrapped_annotation).coverage(
-                        _build_context=build_context,
-                        **(field_build_parameters if isinstance(field_build_parameters, Mapping) else {}),
-                    ),
-                )
+        instance_seed = derive_seed(cls._resolve_seed(seed), f"{cls.__module__}.{cls.__qualname__}", index)
+        with cls.random_scope(instance_seed):
+            return cls.build(**kwargs)
 
-            elif (origin := get_type_origin(unwrapped_annotation)) and issubclass(origin, Collection):
-                if not field_meta.children:
-                    msg = "A subclass of Collection should always have children in its field_meta"
-                    raise ParameterException(msg)
+    @classmethod
+    def lazy_batch(cls, size: int, seed: int | None = None, **kwargs: Any) -> LazyBatch[T]:
+        """Return a batch of size n of the factory's Meta.model, whose instances are built when accessed.
 
-                # We actually want to use the parent in cases where the collection is the parent
-                # such as tuple so default to the parent if this annotation is not present in the children
-                child_meta = next(
-                    (meta for meta in field_meta.children if meta.annotation == unwrapped_annotation),
-                    field_meta,
-                )
+        :param size: Size of the batch.
+        :param seed: The seed of the batch. Defaults to '__random_seed__'.
+        :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
 
-                yield handle_collection_type_coverage(child_meta, origin, cls, build_context=build_context)
+        :returns: A sequence of instances of type T, built with 'build_at'.
 
-            elif is_type_var(unwrapped_annotation):
-                yield create_random_string(cls.__random__, min_length=1, max_length=10)
+        """
+        if size < 0:
+            msg = "size must be greater than or equal to 0"
+            raise ParameterException(msg)
 
-            elif callable(unwrapped_annotation):
-                # if value is a callable we can try to naively call it.
-                # this will work for callables that do not require any parameters passed
-                yield CoverageContainerCallable(unwrapped_annotation)
-            else:
-                msg = f"Unsupported type: {unwrapped_annotation!r}\n\nEither extend the providers map or add a factory function for this type."
-                raise ParameterException(
-                    msg,
-                )
+        return LazyBatch(cls, size, cls._resolve_seed(seed), kwargs)
 
     @classmethod
-    def _resolve_forward_references(cls, annotation: Any) -> Any:
-        """Resolve forward references in the factory's model."""
-        if not cls.__forward_references__:
-            return annotation
+    def stream(cls, size: int | None = None, **kwargs: Any) -> abc.Iterator[T]:
+        """Build instances of the factory's __model__ lazily, one at a time.
 
-        if is_forward_ref(annotation):
-            return cls.__forward_references__.get(annotation.__forward_arg__, annotation)
+        :param size: The number of instances to build. If None, the iterator is infinite.
+        :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
 
-        # This is a workaround when forward references are resolved to strings
-        if isinstance(annotation, str):
-            return cls.__forward_references__.get(annotation, annotation)
+        :returns: An iterator of instances of type T.
 
-        return annotation
+        """
+        if size is not None and size < 0:
+            msg = "size must be greater than or equal to 0"
+            raise ParameterException(msg)
+
+        kwargs["_build_context"] = cls._get_unique_build_context(kwargs.get("_build_context"))
+
+        def generate() -> abc.Iterator[T]:
+            count = 0
+            while size is None or count < size:
+                yield cls.build(**kwargs)
+                count += 1
+
+        return generate()
 
     @classmethod
-    def should_set_none_value(cls, field_meta: FieldMeta) -> bool:
-        """Determine whether a given model field_meta should be set to None.
+    def iter_batches(cls, total: int, chunk_size: int, **kwargs: Any) -> abc.Iterator[list[T]]:
+        """Build a total of n instances of the factory's __model__ lazily, in batches of chunk_size.
 
-        :param field_meta: Field metadata.
+        Only one batch is held in memory at a time, so the batches can be passed on to e.g. a persistence handler's
+        'save_many' as they are built.
 
-        :notes:
-            - This method is distinct to allow overriding.
+        :param total: The total number of instances to build.
+        :param chunk_size: The maximum size of each batch. Only the last batch can be smaller.
+        :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
 
-        :returns: A boolean determining whether 'None' should be set for the given field_meta.
+        :returns: An iterator of lists of instances of type T.
 
         """
-        return (
-            cls.__allow_none_optionals__
-            and is_optional(field_meta.annotation)
-            and create_random_boolean(random=cls.__random__)
-        )
+        if total < 0:
+            msg = "total must be greater than or equal to 0"
+            raise ParameterException(msg)
+
+        if chunk_size < 1:
+            msg = "chunk_size must be greater than 0"
+            raise ParameterException(msg)
+
+        kwargs["_build_context"] = cls._get_unique_build_context(kwargs.get("_build_context"))
+
+        def generate() -> abc.Iterator[list[T]]:
+            for offset in range(0, total, chunk_size):
+                yield cls.batch(min(chunk_size, total - offset), **kwargs)
+
+        return generate()
 
     @classmethod
-    def should_use_default_value(cls, field_meta: FieldMeta) -> bool:
-        """Determine whether to use the default value for the given field.
+    def prototype(cls, vary: Collection[str] = (), **kwargs: Any) -> Prototype[T]:
+        """Build an instance of the factory's __model__ to be cloned, generating new values only for the given fields.
 
-        :param field_meta: FieldMeta instance.
+        Example:
+
+            .. code-block:: python
+
+                prototype = PersonFactory.prototype(vary=["id", "email"], country="FR")
+                people = prototype.batch(10_000)
+
+        :param vary: The names of the fields whose values are generated for each clone.
+        :param kwargs: Any kwargs. If field names are set in kwargs, their values will be used.
 
         :notes:
-            - This method is distinct to allow overriding.
+            - The clones are shallow copies, the values of the fields that do not vary are shared between the clones.
+            - The values of the varying fields are set without running the model's validation, where the model supports
+              copies with changes, e.g. pydantic's 'model_copy'.
+            - PostGenerated fields depending on varying fields must vary as well to be recomputed.
 
-        :returns: A boolean determining whether the default value should be used for the given field_meta.
+        :raises ParameterException: If a varying field is not a field of the model, is set in kwargs, or is declared as
+            Ignore or Require on the factory.
 
+        :returns: A Prototype instance.
         """
-        return cls.__use_defaults__ and field_meta.default is not Null
+        if cls._pending_init:
+            cls._initialize_pending()
+
+        vary = tuple(vary)
+        field_names = {field_meta.name for field_meta in cls.get_model_fields()}
+        overrides = cls._get_build_plan().overrides
+        for name in vary:
+            if name not in field_names:
+                msg = f"{name!r} is not a field of {cls.__model__.__name__}"
+                raise ParameterException(msg)
+            if name in kwargs:
+                msg = f"{name!r} cannot both vary and be set in kwargs"
+                raise ParameterException(msg)
+            if name in overrides and overrides[name].kind in ("ignore", "require"):
+                msg = f"{name!r} is declared as {type(overrides[name].value).__name__} and cannot vary"
+                raise ParameterException(msg)
+
+        build_context = cls._get_build_context(kwargs.pop("_build_context", None))
+        values = cls.process_kwargs(_build_context=build_context, **kwargs)
+        return Prototype(cls, cls._create_model(build_context, **values), values, vary)
 
     @classmethod
-    def should_set_field_value(cls, field_meta: FieldMeta, **kwargs: Any) -> bool:
-        """Determine whether to set a value for a given field_name.
-
-        :param field_meta: FieldMeta instance.
-        :param kwargs: Any kwargs passed to the factory.
+    def _describe_for_snapshot(cls, descriptions: list[str], seen: set[type[Any]]) -> None:
+        """Describe everything the values generated by the factory depend on, besides the seed and the kwargs.
 
-        :notes:
-            - This method is distinct to allow overriding.
+        The models of the nested factories are described as well.
 
-        :returns: A boolean determining whether a value should be set for the given field_meta.
+        :param descriptions: The list to append the descriptions to.
+        :param seen: The models already described.
 
+        :returns: None
         """
-        return not field_meta.name.startswith("_") and field_meta.name not in kwargs
+        from polyfactory.snapshot_cache import describe  # noqa: PLC0415
+
+        seen.add(cls.__model__)
+        build_plan = cls._get_build_plan()
+        descriptions.append(f"factory {describe(cls)} model {describe(cls.__model__)}")
+        descriptions.extend(
+            f"config {key} {describe(cls.__faker__.locales if key == '__faker__' else getattr(cls, key))}"
+            for key in cls.__config_keys__
+            if key != "__random__"
+        )
+        descriptions.append(f"providers {describe(cls._get_cached_provider_map())}")
+        descriptions.append(f"unique {describe(cls.__unique__)} retries {cls.__unique_retries__}")
+
+        nested: list[type[Any]] = []
+        for field_meta in cls.get_model_fields():
+            descriptions.append(f"field {describe(field_meta)} {describe(getattr(field_meta, '__dict__', {}))}")
+            override = build_plan.overrides.get(field_meta.name)
+            if override is not None:
+                descriptions.append(f"override {field_meta.name} {override.kind} {describe(override.value)}")
+                if is_safe_subclass(override.value, BaseFactory) and override.value.__model__ not in seen:
+                    override.value._describe_for_snapshot(descriptions, seen)
+
+            annotations = [field_meta.annotation]
+            while annotations:
+                annotation = annotations.pop()
+                for flat in flatten_annotation(annotation):
+                    if isinstance(flat, type) and flat not in seen and BaseFactory.is_factory_type(flat):
+                        nested.append(flat)
+                    annotations.extend(unwrap_args(flat))
+
+        for model in nested:
+            if model not in seen:
+                cls._get_or_create_factory(model)._describe_for_snapshot(descriptions, seen)
 
     @classmethod
-    @abstractmethod
-    def get_model_fields(cls) -> list[FieldMeta]:  # pragma: no cover
-        """Retrieve a list of fields from the factory's model.
+    def _get_snapshot_fingerprint(cls) -> str:
+        """Return a fingerprint of everything the values generated by the factory depend on, besides the seed and the
+        kwargs.
 
-        :returns: A list of field MetaData instances.
+        The fingerprint is computed again when the build plan is recompiled.
 
+        :returns: A hexadecimal digest.
         """
-        raise NotImplementedError
+        build_plan = cls._get_build_plan()
+        cached: tuple[BuildPlan, str] | None = cls.__dict__.get("_snapshot_fingerprint")
+        if cached is not None and cached[0] is build_plan:
+            return cached[1]
+
+        descriptions: list[str] = []
+        cls._describe_for_snapshot(descriptions, set())
+        fingerprint = hashlib.sha256("\n".join(descriptions).encode()).hexdigest()
+        cls._snapshot_fingerprint = (build_plan, fingerprint)
+        return fingerprint
 
     @classmethod
-    def get_factory_fields(cls) -> list[tuple[str, Any]]:
-        """Retrieve a list of fields from the factory.
+    def cached_batch(
+        cls,
+        size: int,
+        seed: int | None = None,
+        cache: SnapshotCache | None = None,
+        **kwargs: Any,
+    ) -> list[T]:
+        """Build a seeded batch of size n of the factory's __model__, generating its values once and caching them on disk.
 
-        Trying to be smart about what should be considered a field on the model,
-        ignoring dunder methods and some parent class attributes.
+        The generated values are stored in a snapshot cache, keyed by a fingerprint of the factory, its model fields,
+        the values declared on the factory, its provider map and configuration, the models of its nested factories,
+        the seed and the kwargs. Later calls with the same key, e.g. on later runs of a test suite, load the values
+        instead of generating them, and only create the model instances.
 
-        :returns: A list of tuples made of field name and field definition
-        """
-        factory_fields = cls.__dict__.items()
-        return [
-            (field_name, field_value)
-            for field_name, field_value in factory_fields
-            if not (field_name.startswith("__") or field_name == "_abc_impl")
-        ]
+        :param size: Size of the batch.
+        :param seed: The seed of the batch. Defaults to '__random_seed__'.
+        :param cache: The snapshot cache. Defaults to a cache in the directory set by the 'POLYFACTORY_CACHE_DIR'
+            environment variable, or in '.polyfactory_cache' in the working directory.
+        :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
+
+        :notes:
+            - The batch is built in a 'random_scope', so the state of the factory's random instances is not affected.
+            - Functions, such as the ones of 'Use' fields and providers, are fingerprinted by their code, not by the
+              values they return. Functions whose return values change without their code changing, e.g. reading a
+              file, may need the cache to be cleared.
+            - The values must be picklable to be cached, a warning is emitted otherwise.
+
+        :raises ConfigurationException: If the factory overrides 'build' or 'process_kwargs'.
 
-    @classmethod
-    def _check_declared_fields_exist_in_model(cls) -> None:
-        model_fields_names = {field_meta.name for field_meta in cls.get_model_fields()}
-        factory_fields = cls.get_factory_fields()
+        :returns: A list of instances of type T.
+        """
+        from polyfactory.snapshot_cache import SnapshotCache, describe, describe_versions  # noqa: PLC0415
 
-        for field_name, field_value in factory_fields:
-            if field_name in model_fields_names:
-                continue
+        if not cls._supports_batch_engine():
+            msg = f"{cls.__name__} overrides 'build' or 'process_kwargs', its batches cannot be cached"
+            raise ConfigurationException(msg)
 
-            error_message = (
-                f"{field_name} is declared on the factory {cls.__name__}"
-                f" but it is not part of the model {cls.__model__.__name__}"
-            )
-            if isinstance(field_value, (Use, PostGenerated, Ignore, Require)):
-                raise ConfigurationException(error_message)
+        seed = cls._resolve_seed(seed)
+        if cache is None:
+            cache = SnapshotCache()
+
+        key = hashlib.sha256(
+            "\n".join(
+                (
+                    describe_versions("polyfactory", "faker"),
+                    cls._get_snapshot_fingerprint(),
+                    f"size {size} seed {seed}",
+                    f"kwargs {describe({key: value for key, value in kwargs.items() if key != '_build_context'})}",
+                )
+            ).encode()
+        ).hexdigest()
+
+        build_context = cls._get_unique_build_context(kwargs.pop("_build_context", None))
+        batch_values: list[dict[str, Any]] | None = cache.get(key)
+        if batch_values is None:
+            with cls.random_scope(seed):
+                batch_values = cls._process_kwargs_batch(size, _build_context=build_context, **kwargs)
+            try:
+                cache.set(key, batch_values)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                warnings.warn(f"the values of {cls.__name__} cannot be cached: {e}", UserWarning, stacklevel=2)
+
+        return [cls._create_result(build_context, values) for values in batch_values]
 
     @classmethod
-    def process_kwargs(cls, **kwargs: Any) -> dict[str, Any]:
-        """Process the given kwargs and generate values for the factory's model.
+    def _get_dict_build_context(cls, kwargs: dict[str, Any]) -> BuildContext:
+        """Return a copy of the build context of the given kwargs, set to build dicts.
 
         :param kwargs: Any build kwargs.
 
-        :returns: A dictionary of build results.
-
+        :returns: BuildContext
         """
-        result, generate_post, _build_context = cls._get_initial_variables(kwargs)
+        build_context = cls._get_build_context(kwargs.get("_build_context"))
+        build_context["as_dict"] = True
+        return build_context
 
-        for field_meta in cls.get_model_fields():
-            field_build_parameters = cls.extract_field_build_parameters(field_meta=field_meta, build_args=kwargs)
-            if cls.should_set_field_value(
-                field_meta, _build_context=_build_context, **kwargs
-            ) and not cls.should_use_default_value(field_meta):
-                if hasattr(cls, field_meta.name) and not hasattr(BaseFactory, field_meta.name):
-                    field_value = getattr(cls, field_meta.name)
-                    if isinstance(field_value, Ignore):
-                        continue
+    @classmethod
+    def build_dict(cls, **kwargs: Any) -> dict[str, Any]:
+        """Generate the values of an instance of the factory's __model__, without creating the instance.
 
-                    if isinstance(field_value, Require) and field_meta.name not in kwargs:
-                        msg = f"Require kwarg {field_meta.name} is missing"
-                        raise MissingBuildKwargException(msg)
+        :param kwargs: Any kwargs. If field names are set in kwargs, their values will be used.
 
-                    if isinstance(field_value, PostGenerated):
-                        generate_post[field_meta.name] = field_value
-                        continue
+        :notes:
+            - The values are the kwargs the model would be created with, the model's validation is skipped.
+            - The values of fields built by factories, e.g. nested models, are dicts as well. Values returned by
+              providers or given as kwargs are left as is.
 
-                    result[field_meta.name] = cls._handle_factory_field(
-                        field_value=field_value,
-                        field_build_parameters=field_build_parameters,
-                        build_context=_build_context,
-                    )
-                    continue
+        :returns: A dictionary mapping field names to values.
 
-                field_result = cls.get_field_value(
-                    field_meta,
-                    field_build_parameters=field_build_parameters,
-                    build_context=_build_context,
-                )
-                if field_result is Null:
-                    continue
+        """
+        kwargs["_build_context"] = cls._get_dict_build_context(kwargs)
+        return cast("dict[str, Any]", cls.build(**kwargs))
 
-                result[field_meta.name] = field_result
+    @classmethod
+    def batch_dicts(cls, size: int, **kwargs: Any) -> list[dict[str, Any]]:
+        """Generate the values of a batch of size n of the factory's __model__, without creating the instances.
 
-        for field_name, post_generator in generate_post.items():
-            result[field_name] = post_generator.to_value(field_name, result)
+        :param size: Size of the batch.
+        :param kwargs: Any kwargs. If field names are set in kwargs, their values will be used.
 
-        return result
+        :notes:
+            - See 'build_dict'.
+
+        :returns: A list of dictionaries mapping field names to values.
+
+        """
+        kwargs["_build_context"] = cls._get_dict_build_context(kwargs)
+        return cast("list[dict[str, Any]]", cls.batch(size, **kwargs))
 
     @classmethod
-    def process_kwargs_coverage(cls, **kwargs: Any) -> abc.Iterable[dict[str, Any]]:
-        """Process the given kwargs and generate values for the factory's model.
+    def stream_dicts(cls, size: int | None = None, **kwargs: Any) -> abc.Iterator[dict[str, Any]]:
+        """Generate the values of instances of the factory's __model__ lazily, one at a time, without creating them.
 
-        :param kwargs: Any build kwargs.
-        :param build_context: BuildContext data for current build.
+        :param size: The number of dictionaries to generate. If None, the iterator is infinite.
+        :param kwargs: Any kwargs. If field names are set in kwargs, their values will be used.
 
-        :returns: A dictionary of build results.
+        :notes:
+            - See 'build_dict'.
+
+        :returns: An iterator of dictionaries mapping field names to values.
 
         """
-        result, generate_post, _build_context = cls._get_initial_variables(kwargs)
+        kwargs["_build_context"] = cls._get_dict_build_context(kwargs)
+        return cast("abc.Iterator[dict[str, Any]]", cls.stream(size, **kwargs))
 
-        for field_meta in cls.get_model_fields():
-            field_build_parameters = cls.extract_field_build_parameters(field_meta=field_meta, build_args=kwargs)
+    @classmethod
+    def build_json(cls, **kwargs: Any) -> bytes:
+        """Generate the values of an instance of the factory's __model__ and encode them to JSON, without creating the
+        instance.
 
-            if cls.should_set_field_value(field_meta, _build_context=_build_context, **kwargs):
-                if hasattr(cls, field_meta.name) and not hasattr(BaseFactory, field_meta.name):
-                    field_value = getattr(cls, field_meta.name)
-                    if isinstance(field_value, Ignore):
-                        continue
+        :param kwargs: Any kwargs. If field names are set in kwargs, their values will be used.
 
-                    if isinstance(field_value, Require) and field_meta.name not in kwargs:
-                        msg = f"Require kwarg {field_meta.name} is missing"
-                        raise MissingBuildKwargException(msg)
+        :notes:
+            - See 'build_dict'.
+            - The values are encoded with the fastest encoder installed, see 'polyfactory.serialization'. Values which
+              are not supported by JSON, e.g. dates, UUIDs or enums, are encoded as strings or as their values.
 
-                    if isinstance(field_value, PostGenerated):
-                        generate_post[field_meta.name] = field_value
-                        continue
+        :returns: A JSON document.
 
-                    result[field_meta.name] = cls._handle_factory_field_coverage(
-                        field_value=field_value,
-                        field_build_parameters=field_build_parameters,
-                        build_context=_build_context,
-                    )
-                    continue
+        """
+        return get_json_encoder()(cls.build_dict(**kwargs))
 
-                result[field_meta.name] = CoverageContainer(
-                    cls.get_field_value_coverage(
-                        field_meta,
-                        field_build_parameters=field_build_parameters,
-                        build_context=_build_context,
-                    ),
-                )
+    @classmethod
+    def batch_json(cls, size: int, **kwargs: Any) -> list[bytes]:
+        """Generate the values of a batch of size n of the factory's __model__ and encode them to JSON, without creating
+        the instances.
 
-        for resolved in resolve_kwargs_coverage(result):
-            for field_name, post_generator in generate_post.items():
-                resolved[field_name] = post_generator.to_value(field_name, resolved)
-            yield resolved
+        :param size: Size of the batch.
+        :param kwargs: Any kwargs. If field names are set in kwargs, their values will be used.
+
+        :notes:
+            - See 'build_json'.
+
+        :returns: A list of JSON documents.
+
+        """
+        encode = get_json_encoder()
+        return [encode(values) for values in cls.batch_dicts(size, **kwargs)]
 
     @classmethod
-    def build(cls, *_: Any, **kwargs: Any) -> T:
-        """Build an instance of the factory's __model__
+    def stream_ndjson(cls, size: int | None = None, **kwargs: Any) -> abc.Iterator[bytes]:
+        """Generate the values of instances of the factory's __model__ lazily and encode them to newline delimited
+        JSON, without creating the instances.
 
+        :param size: The number of lines to generate. If None, the iterator is infinite.
         :param kwargs: Any kwargs. If field names are set in kwargs, their values will be used.
 
-        :returns: An instance of type T.
+        :notes:
+            - See 'build_json'.
+
+        :returns: An iterator of JSON documents, each terminated by a newline.
 
         """
-        return cls.__model__(**cls.process_kwargs(**kwargs))
+        encode = get_json_encoder()
+        return (encode(values) + b"\n" for values in cls.stream_dicts(size, **kwargs))
 
     @classmethod
-    def batch(cls, size: int, **kwargs: Any) -> list[T]:
-        """Build a batch of size n of the factory's Meta.model.
+    def build_msgpack(cls, **kwargs: Any) -> bytes:
+        """Generate the values of an instance of the factory's __model__ and encode them to MessagePack, without
+        creating the instance.
 
-        :param size: Size of the batch.
-        :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
+        :param kwargs: Any kwargs. If field names are set in kwargs, their values will be used.
 
-        :returns: A list of instances of type T.
+        :notes:
+            - See 'build_dict'.
+
+        :raises MissingDependencyException: If msgspec is not installed.
+
+        :returns: A MessagePack document.
 
         """
-        return [cls.build(**kwargs) for _ in range(size)]
+        return get_msgpack_encoder()(cls.build_dict(**kwargs))
 
     @classmethod
     def coverage(cls, **kwargs: Any) -> abc.Iterator[T]:
@@ -1206,16 +3475,129 @@ class BaseFactory(ABC, Generic[T]):
         return cls._get_sync_persistence().save(data=cls.build(**kwargs))
 
     @classmethod
-    def create_batch_sync(cls, size: int, **kwargs: Any) -> list[T]:
+    def _iter_persistence_chunks(cls, size: int, chunk_size: int | None, kwargs: dict[str, Any]) -> Iterable[list[T]]:
+        """Return the chunks in which a batch is built and persisted.
+
+        :param size: Size of the batch.
+        :param chunk_size: The maximum size of each chunk. If None, the batch is built as a single chunk.
+        :param kwargs: Any build kwargs.
+
+        :returns: An iterable of lists of instances of type T.
+        """
+        if chunk_size is None:
+            return [cls.batch(size, **kwargs)]
+
+        return cls.iter_batches(size, chunk_size, **kwargs)
+
+    @classmethod
+    def create_batch_sync(
+        cls,
+        size: int,
+        chunk_size: int | None = None,
+        on_progress: ProgressCallback | None = None,
+        **kwargs: Any,
+    ) -> list[T]:
         """Build and persists synchronously a batch of n size model instances.
 
         :param size: Size of the batch.
+        :param chunk_size: If set, the batch is built and persisted in chunks of at most this size, each chunk being
+            persisted with 'save_many' as soon as it is built. Otherwise, the whole batch is persisted at once.
+        :param on_progress: A callback called after each chunk is persisted, with the number of instances persisted so
+            far and the size of the batch.
+        :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
+
+        :notes:
+            - The returned list holds the whole batch, use 'iter_create_batches_sync' to persist a large batch without
+              keeping the persisted chunks in memory.
+
+        :returns: A list of instances of type T.
+
+        """
+        chunks = cls._iter_persistence_chunks(size, chunk_size, kwargs)
+        return [
+            instance
+            for saved in cls._save_chunks_sync(cls._get_sync_persistence(), chunks, size, on_progress)
+            for instance in saved
+        ]
+
+    @classmethod
+    def iter_create_batches_sync(
+        cls,
+        size: int,
+        chunk_size: int,
+        on_progress: ProgressCallback | None = None,
+        **kwargs: Any,
+    ) -> abc.Iterator[list[T]]:
+        """Build and persists synchronously a batch of n size model instances lazily, in chunks of chunk_size.
+
+        Each chunk is persisted with 'save_many' as soon as it is built, and the persisted chunk is yielded. Only the
+        current chunk is held in memory, so the batch can be larger than the available memory.
+
+        :param size: Size of the batch.
+        :param chunk_size: The maximum size of each chunk. Only the last chunk can be smaller.
+        :param on_progress: A callback called after each chunk is persisted, with the number of instances persisted so
+            far and the size of the batch.
+        :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
+
+        :returns: An iterator of the lists of persisted instances of type T.
+
+        """
+        persistence = cls._get_sync_persistence()
+        return cls._save_chunks_sync(persistence, cls.iter_batches(size, chunk_size, **kwargs), size, on_progress)
+
+    @classmethod
+    def _save_chunks_sync(
+        cls,
+        persistence: SyncPersistenceProtocol[T],
+        chunks: Iterable[list[T]],
+        size: int,
+        on_progress: ProgressCallback | None,
+    ) -> abc.Iterator[list[T]]:
+        """Persist the chunks one at a time, yielding each persisted chunk.
+
+        :param persistence: The sync persistence handler.
+        :param chunks: The chunks to build and persist.
+        :param size: Size of the batch.
+        :param on_progress: A callback called after each chunk is persisted.
+
+        :returns: An iterator of the lists of persisted instances of type T.
+        """
+        persisted = 0
+        for chunk in chunks:
+            saved = persistence.save_many(data=chunk)
+            persisted += len(saved)
+            if on_progress is not None:
+                on_progress(persisted, size)
+            yield saved
+
+    @classmethod
+    def create_batch_parallel_sync(
+        cls,
+        size: int,
+        workers: int | None = None,
+        seed: int | None = None,
+        shard_size: int = PARALLEL_SHARD_SIZE,
+        **kwargs: Any,
+    ) -> list[T]:
+        """Build a batch of n size model instances using multiple processes and persist it synchronously.
+
+        Each shard is persisted with 'save_many' in the current process as soon as it is built.
+
+        :param size: Size of the batch.
+        :param workers: The maximum number of worker processes. Defaults to the number of CPUs.
+        :param seed: The seed of the batch. Defaults to '__random_seed__', or to a seed drawn from '__random__'.
+        :param shard_size: The number of instances built by each worker task.
         :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
 
         :returns: A list of instances of type T.
 
         """
-        return cls._get_sync_persistence().save_many(data=cls.batch(size, **kwargs))
+        persistence = cls._get_sync_persistence()
+        return [
+            instance
+            for shard in cls._iter_parallel_shards(size, workers, seed, shard_size, kwargs)
+            for instance in persistence.save_many(data=shard)
+        ]
 
     @classmethod
     async def create_async(cls, **kwargs: Any) -> T:
@@ -1228,39 +3610,334 @@ class BaseFactory(ABC, Generic[T]):
         return await cls._get_async_persistence().save(data=cls.build(**kwargs))
 
     @classmethod
-    async def create_batch_async(cls, size: int, **kwargs: Any) -> list[T]:
+    async def create_batch_async(
+        cls,
+        size: int,
+        chunk_size: int | None = None,
+        on_progress: ProgressCallback | None = None,
+        max_concurrency: int | None = None,
+        **kwargs: Any,
+    ) -> list[T]:
         """Build and persists asynchronously a batch of n size model instances.
 
 
         :param size: Size of the batch.
+        :param chunk_size: If set, the batch is built and persisted in chunks of at most this size, each chunk being
+            persisted with 'save_many' as soon as it is built. Otherwise, the whole batch is persisted at once.
+        :param on_progress: A callback called after each chunk is persisted, with the number of instances persisted so
+            far and the size of the batch.
+        :param max_concurrency: If set, the chunks are built in a worker thread while the previous chunks are being
+            persisted, with at most this number of 'save_many' calls awaited concurrently.
         :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
 
+        :notes:
+            - With 'max_concurrency', the chunks are still built one at a time and in order, so seeded batches are
+              reproducible, but they can be persisted in any order. The returned list is in build order.
+            - With 'max_concurrency', factories setting '__thread_local_random__' draw their values from the random
+              streams of the worker threads.
+            - The returned list holds the whole batch, use 'iter_create_batches_async' to persist a large batch
+              without keeping the persisted chunks in memory.
+
+        :raises ParameterException: If 'max_concurrency' is less than 1.
+
         :returns: A list of instances of type T.
         """
-        return await cls._get_async_persistence().save_many(data=cls.batch(size, **kwargs))
+        chunks = cls._iter_persistence_chunks(size, chunk_size, kwargs)
+        saved_chunks = cls._save_chunks_async(cls._get_async_persistence(), chunks, size, max_concurrency, on_progress)
+        results = {index: saved async for index, saved in saved_chunks}
+        return [instance for index in sorted(results) for instance in results[index]]
+
+    @classmethod
+    def iter_create_batches_async(
+        cls,
+        size: int,
+        chunk_size: int,
+        on_progress: ProgressCallback | None = None,
+        max_concurrency: int | None = None,
+        **kwargs: Any,
+    ) -> abc.AsyncIterator[list[T]]:
+        """Build and persists asynchronously a batch of n size model instances lazily, in chunks of chunk_size.
+
+        Each chunk is persisted with 'save_many' as soon as it is built, and the persisted chunk is yielded. Only the
+        chunks being persisted are held in memory, so the batch can be larger than the available memory.
+
+        :param size: Size of the batch.
+        :param chunk_size: The maximum size of each chunk. Only the last chunk can be smaller.
+        :param on_progress: A callback called after each chunk is persisted, with the number of instances persisted so
+            far and the size of the batch.
+        :param max_concurrency: If set, the chunks are built in a worker thread while the previous chunks are being
+            persisted, with at most this number of 'save_many' calls awaited concurrently.
+        :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
+
+        :notes:
+            - See 'create_batch_async'. With 'max_concurrency', the chunks are yielded in the order they are persisted.
+
+        :raises ParameterException: If 'max_concurrency' is less than 1.
+
+        :returns: An async iterator of the lists of persisted instances of type T.
+        """
+        persistence = cls._get_async_persistence()
+        chunks = cls.iter_batches(size, chunk_size, **kwargs)
+        saved_chunks = cls._save_chunks_async(persistence, chunks, size, max_concurrency, on_progress)
+
+        async def generate() -> abc.AsyncIterator[list[T]]:
+            async for _, saved in saved_chunks:
+                yield saved
+
+        return generate()
+
+    @classmethod
+    def _save_chunks_async(
+        cls,
+        persistence: AsyncPersistenceProtocol[T],
+        chunks: Iterable[list[T]],
+        size: int,
+        max_concurrency: int | None,
+        on_progress: ProgressCallback | None,
+    ) -> abc.AsyncIterator[tuple[int, list[T]]]:
+        """Persist the chunks, one at a time or concurrently, yielding each persisted chunk with its index.
+
+        :param persistence: The async persistence handler.
+        :param chunks: The chunks to build and persist.
+        :param size: Size of the batch.
+        :param max_concurrency: If set, the maximum number of concurrent 'save_many' calls.
+        :param on_progress: A callback called after each chunk is persisted.
+
+        :raises ParameterException: If 'max_concurrency' is less than 1.
+
+        :returns: An async iterator of the indexes of the chunks and of the lists of persisted instances of type T.
+        """
+        if max_concurrency is not None:
+            if max_concurrency < 1:
+                msg = "max_concurrency must be greater than 0"
+                raise ParameterException(msg)
+            return cls._save_chunks_concurrently(persistence, chunks, size, max_concurrency, on_progress)
+
+        async def generate() -> abc.AsyncIterator[tuple[int, list[T]]]:
+            persisted = 0
+            for index, chunk in enumerate(chunks):
+                saved = await persistence.save_many(data=chunk)
+                persisted += len(saved)
+                if on_progress is not None:
+                    on_progress(persisted, size)
+                yield index, saved
+
+        return generate()
+
+    @classmethod
+    async def _save_chunks_concurrently(  # noqa: C901
+        cls,
+        persistence: AsyncPersistenceProtocol[T],
+        chunks: Iterable[list[T]],
+        size: int,
+        max_concurrency: int,
+        on_progress: ProgressCallback | None,
+    ) -> abc.AsyncIterator[tuple[int, list[T]]]:
+        """Build the chunks in a worker thread and persist them concurrently, overlapping generation with persistence.
+
+        The next chunk is always being built while the previous chunks are being persisted. At most 'max_concurrency'
+        chunks are being persisted at a time, and a built chunk waits for one of them to complete, so at most
+        'max_concurrency' + 2 chunks are held in memory besides the ones kept by the caller. If persisting a chunk
+        fails, the pending 'save_many' calls are cancelled.
+
+        :param persistence: The async persistence handler.
+        :param chunks: The chunks to build and persist.
+        :param size: Size of the batch.
+        :param max_concurrency: The maximum number of concurrent 'save_many' calls.
+        :param on_progress: A callback called after each chunk is persisted.
+
+        :returns: An async iterator of the indexes of the chunks and of the lists of persisted instances of type T, in
+            the order they are persisted.
+        """
+        iterator = enumerate(chunks)
+        pending: set[asyncio.Future[tuple[int, list[T]]]] = set()
+        prefetch: asyncio.Future[tuple[int, list[T]] | None] | None = None
+        ready: tuple[int, list[T]] | None = None
+        exhausted = False
+        persisted = 0
+
+        async def save(index: int, chunk: list[T]) -> tuple[int, list[T]]:
+            return index, await persistence.save_many(data=chunk)
+
+        try:
+            while True:
+                if ready is not None and len(pending) < max_concurrency:
+                    pending.add(asyncio.ensure_future(save(*ready)))
+                    ready = None
+
+                if prefetch is None and ready is None and not exhausted:
+                    prefetch = asyncio.ensure_future(asyncio.to_thread(next, iterator, None))
+
+                waiting: set[asyncio.Future[Any]] = {*pending, prefetch} if prefetch is not None else {*pending}
+                if not waiting:
+                    return
+
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                if prefetch is not None and prefetch in done:
+                    ready = prefetch.result()
+                    exhausted = ready is None
+                    prefetch = None
+
+                for task in pending & done:
+                    pending.discard(task)
+                    index, saved = task.result()
+                    persisted += len(saved)
+                    if on_progress is not None:
+                        on_progress(persisted, size)
+                    yield index, saved
+        finally:
+            for task in pending:
+                task.cancel()
+            if prefetch is not None:
+                prefetch.cancel()
+
+
+def validate_all_factories() -> None:
+    """Initialize all the factories whose initialization was deferred by '__lazy_init__'.
+
+    This raises the configuration errors of the factories up front rather than on their first use, e.g. at the end of
+    the collection of a test suite.
+
+    :raises ConfigurationException: If any factory is misconfigured. The message lists the errors of all the
+        misconfigured factories.
+
+    :returns: None
+    """
+    errors: list[tuple[type[BaseFactory[Any]], ConfigurationException]] = []
+    for factory in sorted(BaseFactory._uninitialized_factories, key=lambda factory: factory.__qualname__):
+        try:
+            factory._initialize_pending()
+        except ConfigurationException as e:  # noqa: PERF203
+            errors.append((factory, e))
+
+    if errors:
+        msg = "\n".join(
+            [
+                f"{len(errors)} factories are misconfigured:",
+                *(f"- {factory.__module__}.{factory.__qualname__}: {error}" for factory, error in errors),
+            ]
+        )
+        raise ConfigurationException(msg) from errors[0][1]
+
+
+def _fingerprint_config(config: dict[str, Any]) -> tuple[tuple[str, Any], ...] | None:
+    """Return a hashable fingerprint of a factory configuration.
+
+    Mappings, such as the forward references, are fingerprinted by their items.
+
+    :param config: A mapping of configuration keys to values.
+
+    :returns: A tuple of configuration items, or None if the configuration has unhashable values.
+    """
+    try:
+        fingerprint = tuple(
+            (key, frozenset(value.items()) if isinstance(value, Mapping) else value) for key, value in config.items()
+        )
+        hash(fingerprint)
+    except TypeError:
+        return None
+    return fingerprint
+
+
+def _resolve_factory_reference(reference: Any) -> type[BaseFactory[Any]]:
+    """Resolve a factory reference returned by '_get_factory_reference'.
+
+    :param reference: A factory reference.
+
+    :returns: A factory.
+    """
+    if isinstance(reference, type):
+        return reference
+
+    factory, bases, model, kwargs = reference
+    return _resolve_factory_reference(factory).create_factory(
+        model,
+        bases=tuple(_resolve_factory_reference(base) for base in bases) or None,
+        **kwargs,
+    )
+
+
+_worker_factories: dict[bytes, tuple[type[BaseFactory[Any]], dict[str, Any]]] = {}
+"""The factories resolved by the current worker process, keyed by their pickled reference and kwargs"""
+
+
+def _build_shard(payload: bytes, seed: int, size: int) -> list[Any]:
+    """Build a shard of a parallel batch. This function is executed in worker processes.
+
+    :param payload: The pickled factory reference and kwargs.
+    :param seed: The seed of the shard.
+    :param size: Size of the shard.
+
+    :returns: A list of model instances.
+    """
+    if payload not in _worker_factories:
+        reference, kwargs = pickle.loads(payload)  # noqa: S301
+        _worker_factories[payload] = (_resolve_factory_reference(reference), kwargs)
+
+    factory, kwargs = _worker_factories[payload]
+    # the scope covers the sub-factories, whose random instances are otherwise inherited from the parent process
+    with factory.random_scope(seed):
+        return factory.batch(size, **kwargs)
+
+
+def _get_type_name(annotation: Any) -> str:
+    """Return the name of the given type, used to identify its provider in profiles."""
+    return getattr(annotation, "__name__", None) or repr(annotation)
+
+
+def _generate_none(_: Any, __: BuildContext) -> None:
+    """Field value generator for ignored types."""
+    return
+
+
+def _is_defined_in(*packages: str) -> Callable[[Any], bool]:
+    """Return a predicate determining whether a class, or one of its bases, is defined in one of the given packages.
+
+    The predicate does not import the packages, so it can be used to decide whether they are needed.
+
+    :param packages: The names of top level packages.
+
+    :returns: A predicate.
+    """
+
+    def predicate(annotation: Any) -> bool:
+        return any(
+            getattr(base, "__module__", "").partition(".")[0] in packages for base in getattr(annotation, "__mro__", ())
+        )
+
+    return predicate
+
+
+_BUILTIN_FACTORY_MODULES = (
+    "polyfactory.factories.dataclass_factory",
+    "polyfactory.factories.typed_dict_factory",
+    "polyfactory.factories.pydantic_factory",
+    "polyfactory.factories.beanie_odm_factory",
+    "polyfactory.factories.odmantic_odm_factory",
+    "polyfactory.factories.msgspec_factory",
+)
+"""The modules defining the builtin base factories, in order of increasing precedence"""
 
 
 def _register_builtin_factories() -> None:
     """This function is used to register the base factories, if present.
 
+    The base factories of the optional libraries are registered lazily: their modules, and so the libraries, are only
+    imported once a type defined by the library is seen.
+
     :returns: None
     """
     import polyfactory.factories.dataclass_factory  # noqa: PLC0415
     import polyfactory.factories.typed_dict_factory  # noqa: F401, PLC0415
 
-    for module in [
-        "polyfactory.factories.pydantic_factory",
-        "polyfactory.factories.beanie_odm_factory",
-        "polyfactory.factories.odmantic_odm_factory",
-        "polyfactory.factories.msgspec_factory",
+    BaseFactory._lazy_base_factories = (
+        ("polyfactory.factories.pydantic_factory", _is_defined_in("pydantic")),
+        ("polyfactory.factories.beanie_odm_factory", _is_defined_in("beanie")),
+        ("polyfactory.factories.odmantic_odm_factory", _is_defined_in("odmantic")),
+        ("polyfactory.factories.msgspec_factory", _is_defined_in("msgspec")),
         # `AttrsFactory` is not being registered by default since not all versions of `attrs` are supported.
         # Issue: https://github.com/litestar-org/polyfactory/issues/356
-        # "polyfactory.factories.attrs_factory",
-    ]:
-        try:
-            import_module(module)
-        except ImportError:  # noqa: PERF203
-            continue
+    )
 
 
 _register_builtin_factories()
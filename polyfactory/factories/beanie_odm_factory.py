@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from typing_extensions import get_args
 
-from polyfactory.exceptions import MissingDependencyException
+from polyfactory.constants import BEANIE_MAX_CONCURRENT_INSERTS
+from polyfactory.exceptions import MissingDependencyException, ParameterException
 from polyfactory.factories.pydantic_factory import ModelFactory
 from polyfactory.persistence import AsyncPersistenceProtocol
 from polyfactory.utils.predicates import is_safe_subclass
@@ -27,6 +29,18 @@ T = TypeVar("T", bound=Document)
 class BeaniePersistenceHandler(AsyncPersistenceProtocol[T], Generic[T]):
     """Persistence Handler using beanie logic"""
 
+    def __init__(self, max_concurrency: int = BEANIE_MAX_CONCURRENT_INSERTS) -> None:
+        """Initialize the persistence handler.
+
+        :param max_concurrency: The maximum number of inserts awaited concurrently by a call to 'save_many'.
+
+        :raises ParameterException: If 'max_concurrency' is less than 1.
+        """
+        if max_concurrency < 1:
+            msg = "max_concurrency must be greater than 0"
+            raise ParameterException(msg)
+        self.max_concurrency = max_concurrency
+
     async def save(self, data: T) -> T:
         """Persist a single instance in mongoDB."""
         return await data.insert()
@@ -34,10 +48,25 @@ class BeaniePersistenceHandler(AsyncPersistenceProtocol[T], Generic[T]):
     async def save_many(self, data: list[T]) -> list[T]:
         """Persist multiple instances in mongoDB.
 
+        The instances are inserted concurrently, with at most 'max_concurrency' inserts in flight. When used with the
+        'max_concurrency' of 'create_batch_async', each concurrent 'save_many' call has its own bound. If an insert
+        fails, the pending inserts are cancelled.
+
         .. note:: we cannot use the ``.insert_many`` method from Beanie here because it doesn't
             return the created instances
         """
-        return [await doc.insert() for doc in data]  # pyright: ignore[reportGeneralTypeIssues]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def insert(document: T) -> T:
+            async with semaphore:
+                return await document.insert()  # pyright: ignore[reportGeneralTypeIssues]
+
+        tasks = [asyncio.ensure_future(insert(document)) for document in data]
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
 
 
 class BeanieDocumentFactory(ModelFactory[T], Generic[T]):
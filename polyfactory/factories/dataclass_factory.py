@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import MISSING, fields, is_dataclass
-from typing import Any, Generic, get_type_hints
+from dataclasses import MISSING, fields, is_dataclass, replace
+from typing import TYPE_CHECKING, Any, Generic, get_type_hints
 
 from typing_extensions import TypeGuard
 
 from polyfactory.factories.base import BaseFactory, T
 from polyfactory.field_meta import FieldMeta, Null
 
+if TYPE_CHECKING:
+    from polyfactory.factories.base import BuildContext, Prototype
+
 
 class DataclassFactory(BaseFactory[T], Generic[T]):
     """Dataclass base factory"""
@@ -31,6 +34,10 @@ class DataclassFactory(BaseFactory[T], Generic[T]):
         :returns: A list of field MetaData instances.
 
         """
+        return cls._get_cached_model_fields(cls._create_model_fields)
+
+    @classmethod
+    def _create_model_fields(cls) -> list["FieldMeta"]:
         fields_meta: list["FieldMeta"] = []
 
         model_type_hints = get_type_hints(cls.__model__, include_extras=True)
@@ -55,3 +62,7 @@ class DataclassFactory(BaseFactory[T], Generic[T]):
             )
 
         return fields_meta
+
+    @classmethod
+    def _copy_model(cls, _build_context: BuildContext, prototype: Prototype[T], changes: dict[str, Any]) -> T:
+        return replace(prototype.instance, **changes)  # type: ignore[type-var]
@@ -12,6 +12,8 @@ from polyfactory.value_generators.primitives import create_random_bytes
 if TYPE_CHECKING:
     from typing_extensions import TypeGuard
 
+    from polyfactory.factories.base import BuildContext, Prototype
+
 try:
     import msgspec
     from msgspec.structs import fields
@@ -47,6 +49,10 @@ class MsgspecFactory(BaseFactory[T], Generic[T]):
 
     @classmethod
     def get_model_fields(cls) -> list[FieldMeta]:
+        return cls._get_cached_model_fields(cls._create_model_fields)
+
+    @classmethod
+    def _create_model_fields(cls) -> list[FieldMeta]:
         fields_meta: list[FieldMeta] = []
 
         type_hints = get_type_hints(cls.__model__, include_extras=True)
@@ -66,4 +72,9 @@ class MsgspecFactory(BaseFactory[T], Generic[T]):
                     default=default_value,
                 ),
             )
+
         return fields_meta
+
+    @classmethod
+    def _copy_model(cls, _build_context: BuildContext, prototype: Prototype[T], changes: dict[str, Any]) -> T:
+        return msgspec.structs.replace(prototype.instance, **changes)
@@ -13,7 +13,7 @@ from uuid import NAMESPACE_DNS, uuid1, uuid3, uuid5
 from typing_extensions import Literal, get_args
 
 from polyfactory.exceptions import MissingDependencyException
-from polyfactory.factories.base import BaseFactory, BuildContext
+from polyfactory.factories.base import BaseFactory, BuildContext, FieldValueGenerator, Prototype
 from polyfactory.factories.base import BuildContext as BaseBuildContext
 from polyfactory.field_meta import Constraints, FieldMeta, Null
 from polyfactory.utils.helpers import unwrap_new_type, unwrap_optional
@@ -440,28 +440,30 @@ class ModelFactory(BaseFactory[T], Generic[T]):
         :returns: A list of field MetaData instances.
 
         """
-        if "_fields_metadata" not in cls.__dict__:
-            if _is_pydantic_v1_model(cls.__model__):
-                cls._fields_metadata = [
-                    PydanticFieldMeta.from_model_field(
-                        field,
-                        use_alias=not cls.__model__.__config__.allow_population_by_field_name,  # type: ignore[attr-defined]
-                    )
-                    for field in cls.__model__.__fields__.values()
-                ]
-            else:
-                use_alias = cls.__model__.model_config.get("validate_by_name", False) or cls.__model__.model_config.get(
-                    "populate_by_name", False
+        return cls._get_cached_model_fields(cls._create_model_fields)
+
+    @classmethod
+    def _create_model_fields(cls) -> list["FieldMeta"]:
+        if _is_pydantic_v1_model(cls.__model__):
+            return [
+                PydanticFieldMeta.from_model_field(
+                    field,
+                    use_alias=not cls.__model__.__config__.allow_population_by_field_name,  # type: ignore[attr-defined]
                 )
-                cls._fields_metadata = [
-                    PydanticFieldMeta.from_field_info(
-                        field_info=field_info,
-                        field_name=field_name,
-                        use_alias=not use_alias,
-                    )
-                    for field_name, field_info in cls.__model__.model_fields.items()  # pyright: ignore[reportGeneralTypeIssues]
-                ]
-        return cls._fields_metadata
+                for field in cls.__model__.__fields__.values()
+            ]
+
+        use_alias = cls.__model__.model_config.get("validate_by_name", False) or cls.__model__.model_config.get(
+            "populate_by_name", False
+        )
+        return [
+            PydanticFieldMeta.from_field_info(
+                field_info=field_info,
+                field_name=field_name,
+                use_alias=not use_alias,
+            )
+            for field_name, field_info in cls.__model__.model_fields.items()  # pyright: ignore[reportGeneralTypeIssues]
+        ]
 
     @classmethod
     def get_constrained_field_value(
@@ -511,6 +513,20 @@ class ModelFactory(BaseFactory[T], Generic[T]):
             )
         return result
 
+    @classmethod
+    def _compile_field_value(cls, field_meta: FieldMeta) -> FieldValueGenerator | None:
+        generate = super()._compile_field_value(field_meta)
+        examples = cast("PydanticFieldMeta", field_meta).examples
+        if generate is None or not examples:
+            return generate
+
+        def choose_example_or_generate(field_build_parameters: Any, build_context: BuildContext) -> Any:
+            if cls.__use_examples__:
+                return cls.__random__.choice(examples)
+            return generate(field_build_parameters, build_context)
+
+        return choose_example_or_generate
+
     @classmethod
     def build(
         cls,
@@ -527,15 +543,54 @@ class ModelFactory(BaseFactory[T], Generic[T]):
 
         """
 
+        cls._set_factory_use_construct(kwargs, factory_use_construct)
+
+        if BaseFactory._profiler is not None:
+            return cls._build_profiled(BaseFactory._profiler, **kwargs)
+
+        processed_kwargs = cls.process_kwargs(**kwargs)
+
+        return cls._create_result(kwargs["_build_context"], processed_kwargs)
+
+    @classmethod
+    def batch(
+        cls,
+        size: int,
+        factory_use_construct: bool = False,
+        **kwargs: Any,
+    ) -> list[T]:
+        """Build a batch of size n of the factory's Meta.model.
+
+        :param size: Size of the batch.
+        :param factory_use_construct: A boolean that determines whether validations will be made when instantiating the
+                model. This is supported only for pydantic models.
+        :param kwargs: Any kwargs. If field_meta names are set in kwargs, their values will be used.
+
+        :returns: A list of instances of type T.
+
+        """
+        cls._set_factory_use_construct(kwargs, factory_use_construct)
+
+        return super().batch(size, **kwargs)
+
+    @classmethod
+    def _set_factory_use_construct(cls, kwargs: dict[str, Any], factory_use_construct: bool) -> None:
+        """Set the build context of the given kwargs, creating it if needed, to create the models with or without
+        validation.
+
+        :param kwargs: Any build kwargs.
+        :param factory_use_construct: Whether to create the models without validation.
+
+        :returns: None
+        """
         if "_build_context" not in kwargs:
             kwargs["_build_context"] = PydanticBuildContext(
                 seen_models=set(),
                 factory_use_construct=factory_use_construct,
             )
-
-        processed_kwargs = cls.process_kwargs(**kwargs)
-
-        return cls._create_model(kwargs["_build_context"], **processed_kwargs)
+        elif factory_use_construct:
+            # a given build context, e.g. the one holding the unique scope of a stream, is copied rather than mutated
+            kwargs["_build_context"] = {**kwargs["_build_context"], "factory_use_construct": True}
 
     @classmethod
     def _get_build_context(cls, build_context: BaseBuildContext | PydanticBuildContext | None) -> PydanticBuildContext:
@@ -551,7 +606,7 @@ class ModelFactory(BaseFactory[T], Generic[T]):
         return build_context
 
     @classmethod
-    def _create_model(cls, _build_context: PydanticBuildContext, **kwargs: Any) -> T:
+    def _create_model(cls, _build_context: BaseBuildContext | PydanticBuildContext, **kwargs: Any) -> T:
         """Create an instance of the factory's __model__
 
         :param _build_context: BuildContext instance.
@@ -560,7 +615,7 @@ class ModelFactory(BaseFactory[T], Generic[T]):
         :returns: An instance of type T.
 
         """
-        if _build_context.get("factory_use_construct"):
+        if cast("PydanticBuildContext", _build_context).get("factory_use_construct"):
             if _is_pydantic_v1_model(cls.__model__):
                 return cls.__model__.construct(**kwargs)  # type: ignore[return-value]
             return cls.__model__.model_construct(**kwargs)
@@ -571,6 +626,17 @@ class ModelFactory(BaseFactory[T], Generic[T]):
 
         return cls.__model__(**kwargs)
 
+    @classmethod
+    def _copy_model(cls, _build_context: BaseBuildContext, prototype: Prototype[T], changes: dict[str, Any]) -> T:
+        model_fields = cls.__model__.__fields__ if _is_pydantic_v1_model(cls.__model__) else cls.__model__.model_fields
+        # aliased values cannot be set as changes on the copy
+        if not changes.keys() <= model_fields.keys():
+            return super()._copy_model(_build_context, prototype, changes)
+
+        if _is_pydantic_v1_model(cls.__model__):
+            return prototype.instance.copy(update=changes)
+        return prototype.instance.model_copy(update=changes)
+
     @classmethod
     def coverage(cls, factory_use_construct: bool = False, **kwargs: Any) -> abc.Iterator[T]:
         """Build a batch of the factory's Meta.model with full coverage of the sub-types of the model.
@@ -583,11 +649,7 @@ class ModelFactory(BaseFactory[T], Generic[T]):
 
         """
 
-        if "_build_context" not in kwargs:
-            kwargs["_build_context"] = PydanticBuildContext(
-                seen_models=set(),
-                factory_use_construct=factory_use_construct,
-            )
+        cls._set_factory_use_construct(kwargs, factory_use_construct)
 
         for data in cls.process_kwargs_coverage(**kwargs):
             yield cls._create_model(_build_context=kwargs["_build_context"], **data)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import enum
-from collections.abc import Collection, Mapping
+from collections.abc import Collection, Hashable, Mapping
 from dataclasses import is_dataclass
 from datetime import date, datetime
 from typing import (
@@ -367,6 +367,19 @@ class SQLAlchemyFactory(BaseFactory[T], Generic[T]):
 
     @classmethod
     def get_model_fields(cls) -> list[FieldMeta]:
+        return cls._get_cached_model_fields(cls._create_model_fields)
+
+    @classmethod
+    def _get_field_cache_key(cls) -> Hashable:
+        return (
+            cls.__set_primary_key__,
+            cls.__set_foreign_keys__,
+            cls.__set_relationships__,
+            cls.__set_association_proxy__,
+        )
+
+    @classmethod
+    def _create_model_fields(cls) -> list[FieldMeta]:
         fields_meta: list[FieldMeta] = []
 
         table: Mapper = inspect(cls.__model__)  # type: ignore[assignment]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Generic, TypeVar, get_args, get_type_hints
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, get_args, get_type_hints
 
 from typing_extensions import (  # type: ignore[attr-defined]
     NotRequired,
@@ -14,6 +14,9 @@ from typing_extensions import (  # type: ignore[attr-defined]
 from polyfactory.factories.base import BaseFactory
 from polyfactory.field_meta import FieldMeta, Null
 
+if TYPE_CHECKING:
+    from polyfactory.factories.base import BuildContext, Prototype
+
 TypedDictT = TypeVar("TypedDictT", bound=_TypedDictMeta)
 
 
@@ -39,6 +42,10 @@ class TypedDictFactory(BaseFactory[TypedDictT], Generic[TypedDictT]):
         :returns: A list of field MetaData instances.
 
         """
+        return cls._get_cached_model_fields(cls._create_model_fields)
+
+    @classmethod
+    def _create_model_fields(cls) -> list["FieldMeta"]:
         model_type_hints = get_type_hints(cls.__model__, include_extras=True)
 
         field_metas: list[FieldMeta] = []
@@ -57,3 +64,9 @@ class TypedDictFactory(BaseFactory[TypedDictT], Generic[TypedDictT]):
             )
 
         return field_metas
+
+    @classmethod
+    def _copy_model(
+        cls, _build_context: BuildContext, prototype: Prototype[TypedDictT], changes: dict[str, Any]
+    ) -> TypedDictT:
+        return cast("TypedDictT", {**prototype.instance, **changes})
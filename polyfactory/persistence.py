@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from typing import Protocol, TypeVar, runtime_checkable
+from typing import Callable, Protocol, TypeVar, runtime_checkable
 
 T = TypeVar("T")
 
+ProgressCallback = Callable[[int, int], None]
+"""A callback called after each chunk of a batch is persisted, with the number of instances persisted so far and the
+size of the batch.
+"""
+
 
 @runtime_checkable
 class SyncPersistenceProtocol(Protocol[T]):
@@ -24,6 +29,11 @@ class SyncPersistenceProtocol(Protocol[T]):
 
         :param data: A list of instances to persist.
 
+        :notes:
+            - When a batch is created with a 'chunk_size', this is called once per chunk as soon as the chunk is built.
+              Each call should be persisted on its own, e.g. committed in its own transaction, so that the instances
+              are available while the next chunks are being built.
+
         :returns: The persisted result
 
         """
@@ -48,6 +58,11 @@ class AsyncPersistenceProtocol(Protocol[T]):
 
         :param data: A list of instances to persist.
 
+        :notes:
+            - When a batch is created with a 'chunk_size', this is called once per chunk as soon as the chunk is built.
+              Each call should be persisted on its own, e.g. committed in its own transaction, so that the instances
+              are available while the next chunks are being built.
+
         :returns: The persisted result
         """
         ...
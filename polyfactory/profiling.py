@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from threading import Lock, local
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Literal, NamedTuple, TypeVar, cast
+
+from polyfactory.exceptions import ConfigurationException, ParameterException
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+C = TypeVar("C", bound=Callable[..., Any])
+
+ProfileKind = Literal["process_kwargs", "field", "factory_field", "post_generated", "model", "provider"]
+"""The kind of a profiled call.
+
+- ``process_kwargs``: the generation of the values of a model, once per build or once per batch.
+- ``field``: the generation of a field value, including nested factories.
+- ``factory_field``: the resolution of a value declared on the factory, e.g. ``Use`` or a sub-factory.
+- ``post_generated``: the resolution of a ``PostGenerated`` field.
+- ``model``: the construction of a model instance from the generated values, including validation.
+- ``provider``: a call to a provider of the provider map.
+"""
+
+ProfileKey = tuple[ProfileKind, str, "str | None"]
+
+SortKey = Literal["kind", "factory", "name", "calls", "cumulative", "self_time", "per_call"]
+
+SORT_KEYS: tuple[SortKey, ...] = ("kind", "factory", "name", "calls", "cumulative", "self_time", "per_call")
+NUMERIC_SORT_KEYS: tuple[SortKey, ...] = ("calls", "cumulative", "self_time", "per_call")
+
+
+class ProfileEntry(NamedTuple):
+    """The statistics of the profiled calls of a given kind, factory and name."""
+
+    kind: ProfileKind
+    """The kind of the profiled calls."""
+    factory: str
+    """The name of the factory making the calls."""
+    name: str | None
+    """The field name for field calls, the type name for provider calls, None otherwise."""
+    calls: int
+    """The number of calls."""
+    cumulative: float
+    """The total time spent in the calls, in seconds."""
+    self_time: float
+    """The time spent in the calls, excluding the time spent in the profiled calls they made, in seconds."""
+
+    @property
+    def per_call(self) -> float:
+        """The average cumulative time of a call, in seconds."""
+        return self.cumulative / self.calls if self.calls else 0.0
+
+
+class ProfileReport:
+    """The statistics collected by a Profiler."""
+
+    __slots__ = ("entries",)
+
+    def __init__(self, entries: list[ProfileEntry]) -> None:
+        self.entries = entries
+
+    def sorted(
+        self,
+        by: SortKey = "self_time",
+        *,
+        reverse: bool | None = None,
+        kind: ProfileKind | None = None,
+        factory: str | None = None,
+    ) -> list[ProfileEntry]:
+        """Return the entries of the report, sorted and filtered.
+
+        :param by: The attribute to sort by.
+        :param reverse: Whether to sort in descending order. Defaults to descending order for numeric attributes.
+        :param kind: If set, only the entries of this kind are returned.
+        :param factory: If set, only the entries of the factory with this name are returned.
+
+        :returns: A list of ProfileEntry instances.
+        """
+        if by not in SORT_KEYS:
+            msg = f"Cannot sort profile entries by {by!r}, expected one of {SORT_KEYS}"
+            raise ParameterException(msg)
+
+        if reverse is None:
+            reverse = by in NUMERIC_SORT_KEYS
+
+        return sorted(
+            (
+                entry
+                for entry in self.entries
+                if (kind is None or entry.kind == kind) and (factory is None or entry.factory == factory)
+            ),
+            key=lambda entry: entry.name or "" if by == "name" else getattr(entry, by),
+            reverse=reverse,
+        )
+
+    def to_dict(self) -> dict[ProfileKey, dict[str, float]]:
+        """Return the statistics as a dictionary.
+
+        :returns: A dictionary mapping (kind, factory, name) keys to dictionaries of statistics.
+        """
+        return {
+            (entry.kind, entry.factory, entry.name): {
+                "calls": entry.calls,
+                "cumulative": entry.cumulative,
+                "self_time": entry.self_time,
+                "per_call": entry.per_call,
+            }
+            for entry in self.entries
+        }
+
+    def format(self, by: SortKey = "self_time", limit: int | None = None) -> str:
+        """Format the report as a table.
+
+        :param by: The attribute to sort by.
+        :param limit: The maximum number of rows. If None, all the entries are formatted.
+
+        :returns: The formatted table.
+        """
+        header = ("kind", "factory", "name", "calls", "cumulative (ms)", "self (ms)", "per call (us)")
+        rows = [
+            (
+                entry.kind,
+                entry.factory,
+                entry.name or "",
+                str(entry.calls),
+                f"{entry.cumulative * 1e3:.3f}",
+                f"{entry.self_time * 1e3:.3f}",
+                f"{entry.per_call * 1e6:.2f}",
+            )
+            for entry in self.sorted(by)[:limit]
+        ]
+        widths = [max(len(row[index]) for row in (header, *rows)) for index in range(len(header))]
+        # the text columns are left aligned, the numeric columns right aligned
+        alignments = [str.ljust] * 3 + [str.rjust] * 4
+
+        return "\n".join(
+            "  ".join(align(value, width) for align, value, width in zip(alignments, row, widths)).rstrip()
+            for row in (header, *rows)
+        )
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+class Profiler:
+    """Collects the call counts, cumulative and self times of the profiled calls of the factories.
+
+    The self time of a call excludes the time spent in the profiled calls it made, e.g. the self time of a field built
+    by a nested factory excludes the time spent generating the fields of the nested model.
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[ProfileKey, list[Any]] = {}
+        self._lock = Lock()
+        self._local = local()
+
+    def _enter(self) -> float:
+        stack: list[float] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+        return perf_counter()
+
+    def _exit(self, key: ProfileKey, start: float) -> None:
+        elapsed = perf_counter() - start
+        stack: list[float] = self._local.stack
+        children = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                self._stats[key] = [1, elapsed, elapsed - children]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed
+                stats[2] += elapsed - children
+
+    @contextmanager
+    def measure(self, kind: ProfileKind, factory: str, name: str | None = None) -> Iterator[None]:
+        """Profile the block as a call of the given kind, factory and name.
+
+        :param kind: The kind of the call.
+        :param factory: The name of the factory making the call.
+        :param name: The field or type name, if any.
+
+        :returns: A context manager.
+        """
+        start = self._enter()
+        try:
+            yield
+        finally:
+            self._exit((kind, factory, name), start)
+
+    def wrap(self, kind: ProfileKind, factory: str, name: str | None, function: C) -> C:
+        """Wrap the given function so that its calls are profiled.
+
+        :param kind: The kind of the calls.
+        :param factory: The name of the factory making the calls.
+        :param name: The field or type name, if any.
+        :param function: The function to wrap.
+
+        :returns: The wrapped function.
+        """
+        key: ProfileKey = (kind, factory, name)
+
+        def profiled(*args: Any, **kwargs: Any) -> Any:
+            start = self._enter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._exit(key, start)
+
+        return cast("C", profiled)
+
+    def reset(self) -> None:
+        """Discard the collected statistics.
+
+        :returns: None
+        """
+        with self._lock:
+            self._stats = {}
+
+    def report(self) -> ProfileReport:
+        """Return a report of the statistics collected so far.
+
+        :returns: A ProfileReport instance.
+        """
+        with self._lock:
+            return ProfileReport(
+                [
+                    ProfileEntry(kind, factory, name, calls, cumulative, self_time)
+                    for (kind, factory, name), (calls, cumulative, self_time) in self._stats.items()
+                ]
+            )
+
+
+@contextmanager
+def profile() -> Iterator[Profiler]:
+    """Profile the builds of all factories within the block.
+
+    Example:
+
+        .. code-block:: python
+
+            with profile() as profiler:
+                PersonFactory.batch(100)
+
+            print(profiler.report().format(limit=10))
+
+    :notes:
+        - Profiling is process wide, builds made by other threads within the block are profiled as well.
+        - The compiled build plans are recompiled when entering and exiting the block, there is no overhead when
+          profiling is not active.
+        - Columnar batches generate the values of a field with a single call per batch.
+
+    :raises ConfigurationException: If profiling is already active.
+
+    :returns: A Profiler instance collecting the statistics of the block.
+    """
+    from polyfactory.factories.base import BaseFactory  # noqa: PLC0415
+
+    profiler = Profiler()
+    with BaseFactory._registry_lock:
+        if BaseFactory._profiler is not None:
+            msg = "Profiling is already active"
+            raise ConfigurationException(msg)
+        BaseFactory._profiler = profiler
+        BaseFactory._invalidate_caches()
+
+    try:
+        yield profiler
+    finally:
+        with BaseFactory._registry_lock:
+            BaseFactory._profiler = None
+            BaseFactory._invalidate_caches()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from base64 import b64encode
+from collections import deque
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from functools import cache, partial
+from typing import Any, Callable
+
+from polyfactory.exceptions import MissingDependencyException
+
+Encoder = Callable[[Any], bytes]
+"""A callable encoding a value to bytes."""
+
+
+def to_json_compatible(value: Any) -> Any:  # noqa: PLR0911
+    """Convert a value which is not natively serializable to JSON.
+
+    This is meant to be used as the 'default' argument of 'json.dumps', or as the fallback of other encoders.
+
+    :param value: A generated value.
+
+    :returns: A value serializable to JSON.
+    """
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (bytes, bytearray)):
+        return b64encode(value).decode()
+    if isinstance(value, (set, frozenset, deque)):
+        return list(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    # UUIDs, decimals, paths, IP addresses, URLs...
+    return str(value)
+
+
+def _encode_json(value: Any) -> bytes:
+    return json.dumps(value, default=to_json_compatible, separators=(",", ":")).encode()
+
+
+@cache
+def get_json_encoder() -> Encoder:
+    """Return the fastest JSON encoder available.
+
+    The encoders are, in order of preference: msgspec, pydantic-core and the json module. Values which are not natively
+    supported by the encoder are converted with 'to_json_compatible'.
+
+    :notes:
+        - The representation of some values depends on the encoder, e.g. msgspec and pydantic-core encode timedeltas
+          as ISO 8601 durations, while the json module encodes them as a number of seconds.
+
+    :returns: A callable encoding a value to JSON bytes.
+    """
+    try:
+        import msgspec  # noqa: PLC0415
+    except ImportError:
+        pass
+    else:
+        return msgspec.json.Encoder(enc_hook=to_json_compatible).encode
+
+    try:
+        from pydantic_core import to_json  # noqa: PLC0415
+    except ImportError:
+        pass
+    else:
+        encode = partial(to_json, bytes_mode="base64", fallback=to_json_compatible)
+        try:
+            encode(None)
+        except TypeError:
+            # pydantic-core < 2.15 does not support fallbacks
+            pass
+        else:
+            return encode
+
+    return _encode_json
+
+
+@cache
+def get_msgpack_encoder() -> Encoder:
+    """Return a MessagePack encoder.
+
+    Values which are not natively supported by MessagePack are converted with 'to_json_compatible'.
+
+    :raises MissingDependencyException: If msgspec is not installed.
+
+    :returns: A callable encoding a value to MessagePack bytes.
+    """
+    try:
+        import msgspec  # noqa: PLC0415
+    except ImportError as e:
+        msg = "msgspec is not installed"
+        raise MissingDependencyException(msg) from e
+
+    return msgspec.msgpack.Encoder(enc_hook=to_json_compatible).encode
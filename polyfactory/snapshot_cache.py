@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import os
+import pickle
+import re
+from contextlib import suppress
+from functools import partial
+from pathlib import Path
+from random import Random
+from tempfile import NamedTemporaryFile
+from types import CodeType
+from typing import Any
+
+from polyfactory.utils.seeding import ContextRandom
+
+CACHE_DIR_ENV = "POLYFACTORY_CACHE_DIR"
+"""The environment variable setting the directory of the default snapshot cache."""
+DEFAULT_CACHE_DIR = ".polyfactory_cache"
+"""The directory of the default snapshot cache, relative to the working directory."""
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+"""The default maximum size of a snapshot cache, in bytes."""
+
+_SUFFIX = ".pickle"
+_ADDRESS = re.compile(r" at 0x[0-9A-Fa-f]+")
+
+
+def describe_versions(*distributions: str) -> str:
+    """Describe the installed versions of the given distributions.
+
+    :param distributions: Distribution names.
+
+    :returns: A description of the versions.
+    """
+
+    def get_version(distribution: str) -> str:
+        try:
+            return importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            return "unknown"
+
+    return ", ".join(f"{distribution} {get_version(distribution)}" for distribution in distributions)
+
+
+def _describe_code(code: CodeType) -> str:
+    digest = hashlib.sha256(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        digest.update((_describe_code(const) if isinstance(const, CodeType) else repr(const)).encode())
+    return digest.hexdigest()[:16]
+
+
+def describe(value: Any, _seen: frozenset[int] = frozenset()) -> str:  # noqa: C901, PLR0911
+    """Describe a value in a way that is stable across processes, to be used in a fingerprint.
+
+    Functions are described by their name and a digest of their code, so that changing the body of e.g. a lambda
+    changes its description. Memory addresses are stripped from the representations of other objects.
+
+    :param value: An arbitrary value.
+
+    :returns: A description of the value.
+    """
+    if id(value) in _seen:
+        return "..."
+
+    function = getattr(value, "__func__", value)
+    code = getattr(function, "__code__", None)
+    if isinstance(code, CodeType):
+        return (
+            f"{getattr(function, '__module__', None)}.{getattr(function, '__qualname__', None)}:{_describe_code(code)}"
+        )
+
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+
+    if isinstance(value, ContextRandom):
+        # the factories of random scopes are described as outside of them
+        return describe(value.fallback, _seen)
+
+    if isinstance(value, Random):
+        # the state of random instances is set by the seed, which is part of the key of a snapshot
+        return describe(type(value))
+
+    seen = _seen | {id(value)}
+    if isinstance(value, partial):
+        return f"partial({describe(value.func, seen)}, {describe(value.args, seen)}, {describe(value.keywords, seen)})"
+
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}[{', '.join(describe(item, seen) for item in value)}]"
+
+    if isinstance(value, (set, frozenset)):
+        return f"{type(value).__name__}[{', '.join(sorted(describe(item, seen) for item in value))}]"
+
+    if isinstance(value, dict):
+        items = sorted(f"{describe(key, seen)}: {describe(item, seen)}" for key, item in value.items())
+        return f"dict[{', '.join(items)}]"
+
+    value_type: Any = type(value)
+    if value_type.__repr__ is object.__repr__:
+        slots = [name for cls in value_type.__mro__ for name in getattr(cls, "__slots__", ())]
+        attributes = {name: getattr(value, name) for name in slots if hasattr(value, name) and name != "__dict__"}
+        attributes.update(getattr(value, "__dict__", {}))
+        return f"{describe(value_type)}({describe(attributes, seen)})"
+
+    return _ADDRESS.sub("", repr(value))
+
+
+class SnapshotCache:
+    """A directory of pickled snapshots, evicted in least recently used order when exceeding a maximum size."""
+
+    def __init__(self, directory: str | os.PathLike[str] | None = None, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Initialize the cache.
+
+        :param directory: The directory of the cache. Defaults to the 'POLYFACTORY_CACHE_DIR' environment variable, or
+            to '.polyfactory_cache' in the working directory.
+        :param max_size: The maximum total size of the snapshots, in bytes.
+        """
+        self.directory = Path(directory or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+        self.max_size = max_size
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> Any | None:
+        """Load the snapshot with the given key.
+
+        :param key: The key of the snapshot.
+
+        :notes:
+            - Snapshots that cannot be loaded, e.g. because a pickled class was removed, are deleted.
+
+        :returns: The snapshot, or None if there is none.
+        """
+        path = self._path(key)
+        try:
+            with path.open("rb") as file:
+                value = pickle.load(file)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: BLE001
+            with suppress(OSError):
+                path.unlink()
+            return None
+
+        # the modification time tracks the last use of the snapshot for the eviction
+        with suppress(OSError):
+            os.utime(path)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a snapshot under the given key, then evict the least recently used snapshots if needed.
+
+        :param key: The key of the snapshot.
+        :param value: A picklable value.
+
+        :raises pickle.PicklingError: If the value cannot be pickled.
+
+        :returns: None
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # the snapshot is written to a temporary file first, so that concurrent readers never load a partial snapshot
+        with NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as file:
+            file.write(data)
+        Path(file.name).replace(self._path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete the least recently used snapshots until the total size of the cache is within its maximum size.
+
+        :returns: None
+        """
+        entries = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            with suppress(OSError):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            with suppress(OSError):
+                path.unlink()
+            total -= size
+
+    def clear(self) -> None:
+        """Delete all the snapshots of the cache.
+
+        :returns: None
+        """
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            with suppress(OSError):
+                path.unlink()
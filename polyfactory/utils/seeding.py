@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+from hashlib import blake2b
+from random import Random
+from threading import current_thread, local
+from typing import Any
+
+
+def derive_seed(seed: int, *keys: int | str) -> int:
+    """Derive a seed from a base seed and the given keys.
+
+    The derived seeds of different keys are independent of each other, and the same seed and keys always derive the
+    same seed, regardless of the process or the Python hash seed.
+
+    :param seed: A base seed.
+    :param keys: Any integers or strings identifying the derived seed, e.g. a shard index.
+
+    :returns: A 64 bits integer seed.
+    """
+    digest = blake2b(repr((seed, *keys)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class ThreadLocalRandom(Random):
+    """A 'random.Random' giving each thread its own independent stream.
+
+    The stream of a thread is seeded with a seed derived from the base seed and the name of the thread, so seeded
+    runs are reproducible as long as threads are named consistently, e.g. the workers of a thread pool. Seeding,
+    getting and setting the state only affect the stream of the current thread.
+    """
+
+    def __init__(self, x: int | None = None) -> None:
+        """Initialize the random instance.
+
+        :param x: The base seed of the thread streams. If None, each stream is seeded from the operating system.
+        """
+        self._base_seed = x
+        self._local = local()
+        self.gauss_next = None
+
+    def _get_random(self) -> Random:
+        random: Random | None = getattr(self._local, "random", None)
+        if random is None:
+            seed = None if self._base_seed is None else derive_seed(self._base_seed, current_thread().name)
+            random = self._local.random = Random(seed)
+        return random
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        self._get_random().seed(a, version)
+
+    def random(self) -> float:
+        return self._get_random().random()
+
+    def getrandbits(self, k: int, /) -> int:
+        return self._get_random().getrandbits(k)
+
+    def getstate(self) -> tuple[Any, ...]:
+        return self._get_random().getstate()
+
+    def setstate(self, state: tuple[Any, ...]) -> None:
+        self._get_random().setstate(state)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, (self._base_seed,)
+
+
+class RandomScope:
+    """The random instances the factories draw values from within a random scope.
+
+    Each factory draws from its own instance, seeded with a seed derived from the seed of the scope and the key of the
+    factory, so the values generated by a factory do not depend on the values drawn by the others.
+    """
+
+    __slots__ = ("closed", "factories", "randoms", "seed")
+
+    def __init__(self, seed: int | None = None) -> None:
+        """Initialize the scope.
+
+        :param seed: The seed of the scope. If None, the random instances are seeded from the operating system.
+        """
+        self.seed = seed
+        self.randoms: dict[str, Random] = {}
+        self.factories: set[type[Any]] = set()
+        """The factories which joined the scope, and which are restored when it exits."""
+        self.closed = False
+
+    def get_random(self, key: str) -> Random:
+        """Return the random instance of the given key, creating it on first use.
+
+        :param key: A string identifying the random instance, e.g. the name of a factory.
+
+        :returns: A random instance.
+        """
+        random = self.randoms.get(key)
+        if random is None:
+            random = self.randoms[key] = Random(None if self.seed is None else derive_seed(self.seed, key))
+        return random
+
+
+active_random_scope: ContextVar[RandomScope | None] = ContextVar("active_random_scope", default=None)
+"""The scope entered with 'BaseFactory.random_scope', if any."""
+
+
+class ContextRandom(Random):
+    """A 'random.Random' resolving to a random instance of the current random scope.
+
+    Outside of any scope, values are drawn from the fallback instance. Scopes are tracked with a context variable, so
+    each thread and each asyncio task can enter its own scope without affecting the others.
+    """
+
+    def __init__(self, fallback: Random, key: str) -> None:
+        """Initialize the random instance.
+
+        :param fallback: The random instance to use outside of any scope.
+        :param key: The key of the random instances of the scopes to use.
+        """
+        self.fallback = fallback
+        self.key = key
+        self.gauss_next = None
+
+    def get_current(self) -> Random:
+        """Return the random instance values are currently drawn from.
+
+        :returns: The random instance of the current scope, or the fallback instance.
+        """
+        scope = active_random_scope.get()
+        return self.fallback if scope is None else scope.get_random(self.key)
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        self.get_current().seed(a, version)
+
+    def random(self) -> float:
+        return self.get_current().random()
+
+    def getrandbits(self, k: int, /) -> int:
+        return self.get_current().getrandbits(k)
+
+    def getstate(self) -> tuple[Any, ...]:
+        return self.get_current().getstate()
+
+    def setstate(self, state: tuple[Any, ...]) -> None:
+        self.get_current().setstate(state)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, (self.fallback, self.key)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from contextvars import ContextVar
+from enum import EnumMeta
+from itertools import product
+from math import ceil, floor, prod
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+
+from typing_extensions import get_args
+
+from polyfactory.utils.predicates import is_literal
+
+if TYPE_CHECKING:
+    from random import Random
+
+    from polyfactory.field_meta import FieldMeta
+
+UNIQUE_POOL_SIZE = 100_000
+"""The maximum number of distinct values of a key whose values are drawn without replacement."""
+
+MISSING = object()
+"""Sentinel returned by 'UniqueKey.get_value' when the value of a key is missing or None."""
+
+
+def _get_integer_bounds(constraints: Mapping[str, Any]) -> tuple[int | None, int | None]:
+    lower = upper = None
+    if "ge" in constraints:
+        lower = ceil(constraints["ge"])
+    elif "gt" in constraints:
+        lower = floor(constraints["gt"]) + 1
+
+    if "le" in constraints:
+        upper = floor(constraints["le"])
+    elif "lt" in constraints:
+        upper = ceil(constraints["lt"]) - 1
+
+    return lower, upper
+
+
+def get_finite_domain(field_meta: FieldMeta, annotation: Any) -> Sequence[Any] | None:  # noqa: PLR0911
+    """Return the values a field can take, if there is a finite number of them.
+
+    :param field_meta: FieldMeta instance.
+    :param annotation: The unwrapped annotation of the field.
+
+    :returns: A sequence of values, or None if the domain is not finite or unknown.
+    """
+    if is_literal(annotation=annotation):
+        return tuple(dict.fromkeys(get_args(annotation)))
+
+    if isinstance(annotation, EnumMeta):
+        return tuple(annotation)
+
+    if annotation is bool:
+        return (False, True)
+
+    constraints: Mapping[str, Any] = field_meta.constraints or {}
+    if annotation is not int or not constraints:
+        return None
+
+    lower, upper = _get_integer_bounds(constraints)
+    if lower is None or upper is None:
+        return None
+
+    multiple_of = constraints.get("multiple_of")
+    if multiple_of is None:
+        return range(lower, upper + 1)
+
+    if not isinstance(multiple_of, int) or multiple_of == 0:
+        return None
+
+    step = abs(multiple_of)
+    return range(ceil(lower / step) * step, upper + 1, step)
+
+
+def _freeze(value: Any) -> Hashable:
+    try:
+        hash(value)
+    except TypeError:
+        pass
+    else:
+        return cast("Hashable", value)
+
+    if isinstance(value, Mapping):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(item) for item in value)
+    return repr(value)
+
+
+class UniqueKey(NamedTuple):
+    """A field or a composite key declared in '__unique__', compiled for a factory."""
+
+    names: tuple[str, ...]
+    """The names of the fields of the key."""
+    domains: tuple[Sequence[Any] | None, ...]
+    """The values of each field of the key, or None for the fields whose domain is not finite."""
+    regenerate: tuple[str, ...]
+    """The names of the fields regenerated on collisions, when the values of the key are not drawn from a pool."""
+
+    @property
+    def domain_size(self) -> int | None:
+        """The number of distinct values of the key, if all of its fields have a finite domain."""
+        if any(domain is None for domain in self.domains):
+            return None
+        return prod(len(cast("Sequence[Any]", domain)) for domain in self.domains)
+
+    def get_value(self, values: Mapping[str, Any]) -> Any:
+        """Return the value of the key in the given values.
+
+        :param values: The values of a model.
+
+        :returns: A hashable value, or MISSING if any field of the key is missing or None.
+        """
+        if len(self.names) == 1:
+            value = values.get(self.names[0])
+            return MISSING if value is None else _freeze(value)
+
+        key_values = tuple(values.get(name) for name in self.names)
+        return MISSING if any(value is None for value in key_values) else _freeze(key_values)
+
+
+class ValuePool:
+    """The combinations of values of finite domains which were not found used yet."""
+
+    __slots__ = ("size", "values")
+
+    def __init__(self, domains: Sequence[Sequence[Any]]) -> None:
+        self.values: list[tuple[Any, ...]] = list(product(*domains))
+        self.size = len(self.values)
+
+    def draw(self, random: Random, is_used: Callable[[tuple[Any, ...]], bool]) -> tuple[Any, ...] | None:
+        """Draw a combination of values which is not used yet.
+
+        The drawn combination is kept in the pool, and only removed once it is found used by a later draw, so that a
+        combination discarded when resolving a collision of another key can be drawn again.
+
+        :param random: The random instance to draw with.
+        :param is_used: A callable determining whether a combination of values is already used.
+
+        :returns: A tuple of values, or None if all the combinations are used.
+        """
+        values = self.values
+        while values:
+            index = random.randrange(len(values))
+            value = values[index]
+            if not is_used(value):
+                return value
+            # swap with the last value so that removing is O(1)
+            values[index] = values[-1]
+            values.pop()
+        return None
+
+
+class UniqueIndex:
+    """The values of the unique keys of a factory used within a unique scope."""
+
+    __slots__ = ("pools", "seen")
+
+    def __init__(self, keys: Sequence[UniqueKey]) -> None:
+        self.seen: dict[tuple[str, ...], set[Any]] = {key.names: set() for key in keys}
+        self.pools: dict[tuple[tuple[str, ...], Hashable], ValuePool] = {}
+
+    def get_pool(self, key: UniqueKey, fixed: Mapping[str, Any]) -> ValuePool | None:
+        """Return the pool of values of the fields of the given key which are not fixed.
+
+        :param key: A UniqueKey instance.
+        :param fixed: The values of the fields of the key set by kwargs. Each combination of fixed values has its own
+            pool.
+
+        :returns: A ValuePool instance, or None if the fields which are not fixed do not have finite domains small
+            enough to be pooled.
+        """
+        domains = [domain for name, domain in zip(key.names, key.domains) if name not in fixed]
+        if not domains or any(domain is None for domain in domains):
+            return None
+
+        finite_domains = cast("list[Sequence[Any]]", domains)
+        if prod(len(domain) for domain in finite_domains) > UNIQUE_POOL_SIZE:
+            return None
+
+        pool_key = (key.names, _freeze(tuple(fixed.items())))
+        pool = self.pools.get(pool_key)
+        if pool is None:
+            pool = self.pools[pool_key] = ValuePool(finite_domains)
+        return pool
+
+
+class UniqueScope:
+    """The unique indexes of the factories within a batch, a stream or a 'unique_scope' block."""
+
+    __slots__ = ("indexes",)
+
+    def __init__(self) -> None:
+        self.indexes: dict[type[Any], UniqueIndex] = {}
+
+    def get_index(self, factory: type[Any], keys: Sequence[UniqueKey]) -> UniqueIndex:
+        """Return the index of the given factory, creating it on first use.
+
+        :param factory: A factory class.
+        :param keys: The compiled unique keys of the factory.
+
+        :returns: A UniqueIndex instance.
+        """
+        index = self.indexes.get(factory)
+        if index is None:
+            index = self.indexes[factory] = UniqueIndex(keys)
+        return index
+
+
+active_unique_scope: ContextVar[UniqueScope | None] = ContextVar("active_unique_scope", default=None)
+"""The scope entered with 'BaseFactory.unique_scope', if any."""
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from binascii import hexlify
+from math import ceil, floor
+from typing import TYPE_CHECKING, Any
+
+from polyfactory.exceptions import MissingDependencyException, ParameterException
+
+try:
+    import numpy as np
+except ImportError as e:
+    msg = "numpy is not installed"
+    raise MissingDependencyException(msg) from e
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from random import Random
+
+    from numpy.random import Generator
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+def create_numpy_generator(random: Random) -> Generator:
+    """Create a numpy random generator seeded from the given random instance.
+
+    :param random: An instance of random.
+
+    :returns: A numpy random generator.
+    """
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def get_multiplier_range(minimum: float, maximum: float, multiple_of: float) -> tuple[int, int]:
+    """Return the range of integers which multiplied by 'multiple_of' lie between minimum and maximum.
+
+    :param minimum: A minimum value.
+    :param maximum: A maximum value.
+    :param multiple_of: A value to use as a base for multiplication.
+
+    :returns: A tuple of the smallest and largest multipliers.
+    """
+    if multiple_of == 0:
+        msg = "multiple_of can not be zero"
+        raise ParameterException(msg)
+
+    multiple_of = abs(multiple_of)
+    if isinstance(minimum, int) and isinstance(maximum, int) and isinstance(multiple_of, int):
+        lowest, highest = -(-minimum // multiple_of), maximum // multiple_of
+    else:
+        lowest, highest = ceil(minimum / multiple_of), floor(maximum / multiple_of)
+
+    if lowest > highest:
+        msg = "given range should include at least one multiply of multiple_of"
+        raise ParameterException(msg)
+
+    return lowest, highest
+
+
+def create_random_integer_array(
+    generator: Generator,
+    size: int,
+    minimum: int,
+    maximum: int,
+    multiple_of: int | None = None,
+) -> list[int]:
+    """Generate a list of random integers given the constraints.
+
+    :param generator: A numpy random generator.
+    :param size: The number of values to generate.
+    :param minimum: A minimum value.
+    :param maximum: A maximum value.
+    :param multiple_of: A multiple of value.
+
+    :returns: A list of random integers.
+    """
+    if multiple_of is None:
+        return generator.integers(minimum, maximum, size=size, endpoint=True).tolist()  # type: ignore[no-any-return]
+
+    lowest, highest = get_multiplier_range(minimum, maximum, multiple_of)
+    multipliers: list[int] = generator.integers(lowest, highest, size=size, endpoint=True).tolist()
+    return [multiplier * abs(multiple_of) for multiplier in multipliers]
+
+
+def create_random_float_array(
+    generator: Generator,
+    size: int,
+    minimum: float,
+    maximum: float,
+    multiple_of: float | None = None,
+) -> list[float]:
+    """Generate a list of random floats given the constraints.
+
+    :param generator: A numpy random generator.
+    :param size: The number of values to generate.
+    :param minimum: A minimum value.
+    :param maximum: A maximum value.
+    :param multiple_of: A multiple of value.
+
+    :returns: A list of random floats.
+    """
+    if multiple_of is None:
+        return generator.uniform(minimum, maximum, size=size).tolist()  # type: ignore[no-any-return]
+
+    lowest, highest = get_multiplier_range(minimum, maximum, multiple_of)
+    multipliers: list[int] = generator.integers(lowest, highest, size=size, endpoint=True).tolist()
+    return [multiplier * abs(multiple_of) for multiplier in multipliers]
+
+
+def create_random_boolean_array(generator: Generator, size: int) -> list[bool]:
+    """Generate a list of random booleans.
+
+    :param generator: A numpy random generator.
+    :param size: The number of values to generate.
+
+    :returns: A list of random booleans.
+    """
+    return generator.integers(0, 2, size=size).astype(bool).tolist()  # type: ignore[no-any-return]
+
+
+def create_random_bytes_array(
+    generator: Generator,
+    size: int,
+    min_length: int = 0,
+    max_length: int = 2,
+) -> list[bytes]:
+    """Generate a list of random byte-strings, following the semantics of 'create_random_bytes'.
+
+    :param generator: A numpy random generator.
+    :param size: The number of values to generate.
+    :param min_length: A minimum length.
+    :param max_length: A maximum length.
+
+    :returns: A list of random byte-strings.
+    """
+    lengths: list[int] = generator.integers(min_length, max_length, size=size, endpoint=True).tolist()
+    ends: list[int] = generator.integers(min_length, max_length, size=size, endpoint=True).tolist()
+    data = hexlify(generator.bytes(sum(lengths)))
+
+    result: list[bytes] = []
+    offset = 0
+    for length, end in zip(lengths, ends):
+        value = data[offset : offset + length * 2]
+        offset += length * 2
+        result.append(value[:end] if len(value) > max_length else value)
+
+    return result
+
+
+def create_random_choice_array(generator: Generator, size: int, population: Sequence[Any]) -> list[Any]:
+    """Generate a list of values chosen from the given population.
+
+    :param generator: A numpy random generator.
+    :param size: The number of values to generate.
+    :param population: The values to choose from.
+
+    :returns: A list of values.
+    """
+    indices: list[int] = generator.integers(0, len(population), size=size).tolist()
+    return [population[index] for index in indices]
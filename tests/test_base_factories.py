@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Annotated, Any, Callable, NewType
+from collections import OrderedDict
+from dataclasses import dataclass, make_dataclass
+from typing import Annotated, Any, Callable, NewType, cast
 
 import pytest
 
@@ -158,3 +159,70 @@ def test_annotated_types_used_as_provider() -> None:
     assert len(result_coverage) == 1
     assert result_coverage[0].a == "foo"
     assert result_coverage[0].b == "bar"
+
+
+def test_base_factory_resolution_is_indexed() -> None:
+    @dataclass
+    class Foo:
+        value: int
+
+    class Bar:
+        pass
+
+    assert BaseFactory.is_factory_type(Foo)
+    assert not BaseFactory.is_factory_type(Bar)
+    factory, is_factory_type = BaseFactory._base_factory_index[Foo]
+    assert issubclass(cast("type", factory), DataclassFactory)
+    assert is_factory_type
+    assert BaseFactory._base_factory_index[Bar] == (None, False)
+
+
+def test_base_factory_resolution_index_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("polyfactory.factories.base.BASE_FACTORY_INDEX_SIZE", 2)
+    monkeypatch.setattr(BaseFactory, "_base_factory_index", OrderedDict())
+
+    models = [make_dataclass(f"Model{index}", [("value", int)]) for index in range(3)]
+    assert all(BaseFactory.is_factory_type(model) for model in models)
+    assert BaseFactory.is_factory_type(models[1])
+
+    assert list(BaseFactory._base_factory_index) == [models[2], models[1]]
+
+
+def test_abstract_types_are_not_factory_types() -> None:
+    @dataclass
+    class Foo(ABC):
+        value: int
+
+        @abstractmethod
+        def run(self) -> None: ...
+
+    assert BaseFactory._resolve_base_factory(Foo) is not None
+    assert not BaseFactory.is_factory_type(Foo)
+    assert BaseFactory._base_factory_index[Foo][1] is False
+
+
+def test_base_factory_resolution_index_is_invalidated_on_registration() -> None:
+    class Bar:
+        pass
+
+    assert not BaseFactory.is_factory_type(Bar)
+
+    class BarFactory(DataclassFactory[Any]):
+        __is_base_factory__ = True
+
+        @classmethod
+        def is_supported_type(cls, value: Any) -> bool:
+            return value is Bar or super().is_supported_type(value)
+
+    try:
+        assert BaseFactory.is_factory_type(Bar)
+        assert BaseFactory._resolve_base_factory(Bar) is BarFactory
+    finally:
+        BaseFactory._base_factories.remove(BarFactory)
+        BaseFactory._invalidate_caches()
+
+
+def test_base_factory_resolution_of_unhashable_annotation() -> None:
+    annotation = Annotated[int, {"unhashable": True}]
+
+    assert not BaseFactory.is_factory_type(annotation)
@@ -0,0 +1,191 @@
+from dataclasses import dataclass
+from enum import Enum
+from itertools import count, islice
+from random import Random
+from typing import Any, Literal, Optional
+
+import pytest
+
+from pydantic import BaseModel, Field
+
+from polyfactory.exceptions import MissingBuildKwargException, ParameterException
+from polyfactory.factories import DataclassFactory
+from polyfactory.factories.pydantic_factory import ModelFactory
+from polyfactory.fields import PostGenerated, Require, Use
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+    BLUE = "blue"
+
+
+@dataclass
+class Nested:
+    value: int
+
+
+@dataclass
+class Model:
+    id: int
+    name: str
+    active: bool
+    color: Color
+    kind: Literal["a", "b", "c"]
+    score: Optional[float]
+    nested: Nested
+
+
+class Item(BaseModel):
+    quantity: int = Field(ge=1, le=10)
+    price: float = Field(gt=0, lt=100)
+    active: bool
+    color: Color
+
+
+@pytest.mark.parametrize("columnar", (False, True))
+def test_batch_generates_valid_instances(columnar: bool) -> None:
+    class ModelFactory(DataclassFactory[Model]):
+        __columnar_batch__ = columnar
+
+    result = ModelFactory.batch(50)
+
+    assert len(result) == 50
+    for instance in result:
+        assert isinstance(instance.id, int)
+        assert isinstance(instance.name, str)
+        assert isinstance(instance.active, bool)
+        assert instance.color in Color
+        assert instance.kind in ("a", "b", "c")
+        assert instance.score is None or isinstance(instance.score, float)
+        assert isinstance(instance.nested, Nested)
+
+
+def test_batch_matches_build_for_a_given_seed() -> None:
+    class ModelFactory(DataclassFactory[Model]):
+        __random__ = Random()
+
+    ModelFactory.seed_random(1)
+    batch = ModelFactory.batch(20)
+
+    ModelFactory.seed_random(1)
+    built = [ModelFactory.build() for _ in range(20)]
+
+    assert batch == built
+
+
+def test_columnar_batch_is_deterministic() -> None:
+    class ModelFactory(DataclassFactory[Model]):
+        __random__ = Random()
+        __columnar_batch__ = True
+
+    ModelFactory.seed_random(1)
+    first = ModelFactory.batch(20)
+
+    ModelFactory.seed_random(1)
+    assert ModelFactory.batch(20) == first
+
+
+def test_columnar_batch_draws_all_values() -> None:
+    class ModelFactory(DataclassFactory[Model]):
+        __columnar_batch__ = True
+
+    result = ModelFactory.batch(200)
+
+    assert {instance.active for instance in result} == {True, False}
+    assert {instance.color for instance in result} == set(Color)
+    assert {instance.kind for instance in result} == {"a", "b", "c"}
+
+
+@pytest.mark.parametrize("columnar", (False, True))
+def test_batch_respects_factory_fields(columnar: bool) -> None:
+    class ModelFactory(DataclassFactory[Model]):
+        __columnar_batch__ = columnar
+
+        name = Use(lambda: "name")
+        kind = "b"
+        id = PostGenerated(lambda name, values: len(values["name"]))
+
+    result = ModelFactory.batch(5, color=Color.RED, nested={"value": 1})
+
+    assert all(instance.name == "name" for instance in result)
+    assert all(instance.kind == "b" for instance in result)
+    assert all(instance.id == 4 for instance in result)
+    assert all(instance.color is Color.RED for instance in result)
+    assert all(instance.nested == Nested(value=1) for instance in result)
+
+
+def test_batch_require() -> None:
+    class ModelFactory(DataclassFactory[Model]):
+        name = Require()
+
+    with pytest.raises(MissingBuildKwargException):
+        ModelFactory.batch(2)
+
+    assert [instance.name for instance in ModelFactory.batch(2, name="name")] == ["name", "name"]
+
+
+def test_batch_uses_build_override() -> None:
+    class ModelFactory(DataclassFactory[Model]):
+        @classmethod
+        def build(cls, *_: Any, **kwargs: Any) -> Model:
+            return super().build(name="built", **kwargs)
+
+    assert [instance.name for instance in ModelFactory.batch(2)] == ["built", "built"]
+
+
+@pytest.mark.parametrize("columnar", (False, True))
+def test_pydantic_batch(columnar: bool) -> None:
+    class ItemFactory(ModelFactory[Item]):
+        __columnar_batch__ = columnar
+
+    for item in ItemFactory.batch(100):
+        assert 1 <= item.quantity <= 10
+        assert 0 < item.price < 100
+
+    constructed = ItemFactory.batch(5, factory_use_construct=True, quantity=100)
+    assert all(item.quantity == 100 for item in constructed)
+
+
+def test_stream() -> None:
+    class ModelFactory(DataclassFactory[Model]): ...
+
+    assert len(list(ModelFactory.stream(5))) == 5
+    assert list(ModelFactory.stream(0)) == []
+    assert len(list(islice(ModelFactory.stream(kind="a"), 100))) == 100
+    assert all(instance.kind == "a" for instance in islice(ModelFactory.stream(kind="a"), 10))
+
+    with pytest.raises(ParameterException):
+        ModelFactory.stream(-1)
+
+
+def test_iter_batches() -> None:
+    ids = count()
+
+    class ModelFactory(DataclassFactory[Model]):
+        id = Use(lambda: next(ids))
+
+    chunks = ModelFactory.iter_batches(10, 4, kind="b")
+
+    assert next(ids) == 0
+    assert [instance.id for instance in next(chunks)] == [1, 2, 3, 4]
+    assert next(ids) == 5
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+    assert list(ModelFactory.iter_batches(0, 4)) == []
+
+
+@pytest.mark.parametrize(("total", "chunk_size"), ((-1, 1), (1, 0)))
+def test_iter_batches_validation(total: int, chunk_size: int) -> None:
+    class ModelFactory(DataclassFactory[Model]): ...
+
+    with pytest.raises(ParameterException):
+        ModelFactory.iter_batches(total, chunk_size)
+
+
+def test_pydantic_iter_batches_use_construct() -> None:
+    class ItemFactory(ModelFactory[Item]): ...
+
+    chunks = list(ItemFactory.iter_batches(5, 2, factory_use_construct=True, quantity=100))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert all(item.quantity == 100 for chunk in chunks for item in chunk)
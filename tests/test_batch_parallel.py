@@ -0,0 +1,134 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Annotated, Any
+
+import pytest
+from annotated_types import Ge, Le
+
+from polyfactory import SyncPersistenceProtocol
+from polyfactory.exceptions import ConfigurationException, ParameterException
+from polyfactory.factories import DataclassFactory
+from polyfactory.utils.seeding import derive_seed
+
+
+class Kind(Enum):
+    A = "a"
+    B = "b"
+
+
+@dataclass
+class Child:
+    value: int
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+    kind: Kind
+    child: Child
+
+
+class RecordFactory(DataclassFactory[Record]): ...
+
+
+@dataclass
+class Leaf:
+    value: Annotated[int, Ge(0), Le(1_000_000)]
+
+
+@dataclass
+class Tree:
+    id: int
+    leaf: Leaf
+
+
+class LeafFactory(DataclassFactory[Leaf]): ...
+
+
+class TreeFactory(DataclassFactory[Tree]):
+    leaf = LeafFactory
+
+
+class SyncPersistenceHandler(SyncPersistenceProtocol[Record]):
+    def __init__(self) -> None:
+        self.saved: list[list[Record]] = []
+
+    def save(self, data: Record) -> Record:
+        self.saved.append([data])
+        return data
+
+    def save_many(self, data: list[Record]) -> list[Record]:
+        self.saved.append(data)
+        return data
+
+
+def test_derive_seed() -> None:
+    assert derive_seed(1, 0) == derive_seed(1, 0)
+    assert len({derive_seed(1, 0), derive_seed(1, 1), derive_seed(2, 0), derive_seed(1, "0")}) == 4
+
+
+def test_batch_parallel_is_independent_of_workers() -> None:
+    single = RecordFactory.batch_parallel(25, workers=1, seed=3, shard_size=10)
+    multiple = RecordFactory.batch_parallel(25, workers=3, seed=3, shard_size=10)
+
+    assert len(single) == 25
+    assert single == multiple
+
+    expected = []
+    for index, shard_size in enumerate((10, 10, 5)):
+        with RecordFactory.random_scope(derive_seed(3, index)):
+            expected.extend(RecordFactory.batch(shard_size))
+
+    assert single == expected
+
+
+def test_batch_parallel_sub_factories_are_seeded() -> None:
+    single = TreeFactory.batch_parallel(12, workers=1, seed=3, shard_size=3)
+    multiple = TreeFactory.batch_parallel(12, workers=4, seed=3, shard_size=3)
+
+    assert single == multiple
+    assert TreeFactory.batch_parallel(12, workers=4, seed=3, shard_size=3) == multiple
+    assert len({tree.leaf.value for tree in single}) == 12
+
+
+def test_batch_parallel_kwargs() -> None:
+    records = RecordFactory.batch_parallel(6, workers=2, seed=1, shard_size=2, kind=Kind.B, child={"value": 1})
+
+    assert all(record.kind is Kind.B and record.child == Child(value=1) for record in records)
+
+
+def test_batch_parallel_dynamic_factory() -> None:
+    factory = DataclassFactory.create_factory(Record, name="name")
+    sub_factory = factory.create_factory(kind=Kind.A)
+
+    records = sub_factory.batch_parallel(4, workers=2, seed=1, shard_size=2)
+
+    assert all(record.name == "name" and record.kind is Kind.A for record in records)
+
+
+def test_batch_parallel_unpicklable_factory() -> None:
+    class LocalFactory(DataclassFactory[Record]): ...
+
+    with pytest.raises(ConfigurationException):
+        LocalFactory.batch_parallel(2, workers=1)
+
+
+@pytest.mark.parametrize("kwargs", ({"size": -1}, {"size": 1, "workers": 0}, {"size": 1, "shard_size": 0}))
+def test_batch_parallel_validation(kwargs: Any) -> None:
+    with pytest.raises(ParameterException):
+        RecordFactory.batch_parallel(**kwargs)
+
+
+def test_batch_parallel_empty() -> None:
+    assert RecordFactory.batch_parallel(0) == []
+
+
+def test_create_batch_parallel_sync() -> None:
+    handler = SyncPersistenceHandler()
+    factory = RecordFactory.create_factory(__sync_persistence__=handler)
+
+    records = factory.create_batch_parallel_sync(5, workers=2, seed=1, shard_size=2)
+
+    assert [len(shard) for shard in handler.saved] == [2, 2, 1]
+    assert records == [record for shard in handler.saved for record in shard]
@@ -1,3 +1,4 @@
+import asyncio
 from sys import version_info
 
 import pymongo
@@ -6,7 +7,8 @@ from beanie import Document, Link, init_beanie
 from beanie.odm.fields import Indexed, PydanticObjectId
 from mongomock_motor import AsyncMongoMockClient
 
-from polyfactory.factories.beanie_odm_factory import BeanieDocumentFactory
+from polyfactory.exceptions import ParameterException
+from polyfactory.factories.beanie_odm_factory import BeanieDocumentFactory, BeaniePersistenceHandler
 
 
 @pytest.fixture()
@@ -64,6 +66,49 @@ async def test_beanie_persistence_of_multiple_instances() -> None:
         assert isinstance(instance.index, str)
 
 
+async def test_beanie_persistence_bounds_concurrent_inserts(monkeypatch: pytest.MonkeyPatch) -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def insert(self: MyDocument) -> MyDocument:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return self
+
+    monkeypatch.setattr(MyDocument, "insert", insert)
+    documents = MyFactory.batch(10)
+
+    assert await BeaniePersistenceHandler(max_concurrency=3).save_many(documents) == documents
+    assert max_in_flight == 3
+
+    with pytest.raises(ParameterException):
+        BeaniePersistenceHandler(max_concurrency=0)
+
+
+async def test_beanie_persistence_cancels_pending_inserts_on_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    documents = MyFactory.batch(5)
+    inserted: list[MyDocument] = []
+
+    async def insert(self: MyDocument) -> MyDocument:
+        if self is documents[0]:
+            msg = "connection lost"
+            raise RuntimeError(msg)
+        await asyncio.sleep(0.01)
+        inserted.append(self)
+        return self
+
+    monkeypatch.setattr(MyDocument, "insert", insert)
+
+    with pytest.raises(RuntimeError, match="connection lost"):
+        await BeaniePersistenceHandler().save_many(documents)
+
+    await asyncio.sleep(0.05)
+    assert inserted == []
+
+
 @pytest.mark.skipif(version_info < (3, 11), reason="test isolation issues on lower versions")
 async def test_beanie_links() -> None:
     result = await MyOtherFactory.create_async()
@@ -0,0 +1,119 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from random import Random
+from typing import Annotated
+
+import pytest
+from annotated_types import Ge, Le
+
+from polyfactory.exceptions import ParameterException
+from polyfactory.factories import DataclassFactory
+
+
+@dataclass
+class Child:
+    value: int
+    label: str
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+    child: Child
+
+
+@dataclass
+class Leaf:
+    value: Annotated[int, Ge(0), Le(1_000_000)]
+
+
+@dataclass
+class Tree:
+    id: int
+    leaf: Leaf
+
+
+def test_build_at_is_deterministic() -> None:
+    class RecordFactory(DataclassFactory[Record]):
+        __random__ = Random()
+
+    forward = [RecordFactory.build_at(index, seed=1) for index in range(10)]
+    backward = [RecordFactory.build_at(index, seed=1) for index in reversed(range(10))]
+
+    assert forward == backward[::-1]
+    assert len({record.name for record in forward}) == 10
+    assert RecordFactory.build_at(0, seed=2) != forward[0]
+
+
+def test_build_at_restores_random_state() -> None:
+    class RecordFactory(DataclassFactory[Record]):
+        __random__ = Random()
+
+    RecordFactory.seed_random(1)
+    expected = RecordFactory.batch(3)
+
+    RecordFactory.seed_random(1)
+    result = [RecordFactory.batch(1)[0], RecordFactory.build_at(5, seed=1), *RecordFactory.batch(2)]
+
+    assert [result[0], *result[2:]] == expected
+
+
+def test_build_at_kwargs() -> None:
+    class RecordFactory(DataclassFactory[Record]):
+        __random__ = Random()
+
+    assert RecordFactory.build_at(3, seed=1, name="name").name == "name"
+    assert RecordFactory.build_at(3, seed=1, name="name").id == RecordFactory.build_at(3, seed=1).id
+
+
+def test_build_at_requires_a_seed() -> None:
+    class RecordFactory(DataclassFactory[Record]): ...
+
+    with pytest.raises(ParameterException):
+        RecordFactory.build_at(0)
+
+    with pytest.raises(ParameterException):
+        RecordFactory.build_at(-1, seed=1)
+
+    class SeededRecordFactory(DataclassFactory[Record]):
+        __random_seed__ = 3
+
+    assert SeededRecordFactory.build_at(1) == SeededRecordFactory.build_at(1, seed=3)
+
+
+def test_lazy_batch() -> None:
+    class RecordFactory(DataclassFactory[Record]):
+        __random__ = Random()
+
+    batch = RecordFactory.lazy_batch(1_000_000, seed=1)
+
+    assert isinstance(batch, Sequence)
+    assert len(batch) == 1_000_000
+    assert batch[999_999] == RecordFactory.build_at(999_999, seed=1)
+    assert batch[-1] == batch[999_999]
+    assert batch[10:13] == [RecordFactory.build_at(index, seed=1) for index in range(10, 13)]
+
+    with pytest.raises(IndexError):
+        batch[1_000_000]
+
+    with pytest.raises(ParameterException):
+        RecordFactory.lazy_batch(-1, seed=1)
+
+
+def test_lazy_batch_sub_factory() -> None:
+    class LeafFactory(DataclassFactory[Leaf]): ...
+
+    class TreeFactory(DataclassFactory[Tree]):
+        __random__ = Random()
+        leaf = LeafFactory
+
+    batch = TreeFactory.lazy_batch(10, seed=1)
+    first = batch[3]
+
+    LeafFactory.batch(5)
+    TreeFactory.batch(5)
+
+    assert batch[3] == first
+    assert TreeFactory.build_at(3, seed=1) == first
+    assert len({tree.leaf.value for tree in batch}) == 10
@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from pydantic import BaseModel, field_validator
+
+from polyfactory.exceptions import ParameterException
+from polyfactory.factories import DataclassFactory
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+
+@dataclass
+class Child:
+    value: int
+
+
+@dataclass
+class Parent:
+    name: str
+    child: Child
+    children: list[Child]
+    optional_child: Optional[Child]
+
+
+def assert_parent_dict(values: dict) -> None:
+    assert set(values) == {"name", "child", "children", "optional_child"}
+    assert isinstance(values["name"], str)
+    assert isinstance(values["child"], dict)
+    assert isinstance(values["child"]["value"], int)
+    assert all(isinstance(child, dict) for child in values["children"])
+    assert values["optional_child"] is None or isinstance(values["optional_child"], dict)
+
+
+def test_build_dict() -> None:
+    class ParentFactory(DataclassFactory[Parent]): ...
+
+    values = ParentFactory.build_dict()
+
+    assert_parent_dict(values)
+    assert Parent(**{**values, "child": Child(**values["child"])}).child.value == values["child"]["value"]
+    assert isinstance(ParentFactory.build(), Parent)
+
+
+@pytest.mark.parametrize("columnar", (False, True))
+def test_batch_dicts(columnar: bool) -> None:
+    class ParentFactory(DataclassFactory[Parent]):
+        __columnar_batch__ = columnar
+
+    batch = ParentFactory.batch_dicts(5, name="name")
+
+    assert len(batch) == 5
+    for values in batch:
+        assert_parent_dict(values)
+        assert values["name"] == "name"
+
+
+def test_stream_dicts() -> None:
+    class ParentFactory(DataclassFactory[Parent]): ...
+
+    stream = ParentFactory.stream_dicts(3)
+
+    for values in stream:
+        assert_parent_dict(values)
+    assert len(list(ParentFactory.stream_dicts(3))) == 3
+
+    with pytest.raises(ParameterException):
+        ParentFactory.stream_dicts(-1)
+
+
+def test_build_dict_with_factory_field() -> None:
+    class ChildFactory(DataclassFactory[Child]):
+        value = 1
+
+    class ParentFactory(DataclassFactory[Parent]):
+        child = ChildFactory
+
+    assert ParentFactory.build_dict()["child"] == {"value": 1}
+    assert ParentFactory.build_dict(child={"value": 2})["child"] == {"value": 2}
+    assert ParentFactory.build_dict(child=Child(value=3))["child"] == Child(value=3)
+
+
+def test_build_dict_skips_pydantic_validation() -> None:
+    validated = []
+
+    class Item(BaseModel):
+        name: str
+
+        @field_validator("name")
+        @classmethod
+        def validate_name(cls, value: str) -> str:
+            validated.append(value)
+            return value
+
+    class Order(BaseModel):
+        item: Item
+        items: list[Item]
+
+    class OrderFactory(ModelFactory[Order]): ...
+
+    values = OrderFactory.build_dict()
+    batch = OrderFactory.batch_dicts(3)
+
+    assert not validated
+    assert isinstance(values["item"], dict)
+    assert all(isinstance(item, dict) for values in batch for item in values["items"])
+    assert Order(**values).item.name == values["item"]["name"]
@@ -0,0 +1,139 @@
+import json
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable
+from uuid import UUID
+
+import msgspec
+import pytest
+
+from pydantic import BaseModel
+
+from polyfactory import Use
+from polyfactory.factories import DataclassFactory
+from polyfactory.factories.pydantic_factory import ModelFactory
+from polyfactory.serialization import _encode_json, get_json_encoder, get_msgpack_encoder, to_json_compatible
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass
+class Item:
+    id: UUID
+    name: str
+    price: Decimal
+    color: Color
+    created: date
+
+
+@dataclass
+class Order:
+    id: int
+    items: list[Item]
+    path: Path
+
+
+class OrderFactory(DataclassFactory[Order]):
+    __randomize_collection_length__ = True
+    __min_collection_length__ = 1
+
+
+def assert_order(payload: Any) -> None:
+    assert set(payload) == {"id", "items", "path"}
+    assert isinstance(payload["path"], str)
+    item = payload["items"][0]
+    assert UUID(item["id"])
+    assert Decimal(item["price"])
+    assert item["color"] in ("red", "blue")
+    assert date.fromisoformat(item["created"])
+
+
+def test_build_json() -> None:
+    payload = OrderFactory.build_json(id=1)
+
+    assert isinstance(payload, bytes)
+    values = json.loads(payload)
+    assert_order(values)
+    assert values["id"] == 1
+
+
+def test_batch_json() -> None:
+    payloads = OrderFactory.batch_json(5)
+
+    assert len(payloads) == 5
+    for payload in payloads:
+        assert_order(json.loads(payload))
+
+
+def test_stream_ndjson() -> None:
+    lines = list(OrderFactory.stream_ndjson(3))
+
+    assert len(lines) == 3
+    assert all(line.endswith(b"\n") and line.count(b"\n") == 1 for line in lines)
+    assert_order(json.loads(b"".join(lines).splitlines()[-1]))
+
+
+def test_build_msgpack() -> None:
+    payload = OrderFactory.build_msgpack()
+
+    assert_order(msgspec.msgpack.decode(payload))
+
+
+def test_build_json_is_reproducible() -> None:
+    with OrderFactory.random_scope(1):
+        first = OrderFactory.build_json()
+
+    with OrderFactory.random_scope(1):
+        assert OrderFactory.build_json() == first
+
+
+def test_build_json_pydantic_matches_model_dump() -> None:
+    class Payload(BaseModel):
+        id: UUID
+        name: str
+        color: Color
+        amount: Decimal
+
+    class PayloadFactory(ModelFactory[Payload]): ...
+
+    with PayloadFactory.random_scope(1):
+        payload = PayloadFactory.build_json()
+
+    with PayloadFactory.random_scope(1):
+        instance = PayloadFactory.build()
+
+    assert json.loads(payload) == instance.model_dump(mode="json")
+
+
+def test_build_json_values_returned_by_providers() -> None:
+    @dataclass
+    class Wrapper:
+        order: Order
+        delay: timedelta
+
+    class WrapperFactory(DataclassFactory[Wrapper]):
+        order = Use(OrderFactory.build)
+
+    assert_order(json.loads(WrapperFactory.build_json())["order"])
+
+
+def test_get_json_encoder_prefers_msgspec() -> None:
+    assert get_json_encoder() is get_json_encoder()
+    assert get_json_encoder().__self__.__class__ is msgspec.json.Encoder  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("encode", (get_json_encoder(), _encode_json))
+def test_json_encoders(encode: Callable[[Any], bytes]) -> None:
+    values = OrderFactory.build_dict()
+
+    assert json.loads(encode(values)) == json.loads(json.dumps(values, default=to_json_compatible))
+
+
+def test_get_msgpack_encoder() -> None:
+    assert get_msgpack_encoder() is get_msgpack_encoder()
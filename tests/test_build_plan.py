@@ -0,0 +1,183 @@
+from dataclasses import dataclass
+from enum import Enum
+from random import Random
+from typing import Any, Literal, Optional
+
+import pytest
+
+from pydantic import BaseModel, Field
+
+from polyfactory import Ignore, PostGenerated, Require, Use
+from polyfactory.exceptions import MissingBuildKwargException
+from polyfactory.factories import DataclassFactory
+from polyfactory.factories.base import BuildContext
+from polyfactory.factories.pydantic_factory import ModelFactory
+from polyfactory.field_meta import FieldMeta
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass
+class Nested:
+    value: int
+
+
+@dataclass
+class Model:
+    id: int
+    name: str
+    color: Color
+    kind: Literal["a", "b"]
+    score: Optional[float]
+    nested: Nested
+
+
+def test_build_plan_is_compiled_once() -> None:
+    class ModelFactory(DataclassFactory[Model]): ...
+
+    ModelFactory.build()
+    plan = ModelFactory._get_build_plan()
+
+    ModelFactory.batch(3)
+
+    assert ModelFactory._get_build_plan() is plan
+    assert [field_meta.name for field_meta, _ in plan.fields] == ["id", "name", "color", "kind", "score", "nested"]
+
+
+def test_build_plan_is_recompiled_when_stale() -> None:
+    class ModelFactory(DataclassFactory[Model]): ...
+
+    plan = ModelFactory._get_build_plan()
+
+    ModelFactory.seed_random(1)
+    assert ModelFactory._get_build_plan() is not plan
+
+    plan = ModelFactory._get_build_plan()
+    ModelFactory.__random__ = Random(2)
+    assert ModelFactory._get_build_plan() is not plan
+
+    plan = ModelFactory._get_build_plan()
+    ModelFactory.add_provider(Nested, lambda: Nested(value=1))
+    try:
+        assert ModelFactory._get_build_plan() is not plan
+        assert ModelFactory.build().nested == Nested(value=1)
+    finally:
+        ModelFactory._providers.pop(Nested)
+        ModelFactory._invalidate_caches()
+
+
+@pytest.mark.parametrize("size", (1, 5))
+def test_build_plan_field_overrides(size: int) -> None:
+    class NestedFactory(DataclassFactory[Nested]):
+        value = 1
+
+    class ModelFactory(DataclassFactory[Model]):
+        id = Use(lambda: 2)
+        name = Require()
+        color = Color.RED
+        kind = PostGenerated(lambda name, values: "a" if values["name"] == "x" else "b")
+        score = Ignore()
+        nested = NestedFactory
+
+    plan = ModelFactory._get_build_plan()
+    assert {name: override.kind for name, override in plan.overrides.items()} == {
+        "id": "value",
+        "name": "require",
+        "color": "value",
+        "kind": "post_generated",
+        "score": "ignore",
+        "nested": "value",
+    }
+
+    with pytest.raises(MissingBuildKwargException):
+        ModelFactory.batch(size)
+
+    assert (
+        ModelFactory.batch(size, name="x", score=None, nested={"value": 3})
+        == [Model(id=2, name="x", color=Color.RED, kind="a", score=None, nested=Nested(value=3))] * size
+    )
+    assert ModelFactory.batch(size, name="y", score=None)[0].nested == Nested(value=1)
+
+
+def test_build_plan_field_overrides_follow_runtime_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    class ParentFactory(DataclassFactory[Model]):
+        name = "first"
+
+    class ChildFactory(ParentFactory): ...
+
+    assert ParentFactory.build().name == ChildFactory.build().name == "first"
+
+    ParentFactory.name = "second"  # type: ignore[assignment]
+    assert ParentFactory.build().name == ChildFactory.build().name == "second"
+
+    with monkeypatch.context() as patch:
+        patch.setattr(ChildFactory, "name", Use(lambda: "patched"))
+        assert ChildFactory.build().name == "patched"
+        patch.setattr(ChildFactory, "kind", "b", raising=False)
+        assert all(model.kind == "b" for model in ChildFactory.batch(5))
+
+    assert ChildFactory.build().name == "second"
+
+    del ParentFactory.name
+    assert ParentFactory.build().name not in ("first", "second")
+
+
+def test_build_plan_matches_get_field_value() -> None:
+    class ModelFactory(DataclassFactory[Model]):
+        __random__ = Random()
+
+    ModelFactory.seed_random(42)
+    compiled = ModelFactory.batch(20)
+
+    ModelFactory.seed_random(42)
+    generic = []
+    for _ in range(20):
+        build_context: BuildContext = {"seen_models": {Model}}
+        values = {
+            field_meta.name: ModelFactory.get_field_value(field_meta, build_context=build_context)
+            for field_meta in ModelFactory.get_model_fields()
+        }
+        generic.append(Model(**values))
+
+    assert compiled == generic
+
+
+def test_build_plan_respects_get_field_value_override() -> None:
+    class ModelFactory(DataclassFactory[Model]):
+        @classmethod
+        def get_field_value(
+            cls,
+            field_meta: FieldMeta,
+            field_build_parameters: Any = None,
+            build_context: Any = None,
+        ) -> Any:
+            if field_meta.name == "name":
+                return "overridden"
+            return super().get_field_value(field_meta, field_build_parameters, build_context)
+
+    assert ModelFactory.build().name == "overridden"
+
+
+def test_build_plan_respects_should_set_none_value_override() -> None:
+    class ModelFactory(DataclassFactory[Model]):
+        @classmethod
+        def should_set_none_value(cls, field_meta: FieldMeta) -> bool:
+            return True
+
+    assert all(instance.score is None for instance in ModelFactory.batch(10))
+
+
+def test_build_plan_uses_pydantic_examples() -> None:
+    class Payment(BaseModel):
+        currency: str = Field(examples=["USD", "EUR"])
+
+    class PaymentFactory(ModelFactory[Payment]):
+        __use_examples__ = True
+
+    assert {payment.currency for payment in PaymentFactory.batch(20)} <= {"USD", "EUR"}
+
+    PaymentFactory.__use_examples__ = False
+    assert {payment.currency for payment in PaymentFactory.batch(20)} - {"USD", "EUR"}
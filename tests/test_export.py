@@ -0,0 +1,242 @@
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Annotated, Optional
+from uuid import UUID
+
+import pytest
+from annotated_types import Ge, Le
+
+from polyfactory import Ignore, Use
+from polyfactory.exceptions import MissingDependencyException, ParameterException
+from polyfactory.export import export
+from polyfactory.factories import DataclassFactory
+from polyfactory.serialization import get_json_encoder
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass
+class Address:
+    city: str
+    zip_code: str
+
+
+@dataclass
+class Person:
+    id: UUID
+    name: str
+    birthday: date
+    balance: Decimal
+    color: Color
+    address: Address
+    previous_address: Optional[Address]
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Node:
+    value: int
+    parent: Optional["Node"] = None
+
+
+class PersonFactory(DataclassFactory[Person]):
+    __allow_none_optionals__ = False
+
+
+@dataclass
+class Coupon:
+    code: Annotated[int, Ge(0), Le(49)]
+
+
+@dataclass
+class Order:
+    coupon: Coupon
+
+
+def test_export_jsonl(tmp_path: Path) -> None:
+    path = tmp_path / "people.jsonl"
+
+    assert export(PersonFactory, 25, path, chunk_size=10) == 25
+
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(rows) == 25
+    assert UUID(rows[0]["id"])
+    assert date.fromisoformat(rows[0]["birthday"])
+    assert Decimal(rows[0]["balance"])
+    assert rows[0]["color"] in ("red", "blue")
+    assert set(rows[0]["address"]) == {"city", "zip_code"}
+
+
+def test_export_jsonl_uses_the_json_encoder() -> None:
+    @dataclass
+    class Payload:
+        id: UUID
+        created_at: datetime
+        amount: Decimal
+        data: bytes
+
+    class PayloadFactory(DataclassFactory[Payload]): ...
+
+    values = {
+        "id": UUID("12345678-1234-5678-1234-567812345678"),
+        "created_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "amount": Decimal("12.50"),
+        "data": b"\x00\xffdata",
+    }
+    file = io.StringIO()
+
+    export(PayloadFactory, 2, file, "jsonl", **values)
+
+    expected = get_json_encoder()(values).decode()
+    assert file.getvalue().splitlines() == [expected, expected]
+    assert json.loads(expected)["id"] == "12345678-1234-5678-1234-567812345678"
+
+
+def test_export_csv_flattens_nested_models() -> None:
+    file = io.StringIO()
+
+    export(PersonFactory, 5, file, "csv", tags=["a", "b"])
+
+    rows = list(csv.DictReader(io.StringIO(file.getvalue())))
+    assert len(rows) == 5
+    assert list(rows[0]) == [
+        "id",
+        "name",
+        "birthday",
+        "balance",
+        "color",
+        "address.city",
+        "address.zip_code",
+        "previous_address.city",
+        "previous_address.zip_code",
+        "tags",
+    ]
+    assert json.loads(rows[0]["tags"]) == ["a", "b"]
+
+
+def test_export_csv_missing_values() -> None:
+    class RecordFactory(DataclassFactory[Person]):
+        previous_address = None
+        name = Ignore()
+        address = Use(lambda: Address(city="Paris", zip_code="75001"))
+
+    file = io.StringIO()
+    export(RecordFactory, 3, file, "csv", name="Jane")
+
+    rows = list(csv.DictReader(io.StringIO(file.getvalue())))
+    assert rows[0]["previous_address"] == ""
+    # fields declared on the factory are not flattened
+    assert json.loads(rows[0]["address"]) == {"city": "Paris", "zip_code": "75001"}
+    # kwargs which are not generated fields are written as trailing columns
+    assert list(rows[0])[-1] == "name"
+    assert rows[0]["name"] == "Jane"
+
+
+def test_export_csv_recursive_model() -> None:
+    class NodeFactory(DataclassFactory[Node]):
+        __allow_none_optionals__ = False
+        __max_depth__ = 2
+
+    file = io.StringIO()
+    export(NodeFactory, 2, file, "csv")
+
+    header = file.getvalue().splitlines()[0]
+    assert header == "value,parent"
+
+
+@pytest.mark.parametrize("file_format", ("jsonl", "csv"))
+def test_export_is_reproducible(file_format: str) -> None:
+    outputs = set()
+    for chunk_size in (1, 7, 100):
+        file = io.StringIO()
+        export(PersonFactory, 20, file, file_format, chunk_size=chunk_size, seed=1)  # type: ignore[arg-type]
+        outputs.add(file.getvalue())
+
+    assert len(outputs) == 1
+
+    file = io.StringIO()
+    export(PersonFactory, 20, file, file_format, seed=2)  # type: ignore[arg-type]
+    assert file.getvalue() not in outputs
+
+
+def test_export_seeded_sub_factories_are_reproducible() -> None:
+    class OrderFactory(DataclassFactory[Order]): ...
+
+    outputs = set()
+    for _ in range(2):
+        file = io.StringIO()
+        export(OrderFactory, 20, file, "jsonl", chunk_size=7, seed=1)
+        outputs.add(file.getvalue())
+        OrderFactory.batch(5)
+
+    assert len(outputs) == 1
+
+
+def test_export_unique_fields_across_chunks() -> None:
+    class CouponFactory(DataclassFactory[Coupon]):
+        __unique__ = ["code"]
+
+    file = io.StringIO()
+    export(CouponFactory, 50, file, "jsonl", chunk_size=10)
+
+    codes = [json.loads(line)["code"] for line in file.getvalue().splitlines()]
+    assert sorted(codes) == list(range(50))
+
+
+def test_export_infers_the_format(tmp_path: Path) -> None:
+    export(PersonFactory, 2, str(tmp_path / "people.csv"))
+    assert (tmp_path / "people.csv").read_text().startswith("id,name")
+
+    with pytest.raises(ParameterException, match="Cannot infer the export format"):
+        export(PersonFactory, 2, io.StringIO())
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    ({"size": -1}, {"chunk_size": 0}, {"file_format": "xml"}),
+)
+def test_export_invalid_parameters(kwargs: dict) -> None:
+    with pytest.raises(ParameterException):
+        export(**{"factory": PersonFactory, "size": 1, "destination": io.StringIO(), "file_format": "jsonl", **kwargs})
+
+
+@pytest.mark.skipif(find_spec("pyarrow") is not None, reason="pyarrow is installed")
+def test_export_arrow_without_pyarrow() -> None:
+    with pytest.raises(MissingDependencyException, match="pyarrow is not installed"):
+        export(PersonFactory, 1, io.BytesIO(), "arrow")
+
+
+def test_export_arrow(tmp_path: Path) -> None:
+    pa = pytest.importorskip("pyarrow")
+    ipc = pytest.importorskip("pyarrow.ipc")
+
+    path = tmp_path / "people.arrow"
+    export(PersonFactory, 25, path, chunk_size=10, seed=1)
+
+    with pa.memory_map(str(path)) as source:
+        reader = ipc.open_file(source)
+        assert reader.num_record_batches == 3
+        table = reader.read_all()
+
+    assert table.num_rows == 25
+    assert table.column_names == [
+        "id",
+        "name",
+        "birthday",
+        "balance",
+        "color",
+        "address",
+        "previous_address",
+        "tags",
+    ]
+    assert set(table.column("address").type.names) == {"city", "zip_code"}
@@ -1,11 +1,12 @@
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, make_dataclass
 
 import pytest
 
 from pydantic import BaseModel
 
 from polyfactory import ConfigurationException
-from polyfactory.factories import DataclassFactory
+from polyfactory.factories import BaseFactory, DataclassFactory
 from polyfactory.factories.pydantic_factory import ModelFactory
 from polyfactory.field_meta import Null
 
@@ -76,3 +77,61 @@ def test_inherit_base_factory() -> None:
     # remove the ParentFactory from _base_factories to prevent side effects in other tests
     # see https://github.com/litestar-org/polyfactory/issues/198
     ModelFactory._base_factories.remove(ParentFactory)
+
+
+def test_dynamically_created_factories_are_memoized() -> None:
+    @dataclass
+    class Inner:
+        value: int
+
+    @dataclass
+    class Outer:
+        inner: Inner
+
+    class OuterFactory(DataclassFactory[Outer]): ...
+
+    inner_factory = OuterFactory._get_or_create_factory(Inner)
+    assert OuterFactory._get_or_create_factory(Inner) is inner_factory
+
+    OuterFactory.batch(3)
+    assert OuterFactory._get_or_create_factory(Inner) is inner_factory
+
+    OuterFactory.__randomize_collection_length__ = True
+    assert OuterFactory._get_or_create_factory(Inner) is not inner_factory
+    assert OuterFactory._get_or_create_factory(Inner).__randomize_collection_length__
+
+
+def test_dynamically_created_factories_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("polyfactory.factories.base.DYNAMIC_FACTORY_CACHE_SIZE", 2)
+    monkeypatch.setattr(BaseFactory, "_dynamic_factories", OrderedDict())
+
+    models = [make_dataclass(f"Model{index}", [("value", int)]) for index in range(3)]
+    factories = [DataclassFactory._get_or_create_factory(model) for model in models]
+
+    assert list(BaseFactory._dynamic_factories.values()) == factories[1:]
+
+
+def test_dynamically_created_factories_cache_is_purged_on_invalidation() -> None:
+    Model = make_dataclass("Model", [("value", int)])
+
+    factory = DataclassFactory._get_or_create_factory(Model)
+    assert DataclassFactory._get_or_create_factory(Model) is factory
+
+    BaseFactory._invalidate_caches()
+
+    assert not BaseFactory._dynamic_factories
+    assert DataclassFactory._get_or_create_factory(Model) is not factory
+
+
+def test_dynamically_created_factories_are_not_cached_for_unhashable_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(BaseFactory, "_dynamic_factories", OrderedDict())
+    Model = make_dataclass("Model", [("value", int)])
+
+    class UnhashableConfigFactory(DataclassFactory[Model]):  # type: ignore[valid-type]
+        __forward_references__ = {"Value": [int]}  # type: ignore[dict-item]
+
+    factory = UnhashableConfigFactory._get_or_create_factory(Model)
+
+    assert not BaseFactory._dynamic_factories
+    assert UnhashableConfigFactory._get_or_create_factory(Model) is not factory
+    assert factory.__forward_references__ == {"Value": [int]}
@@ -0,0 +1,106 @@
+from dataclasses import dataclass, field, make_dataclass
+from typing import Any, TypedDict
+
+import attrs
+import msgspec
+import pytest
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from polyfactory.factories import BaseFactory, DataclassFactory, TypedDictFactory
+from polyfactory.factories.attrs_factory import AttrsFactory
+from polyfactory.factories.msgspec_factory import MsgspecFactory
+from polyfactory.factories.sqlalchemy_factory import SQLAlchemyFactory
+
+
+@dataclass
+class DataclassModel:
+    id: int
+    tags: list[str] = field(default_factory=list)
+
+
+class TypedDictModel(TypedDict):
+    id: int
+
+
+class MsgspecModel(msgspec.Struct):
+    id: int
+
+
+@attrs.define
+class AttrsModel:
+    id: int
+
+
+class Base(DeclarativeBase): ...
+
+
+class SQLAlchemyModel(Base):
+    __tablename__ = "field_cache_model"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class SQLAlchemyChildModel(Base):
+    __tablename__ = "field_cache_child_model"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int] = mapped_column(ForeignKey("field_cache_model.id"))
+
+
+@pytest.mark.parametrize(
+    ("base_factory", "model"),
+    (
+        (DataclassFactory, DataclassModel),
+        (TypedDictFactory, TypedDictModel),
+        (MsgspecFactory, MsgspecModel),
+        (AttrsFactory, AttrsModel),
+        (SQLAlchemyFactory, SQLAlchemyModel),
+    ),
+)
+def test_model_fields_are_cached(base_factory: type[BaseFactory[Any]], model: type) -> None:
+    factory = base_factory.create_factory(model)
+
+    fields = factory.get_model_fields()
+
+    assert factory.get_model_fields() is fields
+    assert factory.build()
+
+    factory.reset_field_cache()
+
+    assert factory.get_model_fields() is not fields
+    assert [field_meta.name for field_meta in factory.get_model_fields()] == [field_meta.name for field_meta in fields]
+
+
+def test_reset_field_cache_picks_up_model_changes() -> None:
+    model = make_dataclass("Model", [("value", int)])
+
+    class Factory(DataclassFactory[Any]):
+        __model__ = model
+
+    class SubFactory(Factory): ...
+
+    assert isinstance(Factory.build().value, int)
+    assert isinstance(SubFactory.build().value, int)
+
+    model.__annotations__["value"] = str
+    assert isinstance(SubFactory.build().value, int)
+
+    Factory.reset_field_cache()
+
+    assert isinstance(Factory.build().value, str)
+    assert isinstance(SubFactory.build().value, str)
+
+
+def test_model_fields_follow_configuration_changes() -> None:
+    class Factory(SQLAlchemyFactory[SQLAlchemyChildModel]):
+        __set_foreign_keys__ = True
+
+    fields = Factory.get_model_fields()
+    assert Factory.get_model_fields() is fields
+    assert isinstance(Factory.build().parent_id, int)
+
+    Factory.__set_foreign_keys__ = False
+
+    assert [field_meta.name for field_meta in Factory.get_model_fields()] == ["id"]
+    assert Factory.build().parent_id is None
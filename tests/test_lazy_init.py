@@ -0,0 +1,130 @@
+import io
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from pydantic import BaseModel
+
+from polyfactory import Use
+from polyfactory.exceptions import ConfigurationException
+from polyfactory.export import export
+from polyfactory.factories import DataclassFactory, validate_all_factories
+from polyfactory.factories.base import BaseFactory
+from polyfactory.factories.pydantic_factory import ModelFactory
+from polyfactory.snapshot_cache import SnapshotCache
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+
+
+class Owner(BaseModel):
+    pet: "LazyPet"
+
+
+class CachedOwnerFactory(ModelFactory[Owner]):
+    __lazy_init__ = True
+
+
+class ExportedOwnerFactory(ModelFactory[Owner]):
+    __lazy_init__ = True
+
+
+# declared after the factories, so the forward reference is only resolved by their deferred initialization
+class LazyPet(BaseModel):
+    name: str
+
+
+def test_lazy_init_cached_batch(tmp_path: Path) -> None:
+    owners = CachedOwnerFactory.cached_batch(2, seed=1, cache=SnapshotCache(tmp_path))
+
+    assert not CachedOwnerFactory._pending_init
+    assert all(isinstance(owner.pet, LazyPet) for owner in owners)
+
+
+def test_lazy_init_export() -> None:
+    file = io.StringIO()
+    export(ExportedOwnerFactory, 2, file, "csv")
+
+    assert not ExportedOwnerFactory._pending_init
+    # the fields of the nested model are flattened, since its forward reference was resolved
+    assert file.getvalue().splitlines()[0] == "pet.name"
+
+
+def test_lazy_init_defers_initialization() -> None:
+    class PersonFactory(DataclassFactory[Person]):
+        __lazy_init__ = True
+
+    assert PersonFactory.__model__ is Person
+    assert PersonFactory._pending_init
+    assert "_fields_metadata" not in PersonFactory.__dict__
+
+    assert isinstance(PersonFactory.build(), Person)
+    assert not PersonFactory._pending_init
+    assert PersonFactory not in BaseFactory._uninitialized_factories
+
+
+def test_lazy_init_is_inherited() -> None:
+    class LazyFactory(DataclassFactory[Person]):
+        __lazy_init__ = True
+
+    class PersonFactory(LazyFactory):
+        name = Use(lambda: "name")
+
+    assert PersonFactory._pending_init
+    assert all(person.name == "name" for person in PersonFactory.batch(2))
+
+
+def test_lazy_init_raises_on_first_use() -> None:
+    class PersonFactory(DataclassFactory[Person]):
+        __lazy_init__ = True
+
+        email = Use(lambda: "person@example.com")
+
+    with pytest.raises(ConfigurationException):
+        PersonFactory.build()
+
+    # the error is raised again on the next use
+    with pytest.raises(ConfigurationException):
+        list(PersonFactory.coverage())
+
+    BaseFactory._uninitialized_factories.discard(PersonFactory)
+
+
+def test_lazy_init_pydantic() -> None:
+    class Pet(BaseModel):
+        name: str
+
+    class PetFactory(ModelFactory[Pet]):
+        __lazy_init__ = True
+
+    assert PetFactory._pending_init
+    assert isinstance(PetFactory.build(), Pet)
+
+
+def test_validate_all_factories() -> None:
+    class PersonFactory(DataclassFactory[Person]):
+        __lazy_init__ = True
+
+    class MisconfiguredFactory(DataclassFactory[Person]):
+        __lazy_init__ = True
+
+        email = Use(lambda: "person@example.com")
+
+    class NoModelFactory(DataclassFactory):  # type: ignore[type-arg]
+        __lazy_init__ = True
+
+    with pytest.raises(ConfigurationException) as exc_info:
+        validate_all_factories()
+
+    message = str(exc_info.value)
+    assert "MisconfiguredFactory" in message
+    assert "NoModelFactory" in message
+    assert not PersonFactory._pending_init
+
+    BaseFactory._uninitialized_factories.discard(MisconfiguredFactory)
+    BaseFactory._uninitialized_factories.discard(NoModelFactory)
+    validate_all_factories()
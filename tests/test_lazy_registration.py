@@ -0,0 +1,124 @@
+import subprocess
+import sys
+from textwrap import dedent
+
+import pytest
+
+
+def run(source: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", dedent(source)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_does_not_import_optional_libraries() -> None:
+    output = run(
+        """
+        import sys
+
+        import polyfactory
+        from polyfactory.factories import DataclassFactory, TypedDictFactory
+
+        print(sorted(name for name in ("pydantic", "beanie", "odmantic", "msgspec") if name in sys.modules))
+        """
+    )
+
+    assert output == "[]"
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    (
+        (
+            """
+            from pydantic import BaseModel
+
+            class Model(BaseModel):
+                value: int
+            """,
+            "ModelFactory",
+        ),
+        (
+            """
+            from msgspec import Struct
+
+            class Model(Struct):
+                value: int
+            """,
+            "MsgspecFactory",
+        ),
+        (
+            """
+            from beanie import Document
+
+            class Model(Document):
+                value: int
+            """,
+            "BeanieDocumentFactory",
+        ),
+    ),
+    ids=("pydantic", "msgspec", "beanie"),
+)
+def test_base_factory_is_registered_on_first_use(source: str, expected: str) -> None:
+    output = run(
+        dedent(source)
+        + dedent(
+            """
+            from polyfactory.factories.base import BaseFactory
+
+            print(BaseFactory._resolve_base_factory(Model).__name__)
+            """
+        )
+    )
+
+    assert output == expected
+
+
+def test_build_with_lazily_registered_base_factory() -> None:
+    output = run(
+        """
+        from dataclasses import dataclass
+
+        from pydantic import BaseModel
+
+        from polyfactory.factories import DataclassFactory
+
+        class Child(BaseModel):
+            value: int
+
+        @dataclass
+        class Parent:
+            child: Child
+
+        print(type(DataclassFactory.create_factory(Parent).build().child).__name__)
+        """
+    )
+
+    assert output == "Child"
+
+
+def test_lazily_registered_base_factories_keep_their_precedence() -> None:
+    output = run(
+        """
+        from beanie import Document
+
+        from polyfactory.factories.base import BaseFactory
+        from polyfactory.factories.pydantic_factory import ModelFactory
+
+        class CustomFactory(ModelFactory):
+            __is_base_factory__ = True
+
+        class Model(Document):
+            value: int
+
+        # the custom base factory was registered after the pydantic factory but before the beanie factory was
+        # imported, it still takes precedence as it would have if the beanie factory was imported eagerly
+        print(BaseFactory._resolve_base_factory(Model).__name__)
+        """
+    )
+
+    assert output == "CustomFactory"
@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from enum import Enum
+from random import Random
+from typing import Annotated, Any, Literal
+
+import pytest
+from annotated_types import Ge, Gt, Le, Lt, MultipleOf
+
+from pydantic import BaseModel, Field
+
+from polyfactory.exceptions import ConfigurationException, ParameterException
+from polyfactory.factories import DataclassFactory
+from polyfactory.factories.pydantic_factory import ModelFactory
+from polyfactory.value_generators.numpy_arrays import (
+    create_numpy_generator,
+    create_random_bytes_array,
+    get_multiplier_range,
+)
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass
+class Record:
+    count: int
+    active: bool
+    payload: bytes
+    color: Color
+    kind: Literal["a", "b"]
+    ratio: Annotated[float, Ge(0), Lt(1)]
+    step: Annotated[int, Gt(-10), Le(100), MultipleOf(5)]
+
+
+class Measurement(BaseModel):
+    value: int = Field(ge=-1000, le=1000, multiple_of=7)
+    weight: float = Field(gt=1.5, le=2.5, multiple_of=0.25)
+
+
+def test_numpy_backend_generates_valid_values() -> None:
+    class RecordFactory(DataclassFactory[Record]):
+        __random_backend__ = "numpy"
+
+    records = RecordFactory.batch(500)
+
+    for record in records:
+        assert 0 <= record.count <= 9999
+        assert type(record.count) is int
+        assert type(record.active) is bool
+        assert len(record.payload) <= 2
+        assert record.color in Color
+        assert record.kind in ("a", "b")
+        assert 0 <= record.ratio < 1
+        assert -10 < record.step <= 100
+        assert record.step % 5 == 0
+
+    assert {record.active for record in records} == {True, False}
+    assert {record.color for record in records} == set(Color)
+
+
+def test_numpy_backend_respects_pydantic_constraints() -> None:
+    class MeasurementFactory(ModelFactory[Measurement]):
+        __random_backend__ = "numpy"
+
+    for measurement in MeasurementFactory.batch(500):
+        assert -1000 <= measurement.value <= 1000
+        assert measurement.value % 7 == 0
+        assert 1.5 < measurement.weight <= 2.5
+
+
+def test_numpy_backend_is_deterministic() -> None:
+    class RecordFactory(DataclassFactory[Record]):
+        __random__ = Random()
+        __random_backend__ = "numpy"
+
+    RecordFactory.seed_random(1)
+    first = RecordFactory.batch(50)
+
+    RecordFactory.seed_random(1)
+    assert RecordFactory.batch(50) == first
+
+
+def test_invalid_random_backend() -> None:
+    with pytest.raises(ConfigurationException):
+
+        class RecordFactory(DataclassFactory[Record]):
+            __random_backend__ = "cupy"  # type: ignore[assignment]
+
+
+@pytest.mark.parametrize(
+    ("minimum", "maximum", "multiple_of", "expected"),
+    (
+        (0, 10, 3, (0, 3)),
+        (-10, 10, -5, (-2, 2)),
+        (1.5, 2.5, 0.25, (6, 10)),
+    ),
+)
+def test_get_multiplier_range(minimum: Any, maximum: Any, multiple_of: Any, expected: tuple[int, int]) -> None:
+    assert get_multiplier_range(minimum, maximum, multiple_of) == expected
+
+
+def test_get_multiplier_range_without_multiples() -> None:
+    with pytest.raises(ParameterException):
+        get_multiplier_range(1, 2, 5)
+
+
+def test_create_random_bytes_array() -> None:
+    generator = create_numpy_generator(Random(1))
+
+    values = create_random_bytes_array(generator, 200, min_length=0, max_length=2)
+
+    assert len(values) == 200
+    assert all(isinstance(value, bytes) and len(value) <= 2 for value in values)
+    assert {len(value) for value in values} == {0, 1, 2}
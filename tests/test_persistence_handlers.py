@@ -1,10 +1,15 @@
+import asyncio
+import gc
+import time
+import weakref
 from typing import Any
 
 import pytest
 
 from pydantic import BaseModel
 
-from polyfactory import AsyncPersistenceProtocol, SyncPersistenceProtocol
+from polyfactory import AsyncPersistenceProtocol, SyncPersistenceProtocol, Use
+from polyfactory.exceptions import ParameterException
 from polyfactory.factories.pydantic_factory import ModelFactory
 
 
@@ -64,3 +69,211 @@ async def test_async_persistence_handler_is_set_and_called_with_class() -> None:
 
     assert (await MyFactory.create_async()).name
     assert [instance.name for instance in (await MyFactory.create_batch_async(size=2))]
+
+
+def test_create_batch_sync_in_chunks() -> None:
+    events: list[Any] = []
+
+    class RecordingSyncPersistenceHandler(SyncPersistenceProtocol):
+        def save(self, data: Any) -> Any:
+            return data
+
+        def save_many(self, data: Any) -> Any:
+            events.append(("save", len(data)))
+            return data
+
+    class MyFactory(ModelFactory[MyModel]):
+        __sync_persistence__ = RecordingSyncPersistenceHandler()
+
+        name = Use(lambda: events.append("build") or "name")
+
+    progress: list[tuple[int, int]] = []
+    result = MyFactory.create_batch_sync(
+        size=5, chunk_size=2, on_progress=lambda done, total: progress.append((done, total))
+    )
+
+    assert len(result) == 5
+    assert events == ["build", "build", ("save", 2), "build", "build", ("save", 2), "build", ("save", 1)]
+    assert progress == [(2, 5), (4, 5), (5, 5)]
+
+    events.clear()
+    assert len(MyFactory.create_batch_sync(size=3)) == 3
+    assert events[-1] == ("save", 3)
+
+
+@pytest.mark.asyncio()
+async def test_create_batch_async_in_chunks() -> None:
+    saved: list[int] = []
+
+    class RecordingAsyncPersistenceHandler(AsyncPersistenceProtocol):
+        async def save(self, data: Any) -> Any:
+            return data
+
+        async def save_many(self, data: Any) -> Any:
+            saved.append(len(data))
+            return data
+
+    class MyFactory(ModelFactory[MyModel]):
+        __async_persistence__ = RecordingAsyncPersistenceHandler()
+
+    progress: list[tuple[int, int]] = []
+    result = await MyFactory.create_batch_async(
+        size=5, chunk_size=3, on_progress=lambda done, total: progress.append((done, total))
+    )
+
+    assert len(result) == 5
+    assert saved == [3, 2]
+    assert progress == [(3, 5), (5, 5)]
+
+    with pytest.raises(ParameterException):
+        await MyFactory.create_batch_async(size=5, chunk_size=0)
+
+
+def test_iter_create_batches_sync_does_not_keep_persisted_chunks() -> None:
+    class MyFactory(ModelFactory[MyModel]):
+        __sync_persistence__ = MySyncPersistenceHandler()
+
+    progress: list[int] = []
+    chunks = MyFactory.iter_create_batches_sync(size=5, chunk_size=2, on_progress=lambda done, _: progress.append(done))
+
+    references = [weakref.ref(instance) for instance in next(chunks)]
+    assert len(next(chunks)) == 2
+    gc.collect()
+    assert all(reference() is None for reference in references)
+
+    assert [len(chunk) for chunk in chunks] == [1]
+    assert progress == [2, 4, 5]
+
+    with pytest.raises(ParameterException):
+        MyFactory.iter_create_batches_sync(size=5, chunk_size=0)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("max_concurrency", (None, 2))
+async def test_iter_create_batches_async_does_not_keep_persisted_chunks(max_concurrency: "int | None") -> None:
+    class MyFactory(ModelFactory[MyModel]):
+        __async_persistence__ = MyAsyncPersistenceHandler()
+
+    chunks = MyFactory.iter_create_batches_async(size=20, chunk_size=2, max_concurrency=max_concurrency)
+
+    references = [weakref.ref(instance) for instance in await chunks.__anext__()]
+    sizes = [len(chunk) async for chunk in chunks]
+    gc.collect()
+
+    assert all(reference() is None for reference in references)
+    assert sizes == [2] * 9
+
+    with pytest.raises(ParameterException):
+        MyFactory.iter_create_batches_async(size=10, chunk_size=1, max_concurrency=0)
+
+
+class FakeAsyncStore(AsyncPersistenceProtocol[MyModel]):
+    def __init__(self, latency: float = 0.01) -> None:
+        self.latency = latency
+        self.rows: list[MyModel] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def save(self, data: MyModel) -> MyModel:
+        return (await self.save_many([data]))[0]
+
+    async def save_many(self, data: list[MyModel]) -> list[MyModel]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            self.rows.extend(data)
+            return data
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("max_concurrency", (1, 3))
+async def test_create_batch_async_with_max_concurrency(max_concurrency: int) -> None:
+    store = FakeAsyncStore()
+
+    class MyFactory(ModelFactory[MyModel]):
+        __async_persistence__ = store
+
+    MyFactory.seed_random(1)
+    expected = MyFactory.batch(20)
+
+    MyFactory.seed_random(1)
+    progress: list[int] = []
+    result = await MyFactory.create_batch_async(
+        size=20,
+        chunk_size=2,
+        max_concurrency=max_concurrency,
+        on_progress=lambda done, _: progress.append(done),
+    )
+
+    assert result == expected
+    assert sorted(store.rows, key=result.index) == result
+    assert store.max_in_flight == max_concurrency
+    assert progress == list(range(2, 21, 2))
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("max_concurrency", (1, 2))
+async def test_create_batch_async_with_max_concurrency_overlaps_generation(max_concurrency: int) -> None:
+    latency = 0.1
+    store = FakeAsyncStore(latency=latency)
+
+    class MyFactory(ModelFactory[MyModel]):
+        __async_persistence__ = store
+
+        name = Use(lambda: time.sleep(latency) or "name")
+
+    start = time.perf_counter()
+    result = await MyFactory.create_batch_async(size=4, chunk_size=1, max_concurrency=max_concurrency)
+    elapsed = time.perf_counter() - start
+
+    assert len(result) == 4
+    # building and persisting the 4 chunks one after the other takes 8 latencies
+    assert elapsed < 6 * latency
+
+
+@pytest.mark.asyncio()
+async def test_create_batch_async_with_max_concurrency_failure() -> None:
+    class FailingStore(FakeAsyncStore):
+        async def save_many(self, data: list[MyModel]) -> list[MyModel]:
+            if self.rows:
+                msg = "connection lost"
+                raise RuntimeError(msg)
+            return await super().save_many(data)
+
+    store = FailingStore(latency=0)
+
+    class MyFactory(ModelFactory[MyModel]):
+        __async_persistence__ = store
+
+    with pytest.raises(RuntimeError, match="connection lost"):
+        await MyFactory.create_batch_async(size=1000, chunk_size=1, max_concurrency=2)
+
+    assert len(store.rows) < 1000
+
+    with pytest.raises(ParameterException):
+        await MyFactory.create_batch_async(size=10, chunk_size=1, max_concurrency=0)
+
+
+@pytest.mark.asyncio()
+async def test_create_batch_async_with_max_concurrency_cancels_pending_saves() -> None:
+    class FailingStore(FakeAsyncStore):
+        async def save_many(self, data: list[MyModel]) -> list[MyModel]:
+            if self.in_flight:
+                msg = "connection lost"
+                raise RuntimeError(msg)
+            return await super().save_many(data)
+
+    store = FailingStore(latency=0.05)
+
+    class MyFactory(ModelFactory[MyModel]):
+        __async_persistence__ = store
+
+    with pytest.raises(RuntimeError, match="connection lost"):
+        await MyFactory.create_batch_async(size=10, chunk_size=1, max_concurrency=2)
+
+    await asyncio.sleep(0.1)
+    assert store.rows == []
+    assert store.in_flight == 0
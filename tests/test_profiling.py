@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from polyfactory import PostGenerated, Use
+from polyfactory.exceptions import ConfigurationException, ParameterException
+from polyfactory.factories import DataclassFactory
+from polyfactory.profiling import ProfileReport, profile
+
+
+@dataclass
+class Child:
+    value: int
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+    email: str
+    greeting: str
+    child: Child
+
+
+class PersonFactory(DataclassFactory[Person]):
+    email = Use(lambda: "person@example.com")
+    greeting = PostGenerated(lambda _, values: f"Hello {values['name']}")
+
+
+def get_calls(report: ProfileReport) -> dict[tuple[Any, ...], int]:
+    return {key: int(stats["calls"]) for key, stats in report.to_dict().items()}
+
+
+@pytest.mark.parametrize("columnar", (False, True))
+def test_profile_build_and_batch(columnar: bool) -> None:
+    factory = PersonFactory.create_factory(__columnar_batch__=columnar)
+    name = factory.__name__
+
+    with profile() as profiler:
+        factory.build()
+        factory.batch(3)
+
+    calls = get_calls(profiler.report())
+
+    assert calls[("process_kwargs", name, None)] == 2
+    assert calls[("model", name, None)] == 4
+    assert calls[("factory_field", name, "email")] == 4
+    assert calls[("post_generated", name, "greeting")] == 4
+    assert calls[("field", name, "child")] == 4
+    assert calls[("field", name, "name")] == 4
+    assert calls[("provider", name, "str")] == 4
+    # columnar batches draw the ages of the batch with a single call
+    assert calls[("field", name, "age")] == (2 if columnar else 4)
+    assert calls[("process_kwargs", "ChildFactory", None)] == 4
+    assert calls[("model", "ChildFactory", None)] == 4
+
+
+def test_profile_self_time() -> None:
+    with profile() as profiler:
+        PersonFactory.batch(5)
+
+    report = profiler.report()
+    stats = report.to_dict()
+
+    child = stats[("field", "PersonFactory", "child")]
+    nested = [
+        stats[key]["cumulative"] for key in (("process_kwargs", "ChildFactory", None), ("model", "ChildFactory", None))
+    ]
+    assert child["self_time"] == pytest.approx(child["cumulative"] - sum(nested))
+    assert all(entry.self_time <= entry.cumulative for entry in report.entries)
+
+
+def test_profile_is_inactive_outside_of_the_block() -> None:
+    with profile() as profiler:
+        PersonFactory.build()
+
+    calls = get_calls(profiler.report())
+    PersonFactory.batch(2)
+
+    assert get_calls(profiler.report()) == calls
+
+
+def test_profile_cannot_be_nested() -> None:
+    with profile(), pytest.raises(ConfigurationException), profile():
+        pass
+
+
+def test_profile_report() -> None:
+    with profile() as profiler:
+        PersonFactory.batch(2)
+
+    report = profiler.report()
+
+    entries = report.sorted("calls")
+    assert [entry.calls for entry in entries] == sorted((entry.calls for entry in entries), reverse=True)
+    assert {entry.kind for entry in report.sorted(kind="provider")} == {"provider"}
+    assert {entry.factory for entry in report.sorted(factory="ChildFactory")} == {"ChildFactory"}
+
+    table = report.format(limit=3).splitlines()
+    assert table[0].split()[:3] == ["kind", "factory", "name"]
+    assert len(table) == 4
+
+    with pytest.raises(ParameterException):
+        report.sorted("size")  # type: ignore[arg-type]
@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+from typing import Any
+
+import attrs
+import msgspec
+import pytest
+from typing_extensions import TypedDict
+
+from pydantic import BaseModel, Field
+
+from polyfactory import Ignore, PostGenerated, Use
+from polyfactory.exceptions import ParameterException
+from polyfactory.factories import DataclassFactory, TypedDictFactory
+from polyfactory.factories.attrs_factory import AttrsFactory
+from polyfactory.factories.base import BaseFactory
+from polyfactory.factories.msgspec_factory import MsgspecFactory
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+
+@dataclass
+class Address:
+    city: str
+
+
+@dataclass
+class DataclassPerson:
+    id: int
+    email: str
+    address: Address
+    tags: list[str]
+
+
+class TypedDictPerson(TypedDict):
+    id: int
+    email: str
+    address: Address
+    tags: list[str]
+
+
+class PydanticPerson(BaseModel):
+    id: int
+    email: str
+    address: Address
+    tags: list[str]
+
+
+class MsgspecPerson(msgspec.Struct):
+    id: int
+    email: str
+    address: Address
+    tags: list[str]
+
+
+@attrs.define
+class AttrsPerson:
+    id: int
+    email: str
+    address: Address
+    tags: list[str]
+
+
+def get(instance: Any, name: str) -> Any:
+    return instance[name] if isinstance(instance, dict) else getattr(instance, name)
+
+
+@pytest.mark.parametrize(
+    "base_factory, model",
+    (
+        (DataclassFactory, DataclassPerson),
+        (TypedDictFactory, TypedDictPerson),
+        (ModelFactory, PydanticPerson),
+        (MsgspecFactory, MsgspecPerson),
+        (AttrsFactory, AttrsPerson),
+    ),
+)
+def test_prototype(base_factory: type[BaseFactory[Any]], model: Any) -> None:
+    factory = base_factory.create_factory(model)
+
+    prototype = factory.prototype(vary=["id", "email"], tags=["a"])
+    clones = prototype.batch(20)
+
+    assert len(clones) == 20
+    assert all(isinstance(clone, dict if model is TypedDictPerson else model) for clone in clones)
+    assert len({get(clone, "id") for clone in clones}) > 1
+    assert len({get(clone, "email") for clone in clones}) > 1
+    assert all(get(clone, "tags") == ["a"] for clone in clones)
+    assert all(get(clone, "address") is get(prototype.instance, "address") for clone in clones)
+
+    assert get(prototype.build(id=1), "id") == 1
+
+
+def test_prototype_factory_fields() -> None:
+    class PersonFactory(DataclassFactory[DataclassPerson]):
+        id = Use(iter(range(100)).__next__)
+        email = PostGenerated(lambda name, values: f"user{values['id']}@example.com")
+        tags = Ignore()
+
+    prototype = PersonFactory.prototype(vary=["email", "id"], tags=[])
+
+    assert [(person.id, person.email) for person in prototype.batch(2)] == [
+        (1, "user1@example.com"),
+        (2, "user2@example.com"),
+    ]
+    assert prototype.build(id=10).email == "user10@example.com"
+
+    with pytest.raises(ParameterException):
+        PersonFactory.prototype(vary=["tags"], tags=[])
+
+
+def test_prototype_invalid_vary() -> None:
+    class PersonFactory(DataclassFactory[DataclassPerson]): ...
+
+    with pytest.raises(ParameterException):
+        PersonFactory.prototype(vary=["unknown"])
+
+    with pytest.raises(ParameterException):
+        PersonFactory.prototype(vary=["id"], id=1)
+
+
+def test_prototype_pydantic_alias() -> None:
+    class Person(BaseModel):
+        id: int
+        email: str = Field(alias="emailAddress")
+
+    class PersonFactory(ModelFactory[Person]): ...
+
+    prototype = PersonFactory.prototype(vary=["emailAddress"])
+
+    assert len({person.email for person in prototype.batch(10)}) > 1
+    assert {person.id for person in prototype.batch(10)} == {prototype.instance.id}
+
+
+def test_prototype_is_recompiled_with_build_plan() -> None:
+    class PersonFactory(DataclassFactory[DataclassPerson]): ...
+
+    prototype = PersonFactory.prototype(vary=["id"])
+
+    PersonFactory.seed_random(1)
+    first = [person.id for person in prototype.batch(5)]
+    PersonFactory.seed_random(1)
+    assert [person.id for person in prototype.batch(5)] == first
@@ -121,3 +121,66 @@ def test_add_custom_provider() -> None:
 
     # after adding the provider, nothing should raise!
     assert FooFactory.build()
+
+
+def test_provider_map_is_cached_per_factory() -> None:
+    @dataclass
+    class Foo:
+        foo: int
+        bar: str
+
+    class FooFactory(DataclassFactory[Foo]): ...
+
+    FooFactory.batch(5)
+    info = FooFactory.provider_map_cache_info()
+    assert info.misses == 1
+    assert info.hits >= 1
+
+    assert FooFactory._get_cached_provider_map() is FooFactory._get_cached_provider_map()
+
+
+def test_provider_map_cache_invalidation() -> None:
+    class CustomType:
+        pass
+
+    @dataclass
+    class Foo:
+        foo: int
+
+    class FooFactory(DataclassFactory[Foo]): ...
+
+    provider_map = FooFactory._get_cached_provider_map()
+    version = FooFactory.provider_map_cache_info().version
+
+    BaseFactory.add_provider(CustomType, CustomType)
+    try:
+        assert CustomType in FooFactory._get_cached_provider_map()
+        assert FooFactory.provider_map_cache_info().version > version
+    finally:
+        BaseFactory._providers.pop(CustomType)
+        BaseFactory._invalidate_caches()
+
+    provider_map = FooFactory._get_cached_provider_map()
+    FooFactory._extra_providers = {CustomType: CustomType}
+    assert FooFactory._get_cached_provider_map() is not provider_map
+    assert CustomType in FooFactory._get_cached_provider_map()
+
+    provider_map = FooFactory._get_cached_provider_map()
+    FooFactory.seed_random(1)
+    assert FooFactory._get_cached_provider_map() is not provider_map
+
+
+def test_provider_map_cache_is_per_subclass() -> None:
+    @dataclass
+    class Foo:
+        foo: int
+
+    class FooFactory(DataclassFactory[Foo]): ...
+
+    class SubFooFactory(FooFactory):
+        @classmethod
+        def get_provider_map(cls) -> dict[Any, Callable[[], Any]]:
+            return {**super().get_provider_map(), int: lambda: 1}
+
+    assert FooFactory._get_cached_provider_map() is not SubFooFactory._get_cached_provider_map()
+    assert SubFooFactory.build().foo == 1
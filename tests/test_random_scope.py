@@ -0,0 +1,127 @@
+import asyncio
+from dataclasses import dataclass
+from random import Random
+
+from polyfactory.factories import DataclassFactory
+from polyfactory.factories.base import BaseFactory
+from polyfactory.utils.seeding import ContextRandom
+
+
+@dataclass
+class Child:
+    value: int
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+    child: Child
+
+
+def test_random_scope_is_reproducible() -> None:
+    class RecordFactory(DataclassFactory[Record]):
+        __random__ = Random()
+
+    with RecordFactory.random_scope(1):
+        first = RecordFactory.batch(5)
+
+    with RecordFactory.random_scope(1):
+        assert RecordFactory.batch(5) == first
+
+    with RecordFactory.random_scope(2):
+        assert RecordFactory.batch(5) != first
+
+
+def test_random_scope_does_not_affect_the_factory_stream() -> None:
+    class RecordFactory(DataclassFactory[Record]):
+        __random__ = Random()
+
+    RecordFactory.seed_random(1)
+    expected = RecordFactory.batch(4)
+
+    RecordFactory.seed_random(1)
+    result = RecordFactory.batch(2)
+    with RecordFactory.random_scope(5):
+        RecordFactory.batch(3)
+    result.extend(RecordFactory.batch(2))
+
+    assert result == expected
+
+
+def test_random_scope_restores_random_instances() -> None:
+    class RecordFactory(DataclassFactory[Record]):
+        __random__ = Random()
+
+    random = RecordFactory.__random__
+    RecordFactory.build()
+    build_plan = RecordFactory._get_build_plan()
+
+    with RecordFactory.random_scope(1):
+        RecordFactory.build()
+        assert isinstance(RecordFactory.__random__, ContextRandom)
+        # the shared Faker is not copied, its random instances are replaced in place
+        assert RecordFactory.__faker__ is BaseFactory.__faker__
+        assert isinstance(BaseFactory.__faker__.random, ContextRandom)
+
+        with RecordFactory.random_scope(2):
+            RecordFactory.build()
+
+        assert isinstance(RecordFactory.__random__, ContextRandom)
+
+    assert RecordFactory.__random__ is random
+    assert "__faker__" not in RecordFactory.__dict__
+    assert not isinstance(BaseFactory.__faker__.random, ContextRandom)
+    assert RecordFactory._get_build_plan() is build_plan
+
+
+def test_random_scope_covers_sub_factories() -> None:
+    class ChildFactory(DataclassFactory[Child]): ...
+
+    class RecordFactory(DataclassFactory[Record]):
+        __random__ = Random()
+        child = ChildFactory
+
+    with RecordFactory.random_scope(1):
+        first = RecordFactory.batch(5)
+
+    ChildFactory.batch(3)
+    with RecordFactory.random_scope(1):
+        assert RecordFactory.batch(5) == first
+
+    assert not isinstance(ChildFactory.__random__, ContextRandom)
+    assert not isinstance(BaseFactory.__faker__.random, ContextRandom)
+
+
+def test_random_scope_does_not_affect_the_shared_faker() -> None:
+    class RecordFactory(DataclassFactory[Record]):
+        __random__ = Random()
+
+    faker_random = BaseFactory.__faker__.random
+    state = faker_random.getstate()
+    with RecordFactory.random_scope(1):
+        RecordFactory.batch(5)
+        assert faker_random.getstate() == state
+
+    assert BaseFactory.__faker__.random is faker_random
+    assert faker_random.getstate() == state
+
+
+async def test_random_scope_per_task() -> None:
+    class RecordFactory(DataclassFactory[Record]):
+        __random__ = Random()
+
+    async def build(seed: int) -> list[Record]:
+        with RecordFactory.random_scope(seed):
+            records = []
+            for _ in range(5):
+                records.append(RecordFactory.build())
+                await asyncio.sleep(0)
+            return records
+
+    concurrent = await asyncio.gather(*(build(seed) for seed in range(4)))
+    sequential = [await build(seed) for seed in range(4)]
+
+    assert concurrent == sequential
+    assert len({tuple(record.name for record in records) for records in concurrent}) == 4
+    assert not isinstance(BaseFactory.__faker__.random, ContextRandom)
@@ -0,0 +1,183 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from random import Random
+from typing import Any, Callable, Optional
+
+import pytest
+
+from polyfactory import Use
+from polyfactory.exceptions import ConfigurationException, ParameterException
+from polyfactory.factories import DataclassFactory
+from polyfactory.snapshot_cache import SnapshotCache, describe
+
+
+@dataclass
+class Child:
+    value: int
+
+
+@dataclass
+class Record:
+    id: int
+    name: str
+    child: Child
+    children: list[Child]
+    optional_child: Optional[Child]
+
+
+def counting(function: Callable[[], Any], calls: list[int]) -> Callable[[], Any]:
+    def call() -> Any:
+        calls.append(1)
+        return function()
+
+    return call
+
+
+def test_cached_batch(tmp_path: Path) -> None:
+    cache = SnapshotCache(tmp_path)
+
+    class RecordFactory(DataclassFactory[Record]):
+        __random__ = Random()
+
+    first = RecordFactory.cached_batch(10, seed=1, cache=cache)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    with RecordFactory.random_scope(1):
+        assert RecordFactory.batch(10) == first
+
+    assert RecordFactory.cached_batch(10, seed=1, cache=cache) == first
+    assert RecordFactory.cached_batch(10, seed=1, cache=cache)[0] is not first[0]
+    assert len(list(tmp_path.iterdir())) == 1
+
+    assert RecordFactory.cached_batch(10, seed=2, cache=cache) != first
+    assert RecordFactory.cached_batch(5, seed=1, cache=cache) == first[:5]
+    assert RecordFactory.cached_batch(10, seed=1, cache=cache, name="name")[0].name == "name"
+    assert len(list(tmp_path.iterdir())) == 4
+
+
+def test_cached_batch_skips_generation(tmp_path: Path) -> None:
+    cache = SnapshotCache(tmp_path)
+    calls: list[int] = []
+
+    class RecordFactory(DataclassFactory[Record]):
+        __random_seed__ = 1
+
+        name = Use(counting(lambda: "name", calls))
+
+    RecordFactory.cached_batch(5, cache=cache)
+    assert len(calls) == 5
+
+    RecordFactory.cached_batch(5, cache=cache)
+    assert len(calls) == 5
+
+
+def test_cached_batch_fingerprint() -> None:
+    class RecordFactory(DataclassFactory[Record]): ...
+
+    fingerprint = RecordFactory._get_snapshot_fingerprint()
+    assert RecordFactory._get_snapshot_fingerprint() == fingerprint
+
+    class OtherRecordFactory(DataclassFactory[Record]):
+        name = Use(lambda: "name")
+
+    class ChangedRecordFactory(DataclassFactory[Record]):
+        name = Use(lambda: "other")
+
+    assert OtherRecordFactory._get_snapshot_fingerprint() != ChangedRecordFactory._get_snapshot_fingerprint()
+
+    RecordFactory.__min_collection_length__ = 3
+    RecordFactory.reset_field_cache()
+    assert RecordFactory._get_snapshot_fingerprint() != fingerprint
+
+    @dataclass
+    class ChangedChild:
+        value: str
+
+    @dataclass
+    class ChangedRecord:
+        id: int
+        name: str
+        child: ChangedChild
+        children: list[ChangedChild]
+        optional_child: Optional[ChangedChild]
+
+    ChangedRecord.__name__ = ChangedRecord.__qualname__ = Record.__qualname__
+    ChangedRecord.__module__ = Record.__module__
+
+    class NestedChangedFactory(DataclassFactory[ChangedRecord]): ...
+
+    NestedChangedFactory.__name__ = NestedChangedFactory.__qualname__ = RecordFactory.__qualname__
+    RecordFactory.__min_collection_length__ = 0
+    RecordFactory.reset_field_cache()
+    assert RecordFactory._get_snapshot_fingerprint() == fingerprint
+    assert NestedChangedFactory._get_snapshot_fingerprint() != fingerprint
+
+
+def test_cached_batch_requires_a_seed(tmp_path: Path) -> None:
+    class RecordFactory(DataclassFactory[Record]): ...
+
+    with pytest.raises(ParameterException):
+        RecordFactory.cached_batch(5, cache=SnapshotCache(tmp_path))
+
+
+def test_cached_batch_with_overridden_build(tmp_path: Path) -> None:
+    class RecordFactory(DataclassFactory[Record]):
+        @classmethod
+        def build(cls, *_: Any, **kwargs: Any) -> Record:
+            return super().build(**kwargs)
+
+    with pytest.raises(ConfigurationException):
+        RecordFactory.cached_batch(5, seed=1, cache=SnapshotCache(tmp_path))
+
+
+def test_cached_batch_unpicklable(tmp_path: Path) -> None:
+    class RecordFactory(DataclassFactory[Record]):
+        name = Use(lambda: lambda: None)
+
+    with pytest.warns(UserWarning, match="cannot be cached"):
+        assert len(RecordFactory.cached_batch(5, seed=1, cache=SnapshotCache(tmp_path))) == 5
+
+
+def test_snapshot_cache_eviction(tmp_path: Path) -> None:
+    cache = SnapshotCache(tmp_path, max_size=3_500)
+
+    for index in range(3):
+        cache.set(f"key{index}", b"x" * 1_000)
+        os.utime(tmp_path / f"key{index}.pickle", (index, index))
+
+    # loading a snapshot marks it as the most recently used
+    assert cache.get("key0") == b"x" * 1_000
+    cache.set("key3", b"x" * 1_000)
+
+    assert cache.get("key1") is None
+    assert cache.get("key0") is not None
+    assert cache.get("key2") is not None
+    assert cache.get("key3") is not None
+
+    cache.clear()
+    assert cache.get("key0") is None
+
+
+def test_snapshot_cache_corrupted_snapshot(tmp_path: Path) -> None:
+    cache = SnapshotCache(tmp_path)
+    (tmp_path / "key.pickle").write_bytes(b"corrupted")
+
+    assert cache.get("key") is None
+    assert not (tmp_path / "key.pickle").exists()
+
+
+def test_snapshot_cache_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("POLYFACTORY_CACHE_DIR", str(tmp_path))
+
+    assert SnapshotCache().directory == tmp_path
+
+
+def test_describe() -> None:
+    assert describe(lambda: 1) != describe(lambda: 2)
+    assert describe({"b": 1, "a": [1, 2]}) == describe({"a": [1, 2], "b": 1})
+    assert describe(object()) == describe(object())
+
+    cyclic: list[Any] = []
+    cyclic.append(cyclic)
+    assert describe(cyclic) == "list[...]"
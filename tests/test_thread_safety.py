@@ -0,0 +1,100 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, make_dataclass
+from threading import Barrier, Thread
+from typing import Any
+
+from polyfactory.factories import DataclassFactory
+from polyfactory.factories.base import BaseFactory
+from polyfactory.utils.seeding import ThreadLocalRandom
+
+
+@dataclass
+class Child:
+    value: int
+
+
+@dataclass
+class Parent:
+    name: str
+    child: Child
+    children: list[Child]
+
+
+def run_in_threads(target: Any, count: int) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    barrier = Barrier(count)
+
+    def run(name: str) -> None:
+        barrier.wait()
+        results[name] = target()
+
+    threads = [Thread(target=run, args=(f"worker-{index}",), name=f"worker-{index}") for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+def test_thread_local_random_streams() -> None:
+    random = ThreadLocalRandom(1)
+
+    first = run_in_threads(lambda: [random.random() for _ in range(5)], 4)
+    second = run_in_threads(lambda: [random.random() for _ in range(5)], 4)
+
+    assert first.keys() == second.keys()
+    assert len({tuple(values) for values in first.values()}) == 4
+
+    random = ThreadLocalRandom(1)
+    assert run_in_threads(lambda: [random.random() for _ in range(5)], 4) == first
+
+
+def test_thread_local_random_seed_affects_current_thread_only() -> None:
+    random = ThreadLocalRandom(1)
+    other = run_in_threads(random.random, 1)
+
+    random.seed(2)
+
+    random = ThreadLocalRandom(1)
+    assert run_in_threads(random.random, 1) == other
+
+
+def test_thread_local_random_factory() -> None:
+    class ParentFactory(DataclassFactory[Parent]):
+        __thread_local_random__ = True
+
+    faker_random = BaseFactory.__faker__.random
+    ParentFactory.seed_random(1)
+    first = run_in_threads(lambda: ParentFactory.batch(5), 4)
+
+    ParentFactory.seed_random(1)
+    second = run_in_threads(lambda: ParentFactory.batch(5), 4)
+
+    assert isinstance(ParentFactory.__random__, ThreadLocalRandom)
+    assert first == second
+    assert len({tuple(parent.name for parent in batch) for batch in first.values()}) == 4
+    assert ParentFactory.__faker__ is not BaseFactory.__faker__
+    assert BaseFactory.__faker__.random is faker_random
+
+
+def test_concurrent_builds_and_registrations() -> None:
+    class ParentFactory(DataclassFactory[Parent]): ...
+
+    def build() -> None:
+        for index in range(20):
+            assert len(ParentFactory.batch(5)) == 5
+            model = make_dataclass(f"Model{index}", [("value", int)])
+            assert DataclassFactory.create_factory(model).build()
+            BaseFactory.add_provider(model, lambda: None)
+
+    providers = BaseFactory._providers
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(build) for _ in range(8)]:
+                future.result()
+    finally:
+        BaseFactory._providers = providers
+        BaseFactory._invalidate_caches()
+
+    assert ParentFactory._get_or_create_factory(Child) is ParentFactory._get_or_create_factory(Child)
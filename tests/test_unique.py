@@ -0,0 +1,230 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Annotated, Literal, Optional
+
+import pytest
+from annotated_types import Ge, Le, MaxLen, MinLen
+
+from pydantic import BaseModel
+
+from polyfactory import PostGenerated, Use
+from polyfactory.exceptions import ConfigurationException, UniqueValuesExhaustedException
+from polyfactory.factories import DataclassFactory
+from polyfactory.factories.pydantic_factory import ModelFactory
+from polyfactory.field_meta import FieldMeta
+from polyfactory.utils.uniqueness import get_finite_domain
+
+
+class Plan(Enum):
+    FREE = "free"
+    PRO = "pro"
+    ENTERPRISE = "enterprise"
+
+
+@dataclass
+class Account:
+    tenant_id: Literal[1, 2, 3]
+    slug: Annotated[int, Ge(0), Le(9)]
+    code: Annotated[str, MinLen(1), MaxLen(1)]
+    plan: Plan
+    nickname: Optional[str] = None
+
+
+@pytest.mark.parametrize("columnar", (False, True))
+def test_unique_field(columnar: bool) -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        __unique__ = ["code"]
+        __columnar_batch__ = columnar
+
+    # single character strings are drawn from 16 hexadecimal digits
+    accounts = AccountFactory.batch(12)
+
+    assert len({account.code for account in accounts}) == 12
+
+
+@pytest.mark.parametrize("columnar", (False, True))
+def test_unique_composite_key(columnar: bool) -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        __unique__ = [("tenant_id", "slug")]
+        __columnar_batch__ = columnar
+
+    accounts = AccountFactory.batch(30)
+
+    assert len({(account.tenant_id, account.slug) for account in accounts}) == 30
+
+
+def test_unique_finite_domain_is_exhausted() -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        __unique__ = ["plan", ("tenant_id", "slug")]
+
+    assert {account.plan for account in AccountFactory.batch(3)} == set(Plan)
+
+    with pytest.raises(UniqueValuesExhaustedException, match="All the 3 values of plan were used for AccountFactory"):
+        AccountFactory.batch(4)
+
+
+def test_unique_composite_key_with_fixed_values() -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        __unique__ = [("tenant_id", "slug")]
+
+    accounts = AccountFactory.batch(10, tenant_id=2)
+    assert sorted(account.slug for account in accounts) == list(range(10))
+
+    with pytest.raises(
+        UniqueValuesExhaustedException, match="All the 10 values of slug were used for AccountFactory with tenant_id=2"
+    ):
+        AccountFactory.batch(11, tenant_id=2)
+
+
+def test_unique_composite_key_with_fixed_infinite_values() -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        __unique__ = [("nickname", "slug")]
+
+    # the slugs are drawn from a pool although the domain of the nicknames is not finite
+    for seed in range(10):
+        AccountFactory.seed_random(seed)
+        accounts = AccountFactory.batch(10, nickname="same")
+        assert sorted(account.slug for account in accounts) == list(range(10))
+
+    with pytest.raises(
+        UniqueValuesExhaustedException,
+        match="All the 10 values of slug were used for AccountFactory with nickname='same'",
+    ):
+        AccountFactory.batch(11, nickname="same")
+
+
+def test_unique_composite_key_pool_is_not_exhausted_by_other_collisions() -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        # resolving a collision of (slug, plan) changes the slug drawn for (tenant_id, slug)
+        __unique__ = [("tenant_id", "slug"), ("slug", "plan")]
+
+    for seed in range(10):
+        AccountFactory.seed_random(seed)
+        accounts = AccountFactory.batch(30)
+        assert len({(account.tenant_id, account.slug) for account in accounts}) == 30
+        assert len({(account.slug, account.plan) for account in accounts}) == 30
+
+
+def test_unique_values_set_by_kwargs() -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        __unique__ = ["code"]
+
+    with pytest.raises(UniqueValuesExhaustedException, match="The values of code set by kwargs were already used"):
+        AccountFactory.batch(2, code="a")
+
+
+def test_unique_retries() -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        __unique__ = ["nickname"]
+        __unique_retries__ = 5
+        nickname = Use(lambda: "same")
+
+    with pytest.raises(UniqueValuesExhaustedException, match="after 5 attempts, 1 values were used"):
+        AccountFactory.batch(2)
+
+
+def test_unique_none_values_are_not_checked() -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        __unique__ = ["nickname"]
+        nickname = None
+
+    assert [account.nickname for account in AccountFactory.batch(3)] == [None] * 3
+
+
+def test_unique_post_generated_field() -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        __unique__ = ["nickname"]
+        nickname = PostGenerated(lambda _, values: f"{values['tenant_id']}-{values['slug']}")
+
+    # the values of post generated fields are drawn again by regenerating the whole model
+    accounts = AccountFactory.batch(20)
+
+    assert len({account.nickname for account in accounts}) == 20
+    assert all(account.nickname == f"{account.tenant_id}-{account.slug}" for account in accounts)
+
+
+def test_unique_across_stream_and_chunks() -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        __unique__ = [("tenant_id", "slug")]
+
+    stream = AccountFactory.stream()
+    assert len({(account.tenant_id, account.slug) for account in (next(stream) for _ in range(30))}) == 30
+
+    chunks = list(AccountFactory.iter_batches(30, 7))
+    assert len({(account.tenant_id, account.slug) for chunk in chunks for account in chunk}) == 30
+
+
+def test_unique_scope() -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        __unique__ = ["plan"]
+
+    # outside of a unique scope, builds are independent
+    assert len({AccountFactory.build().plan for _ in range(10)}) <= 3
+
+    with AccountFactory.unique_scope():
+        plans = {AccountFactory.build().plan, *(account.plan for account in AccountFactory.batch(1))}
+        with AccountFactory.unique_scope():
+            plans.add(AccountFactory.build().plan)
+
+        assert plans == set(Plan)
+        with pytest.raises(UniqueValuesExhaustedException):
+            AccountFactory.build()
+
+
+def test_unique_is_reproducible() -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        __unique__ = ["code", ("tenant_id", "slug")]
+
+    with AccountFactory.random_scope(1):
+        first = AccountFactory.batch(12)
+
+    with AccountFactory.random_scope(1):
+        assert AccountFactory.batch(12) == first
+
+
+def test_unique_dicts() -> None:
+    class AccountFactory(DataclassFactory[Account]):
+        __unique__ = ["code"]
+
+    assert len({values["code"] for values in AccountFactory.batch_dicts(12)}) == 12
+
+
+def test_unique_pydantic() -> None:
+    class User(BaseModel):
+        email: Annotated[str, MaxLen(1)]
+        age: Annotated[int, Ge(18), Le(20)]
+
+    class UserFactory(ModelFactory[User]):
+        __unique__ = ["email", "age"]
+
+    users = UserFactory.batch(3)
+
+    assert len({user.email for user in users}) == 3
+    assert {user.age for user in users} == {18, 19, 20}
+
+
+def test_unique_unknown_field() -> None:
+    with pytest.raises(ConfigurationException, match="email is declared as unique on the factory AccountFactory"):
+
+        class AccountFactory(DataclassFactory[Account]):
+            __unique__ = ["code", ("tenant_id", "email")]
+
+
+@pytest.mark.parametrize(
+    "annotation, constraints, expected",
+    (
+        (Literal["a", "b"], None, ("a", "b")),
+        (Plan, None, tuple(Plan)),
+        (bool, None, (False, True)),
+        (int, {"ge": 1, "lt": 4}, range(1, 4)),
+        (int, {"gt": 0.5, "le": 10}, range(1, 11)),
+        (int, {"ge": 1, "le": 20, "multiple_of": 5}, range(5, 21, 5)),
+        (int, {"ge": 1}, None),
+        (int, None, None),
+        (str, {"max_length": 1}, None),
+    ),
+)
+def test_get_finite_domain(annotation: type, constraints: dict, expected: Optional[tuple]) -> None:
+    field_meta = FieldMeta.from_type(annotation, name="field", constraints=constraints)  # type: ignore[arg-type]
+
+    assert get_finite_domain(field_meta, annotation) == expected